@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ArchievementsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'archievements'
+
+    def ready(self):
+        from . import evaluators  # noqa: F401
@@ -0,0 +1,17 @@
+from core.events import CounterChanged, subscribe
+from core.services.counter_services import grant_reached
+from notifications.models import Notification
+from notifications.services.notification_services import notify
+
+from .models import Achievement, UserAchievement
+
+
+@subscribe(CounterChanged)
+def unlock_achievements(changes):
+    """
+    바뀐 카운터 키에 걸린 업적만 조회해, 목표에 도달했지만 아직 없는 것을 부여하고
+    실제로 새로 부여된 업적마다 알림을 만듭니다.
+    """
+    rules = Achievement.objects.filter(counter_key__in={change.key for change in changes})
+    for user_id, achievement in grant_reached(changes, rules, UserAchievement, "achievement"):
+        notify(user_id, Notification.ACHIEVEMENT, f"Achievement unlocked: {achievement.name}")
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+ACHIEVEMENTS = [
+    ("First Step", "Complete your first Todo", "todos_completed", 1, 10),
+    ("Getting Things Done", "Complete 100 Todos", "todos_completed", 100, 100),
+    ("Daily Streak", "Complete a Todo every day for 7 days", "streak_best", 7, 100),
+    ("Unbroken", "Complete a Todo every day for 30 days", "streak_best", 30, 500),
+    ("Focused", "Start 10 timers", "timers_started", 10, 50),
+    ("First Blood", "Defeat your first monster", "monsters_defeated", 1, 50),
+]
+
+
+def seed(apps, schema_editor):
+    Achievement = apps.get_model('archievements', 'Achievement')
+    Achievement.objects.bulk_create([
+        Achievement(name=name, description=description, counter_key=key, target=target, reward_gold=gold)
+        for name, description, key, target, gold in ACHIEVEMENTS
+    ])
+
+
+def unseed(apps, schema_editor):
+    Achievement = apps.get_model('archievements', 'Achievement')
+    Achievement.objects.filter(name__in=[row[0] for row in ACHIEVEMENTS]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archievements', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -1,3 +1,34 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from core.services.counter_services import COUNTER_KEYS
+
+COUNTER_CHOICES = [(key, key) for key in COUNTER_KEYS]
+
+class Achievement(models.Model):
+    """Unlocked once the user's `counter_key` counter reaches `target`."""
+    name = models.CharField(max_length=100)
+    description = models.CharField(max_length=255, blank=True)
+    counter_key = models.CharField(max_length=50, choices=COUNTER_CHOICES)
+    target = models.PositiveIntegerField()
+    reward_gold = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.name
+
+class UserAchievement(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="achievements", db_index=False,
+    )
+    achievement = models.ForeignKey(Achievement, on_delete=models.CASCADE, related_name="unlocks")
+    achieved_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "achievement"], name="user_achievement_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.achievement_id}"
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+# Serializer for an achievement with the user's progress
+class AchievementSerializer(serializers.Serializer):
+    achievement_id = serializers.IntegerField()
+    name = serializers.CharField()
+    description = serializers.CharField()
+    target = serializers.IntegerField()
+    progress = serializers.IntegerField()
+    achieved_at = serializers.DateTimeField(allow_null=True)
+    claimed = serializers.BooleanField()
+
+# Serializer for the claim response
+class AchievementClaimResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    reward_info = serializers.CharField()
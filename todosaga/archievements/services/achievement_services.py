@@ -0,0 +1,55 @@
+from typing import Dict, List
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.exceptions import NotFound, ServiceError
+from core.services.counter_services import get_counters
+from items.services.item_services import credit_gold
+
+from ..models import Achievement, UserAchievement
+
+
+def list_achievements(user) -> List[Dict]:
+    """
+    업적 목록과 사용자의 진행도를 반환합니다. 진행도는 이벤트 처리 중에 이미 계산된
+    카운터를 읽기만 하므로 규칙 수와 관계없이 쿼리는 3개입니다.
+    """
+    counters = get_counters(user.id)
+    unlocks = {
+        unlock.achievement_id: unlock
+        for unlock in UserAchievement.objects.filter(user=user)
+    }
+    result = []
+    for achievement in Achievement.objects.order_by("id"):
+        unlock = unlocks.get(achievement.id)
+        result.append({
+            "achievement_id": achievement.id,
+            "name": achievement.name,
+            "description": achievement.description,
+            "target": achievement.target,
+            "progress": min(counters.get(achievement.counter_key, 0), achievement.target),
+            "achieved_at": unlock.achieved_at if unlock else None,
+            "claimed": bool(unlock and unlock.claimed_at),
+        })
+    return result
+
+
+def claim_achievement(user, achievement_id: int) -> Achievement:
+    """
+    달성한 업적의 보상을 조건부 UPDATE 한 번으로 수령 처리하고, 같은 트랜잭션에서 골드를 지급합니다.
+    동시에 여러 번 요청해도 한 번만 지급됩니다.
+    """
+    achievement = Achievement.objects.filter(id=achievement_id).first()
+    if achievement is None:
+        raise NotFound("Achievement not found.")
+    with transaction.atomic():
+        updated = UserAchievement.objects.filter(
+            user=user, achievement_id=achievement_id, claimed_at__isnull=True
+        ).update(claimed_at=timezone.now())
+        if updated:
+            credit_gold(user.id, achievement.reward_gold)
+            return achievement
+    if UserAchievement.objects.filter(user=user, achievement_id=achievement_id).exists():
+        raise ServiceError("Reward already claimed.")
+    raise ServiceError("Achievement not unlocked yet.")
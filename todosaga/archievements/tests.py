@@ -1,3 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from core.events import MonsterDefeated, bus
+from core.services.counter_services import MONSTERS_DEFEATED
+from notifications.models import Notification
+from notifications.services.notification_services import buffered_notifications
+
+from .models import Achievement, UserAchievement
+
+User = get_user_model()
+
+
+class UnlockAchievementTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("hunter")
+        # Only the rules below, not the seeded ones
+        Achievement.objects.all().delete()
+        self.achievement = Achievement.objects.create(name="Hunter", counter_key=MONSTERS_DEFEATED, target=2)
+        Achievement.objects.create(name="Slayer", counter_key=MONSTERS_DEFEATED, target=5)
+
+    def defeat(self, times=1):
+        # Notifications are buffered per dispatch; run their commit callbacks inside the buffer
+        with buffered_notifications(), self.captureOnCommitCallbacks(execute=True):
+            with self.assertNoLogs("core.events", "ERROR"):
+                bus.dispatch([MonsterDefeated(self.user.id, 0, timezone.now()) for _ in range(times)])
+
+    def test_unlocks_once_when_the_target_is_reached(self):
+        self.defeat()
+        self.assertFalse(UserAchievement.objects.exists())
+        self.defeat()
+        self.defeat()
+        self.assertQuerySetEqual(
+            UserAchievement.objects.filter(user=self.user).values_list("achievement__name", flat=True), ["Hunter"]
+        )
+        self.assertEqual(
+            list(Notification.objects.filter(user=self.user).values_list("message", flat=True)),
+            ["Achievement unlocked: Hunter"],
+        )
+
+    def test_batch_crossing_several_targets(self):
+        self.defeat(times=5)
+        self.assertEqual(
+            set(UserAchievement.objects.filter(user=self.user).values_list("achievement__name", flat=True)),
+            {"Hunter", "Slayer"},
+        )
+
+    def test_unlocked_concurrently_notifies_once(self):
+        self.defeat()
+        raced = []
+
+        def other_process_unlocks(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            # Another worker inserts the row after this one found it missing
+            if sql.startswith("SELECT") and "archievements_userachievement" in sql and not raced:
+                raced.append(UserAchievement.objects.create(user=self.user, achievement=self.achievement))
+            return result
+
+        with connection.execute_wrapper(other_process_unlocks):
+            self.defeat()
+        self.assertEqual(UserAchievement.objects.filter(user=self.user).count(), 1)
+        self.assertFalse(Notification.objects.filter(user=self.user).exists())
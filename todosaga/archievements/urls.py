@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import AchievementClaimView, AchievementListView
+
+urlpatterns = [
+    path('', AchievementListView.as_view(), name='achievement-list'),
+    path('<int:id>/claim', AchievementClaimView.as_view(), name='achievement-claim'),
+]
@@ -1,3 +1,38 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from django.http import Http404
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import NotFound, ServiceError
+from .serializers import AchievementClaimResponseSerializer, AchievementSerializer
+from .services.achievement_services import claim_achievement, list_achievements
 
-# Create your views here.
+class AchievementListView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: AchievementSerializer(many=True)}
+    )
+    def get(self, request):
+        return Response(list_achievements(request.user), status=status.HTTP_200_OK)
+
+
+class AchievementClaimView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: AchievementClaimResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request, id):
+        try:
+            achievement = claim_achievement(request.user, id)
+        except NotFound:
+            raise Http404
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = {
+            "message": "Reward claimed",
+            "reward_info": f"You received {achievement.reward_gold} gold",
+        }
+        return Response(result, status=status.HTTP_200_OK)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from . import evaluators, push  # noqa: F401
+        from .instrumentation import install_query_timer
+
+        connection_created.connect(install_query_timer)
@@ -0,0 +1,51 @@
+"""Turns domain events into progress counter updates and re-dispatches the changes."""
+from stats.services.activity_services import get_latest_streaks
+
+from .events import MonsterDefeated, TimerStarted, TodoCompleted, bus, subscribe
+from .services.counter_services import (
+    MONSTERS_DEFEATED,
+    STREAK_BEST,
+    STREAK_CURRENT,
+    TIMERS_STARTED,
+    TODOS_COMPLETED,
+    counters_for_update,
+)
+
+
+def _count(events, key):
+    with counters_for_update((event.user_id, key) for event in events) as counters:
+        for event in events:
+            counters.add(event.user_id, key, 1)
+    bus.dispatch(counters.changed())
+
+
+@subscribe(TodoCompleted)
+def count_completions(events):
+    """
+    완료 수를 더하고 연속 완료 일수(현재/최고)를 갱신합니다. 연속 일수는 완료 트랜잭션에서 이미 갱신된
+    일별 활동 비트맵에서 다시 세므로, 늦게 도착하거나 순서가 바뀐 이벤트가 값을 되돌리지 않습니다.
+    """
+    user_ids = {event.user_id for event in events}
+    keys = [
+        (user_id, key)
+        for user_id in user_ids
+        for key in (TODOS_COMPLETED, STREAK_CURRENT, STREAK_BEST)
+    ]
+    with counters_for_update(keys) as counters:
+        for event in events:
+            counters.add(event.user_id, TODOS_COMPLETED, 1)
+        # Read under the counter locks, so a handler that saw fewer days cannot write after this one
+        for user_id, streak in get_latest_streaks(user_ids).items():
+            counters.set(user_id, STREAK_CURRENT, streak)
+            counters.raise_to(user_id, STREAK_BEST, streak)
+    bus.dispatch(counters.changed())
+
+
+@subscribe(TimerStarted)
+def count_timers(events):
+    _count(events, TIMERS_STARTED)
+
+
+@subscribe(MonsterDefeated)
+def count_monster_kills(events):
+    _count(events, MONSTERS_DEFEATED)
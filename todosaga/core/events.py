@@ -0,0 +1,142 @@
+"""
+In-process domain event bus.
+
+Services publish events after their transaction commits; a daemon worker
+drains the queue in batches and hands each subscriber the list of events of
+the type it subscribed to, so rule evaluation cost follows the number of
+events rather than users x rules. The queue lives in memory: events still
+queued when the process exits are lost.
+"""
+import logging
+import queue
+import threading
+from collections import defaultdict
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Type
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TodoCompleted:
+    user_id: int
+    todo_id: int
+    completed_at: datetime
+    gained_exp: int
+
+
+@dataclass(frozen=True)
+class TimerStarted:
+    user_id: int
+    todo_id: int
+    started_at: datetime
+
+
+@dataclass(frozen=True)
+class MonsterDefeated:
+    user_id: int
+    monster_id: int
+    defeated_at: datetime
+
+
+@dataclass(frozen=True)
+class CounterChanged:
+    """Derived event: a user's progress counter moved to `value`."""
+    user_id: int
+    key: str
+    value: int
+
+
+class EventBus:
+    def __init__(self):
+        self._handlers: Dict[Type, List[Callable]] = defaultdict(list)
+        self._batch_contexts: List[Callable] = []
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def subscribe(self, event_type: Type):
+        """이벤트 타입별 핸들러를 등록하는 데코레이터입니다. 핸들러는 같은 타입 이벤트의 리스트를 받습니다."""
+        def decorator(handler):
+            self._handlers[event_type].append(handler)
+            return handler
+        return decorator
+
+    def wrap_batches(self, context_factory: Callable):
+        """dispatch 한 번 전체를 감쌀 컨텍스트 매니저 팩토리를 등록합니다 (예: 알림 버퍼)."""
+        self._batch_contexts.append(context_factory)
+
+    def dispatch(self, events):
+        """
+        이벤트들을 타입별로 묶어 등록 순서대로 핸들러에 전달합니다.
+        한 핸들러의 실패는 기록만 하고 다른 핸들러는 계속 실행합니다.
+        """
+        by_type = defaultdict(list)
+        for event in events:
+            by_type[type(event)].append(event)
+        with ExitStack() as stack:
+            for context_factory in self._batch_contexts:
+                stack.enter_context(context_factory())
+            for event_type, batch in by_type.items():
+                for handler in self._handlers.get(event_type, []):
+                    try:
+                        handler(batch)
+                    except Exception:
+                        logger.exception("Event handler %s failed on %d events", handler.__qualname__, len(batch))
+
+    def publish(self, *events):
+        """
+        현재 트랜잭션이 커밋된 뒤 이벤트를 발행합니다. CORE_EVENT_BUS_ASYNC가 꺼져 있으면
+        커밋 직후 같은 스레드에서 바로 처리합니다.
+        """
+        if not events:
+            return
+        if settings.CORE_EVENT_BUS_ASYNC:
+            transaction.on_commit(lambda: self._enqueue(events))
+        else:
+            transaction.on_commit(lambda: self.dispatch(events))
+
+    def join(self):
+        """큐에 들어간 이벤트가 모두 처리될 때까지 기다립니다."""
+        self._queue.join()
+
+    def _enqueue(self, events):
+        self._ensure_worker()
+        for event in events:
+            self._queue.put(event)
+
+    def _drain(self, first) -> list:
+        batch = [first]
+        while len(batch) < settings.CORE_EVENT_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get(timeout=settings.CORE_EVENT_BATCH_LINGER))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._drain(self._queue.get())
+            try:
+                self.dispatch(batch)
+            finally:
+                close_old_connections()
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            with self._worker_lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="event-bus", daemon=True)
+                    self._worker.start()
+
+
+bus = EventBus()
+subscribe = bus.subscribe
+publish = bus.publish
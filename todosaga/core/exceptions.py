@@ -0,0 +1,11 @@
+class ServiceError(Exception):
+    """서비스 규칙 위반입니다. detail은 API 응답 메시지로 그대로 사용합니다."""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class NotFound(ServiceError):
+    def __init__(self, detail: str = "Not found."):
+        super().__init__(detail)
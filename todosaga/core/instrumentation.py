@@ -0,0 +1,52 @@
+"""
+Per-request timing: database queries and LLM calls made while a request is
+being handled are added to the RequestStats in a ContextVar. The ContextVar
+follows the request into sync_to_async threads and LLM callbacks, so one
+query wrapper installed on every connection covers sync and async views alike.
+"""
+import heapq
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# Slowest queries kept per request for the slow-request log
+SLOW_QUERY_SAMPLES = 5
+
+current_stats: ContextVar[Optional["RequestStats"]] = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class RequestStats:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    llm_calls: int = 0
+    llm_seconds: float = 0.0
+    # Min-heap of (seconds, sql) holding the slowest queries
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def add_query(self, seconds: float, sql: str):
+        self.db_queries += 1
+        self.db_seconds += seconds
+        if len(self.slowest) < SLOW_QUERY_SAMPLES:
+            heapq.heappush(self.slowest, (seconds, sql))
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, sql))
+
+
+def time_query(execute, sql, params, many, context):
+    """connection.execute_wrappers에 들어가는 래퍼입니다. 요청 처리 중이 아니면 그대로 실행만 합니다."""
+    stats = current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add_query(time.perf_counter() - started, sql)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """connection_created 시그널 핸들러: 새 연결마다 time_query를 한 번만 등록합니다."""
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
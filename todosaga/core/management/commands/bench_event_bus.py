@@ -0,0 +1,61 @@
+import random
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.events import MonsterDefeated, TimerStarted, TodoCompleted, bus
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure event-bus throughput: dispatch synthetic events through the real subscribers "
+        "in worker-sized batches. Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=50_000)
+        parser.add_argument("--users", type=int, default=2_000)
+        parser.add_argument("--batch-size", type=int, default=settings.CORE_EVENT_BATCH_SIZE)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        User = get_user_model()
+        now = timezone.now()
+
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(username=f"bench-event-{i}") for i in range(options["users"])
+            ])
+            if users[0].pk is None:
+                users = list(User.objects.filter(username__startswith="bench-event-"))
+            user_ids = [user.pk for user in users]
+
+            events = []
+            for i in range(options["events"]):
+                user_id = rng.choice(user_ids)
+                roll = rng.random()
+                if roll < 0.8:
+                    at = now - timedelta(days=rng.randrange(30))
+                    events.append(TodoCompleted(user_id, i, at, settings.STATS_COMPLETION_EXP))
+                elif roll < 0.95:
+                    events.append(TimerStarted(user_id, i, now))
+                else:
+                    events.append(MonsterDefeated(user_id, i, now))
+
+            batch_size = options["batch_size"]
+            started = time.perf_counter()
+            for start in range(0, len(events), batch_size):
+                bus.dispatch(events[start:start + batch_size])
+            elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{len(events)} events / {len(user_ids)} users in batches of {batch_size}: "
+            f"{elapsed:.2f}s ({len(events) / elapsed:,.0f} events/s)"
+        )
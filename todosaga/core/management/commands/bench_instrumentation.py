@@ -0,0 +1,120 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from core.instrumentation import RequestStats, current_stats, time_query
+from core.middleware import InstrumentationMiddleware
+from todos.models import Todo
+
+
+def _passthrough(self, request):
+    return self.get_response(request)
+
+
+def _per_call_us(func, n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the overhead of request instrumentation. Reports the cost of the middleware and "
+        "of the query timer per query, priced against the request's own time and query count, and "
+        "an end-to-end comparison with both switched on and off in alternating rounds. "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/todos/todos")
+        parser.add_argument("--requests", type=int, default=100, help="Requests per round.")
+        parser.add_argument("--rounds", type=int, default=60)
+        parser.add_argument("--todos", type=int, default=50)
+
+    def handle(self, *args, **options):
+        # Separate Client instances differ by several percent on their own (A/A), so one
+        # client is reused and the instrumentation is toggled underneath it.
+        instrumented_call = InstrumentationMiddleware.__call__
+        wrappers = None
+        timings = {False: [], True: []}
+        with transaction.atomic(), override_settings(ALLOWED_HOSTS=["*"], DEBUG=False):
+            user = get_user_model().objects.create(username="bench-instrumentation")
+            Todo.objects.bulk_create([
+                Todo(user=user, title=f"todo {i}", type=Todo.CHECK) for i in range(options["todos"])
+            ])
+            client = Client()
+            client.force_login(user)
+            client.get(options["path"])
+            connection.ensure_connection()
+            wrappers = connection.execute_wrappers
+            try:
+                for round_number in range(options["rounds"]):
+                    # Alternate which configuration goes first so warm-up and drift cancel out
+                    order = (False, True) if round_number % 2 else (True, False)
+                    for enabled in order:
+                        InstrumentationMiddleware.__call__ = instrumented_call if enabled else _passthrough
+                        if enabled and time_query not in wrappers:
+                            wrappers.append(time_query)
+                        elif not enabled and time_query in wrappers:
+                            wrappers.remove(time_query)
+                        started = time.perf_counter()
+                        for _ in range(options["requests"]):
+                            client.get(options["path"])
+                        timings[enabled].append((time.perf_counter() - started) / options["requests"])
+            finally:
+                InstrumentationMiddleware.__call__ = instrumented_call
+                if time_query not in wrappers:
+                    wrappers.append(time_query)
+            with CaptureQueriesContext(connection) as queries:
+                client.get(options["path"])
+            query_count = len(queries)
+            middleware_us, query_us = self._component_costs(options["path"])
+            transaction.set_rollback(True)
+
+        plain_ms = statistics.median(timings[False]) * 1000
+        # Differences of adjacent rounds cancel slow drift in machine speed
+        overhead_ms = statistics.median(
+            (on - off) for on, off in zip(timings[True], timings[False])
+        ) * 1000
+        estimated_us = middleware_us + query_us * query_count
+        self.stdout.write(
+            f"{options['path']}: {plain_ms:.3f} ms/request, {query_count} queries without instrumentation"
+        )
+        self.stdout.write(
+            f"  components: middleware {middleware_us:.1f} us + {query_count} x {query_us:.1f} us query timer "
+            f"= {estimated_us:.1f} us/request ({estimated_us / 1000 / plain_ms * 100:.2f}%)"
+        )
+        self.stdout.write(
+            f"  end to end: median paired difference {overhead_ms * 1000:+.1f} us/request "
+            f"({overhead_ms / plain_ms * 100:+.2f}%; includes machine noise)"
+        )
+
+    def _component_costs(self, path: str, n: int = 50_000):
+        """Per-request middleware cost around a stub view, and the added cost of timing one query."""
+        request = RequestFactory().get(path)
+        request.resolver_match = resolve(path)
+        response = HttpResponse()
+        middleware = InstrumentationMiddleware(lambda request: response)
+        middleware_us = _per_call_us(lambda: middleware(request), n) - _per_call_us(lambda: response, n)
+
+        wrappers = connection.execute_wrappers
+        with connection.cursor() as cursor:
+            token = current_stats.set(RequestStats())
+            try:
+                wrappers.remove(time_query)
+                plain_us = _per_call_us(lambda: cursor.execute("SELECT 1"), n)
+                wrappers.append(time_query)
+                timed_us = _per_call_us(lambda: cursor.execute("SELECT 1"), n)
+            finally:
+                current_stats.reset(token)
+                if time_query not in wrappers:
+                    wrappers.append(time_query)
+        return middleware_us, max(timed_us - plain_us, 0.0)
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import math
+import secrets
+import time
+from collections import Counter, deque
+from typing import Dict, List
+
+import httpx
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from core.management.sessions import login_session
+from todos.models import Todo
+
+USERNAME_PREFIX = "loadtest-"
+SCENARIOS = ("list", "create", "complete", "suggestions")
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+class LoadUser:
+    """One logged-in test user: request headers plus the todos left for the complete scenario."""
+
+    def __init__(self, user, todo_ids: List[int]):
+        csrf_token = secrets.token_hex(16)
+        header = settings.CSRF_HEADER_NAME.removeprefix("HTTP_").replace("_", "-")
+        self.headers = {
+            "Cookie": f"{settings.SESSION_COOKIE_NAME}={login_session(user)}; "
+                      f"{settings.CSRF_COOKIE_NAME}={csrf_token}",
+            header: csrf_token,
+        }
+        self.pending = deque(todo_ids)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test a running server (e.g. the compose stack with docker-compose.loadtest.yml) with the "
+        "list, create, complete and suggestions endpoints, reporting req/s and latency percentiles per "
+        "scenario. Test users and their todos are created directly in the database the server uses, "
+        "and deleted afterwards. Run it from a different machine or container than the server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000")
+        parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+        parser.add_argument("--requests", type=int, default=2000, help="Measured requests per scenario.")
+        parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests per scenario.")
+        parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight.")
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--seed-todos", type=int, default=50, help="Todos per user before the run.")
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument("--json", default=None, help="Also write the results to this file.")
+        parser.add_argument("--keep-data", action="store_true")
+
+    def handle(self, *args, **options):
+        scenarios = [name.strip() for name in options["scenarios"].split(",") if name.strip()]
+        unknown = set(scenarios) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        users = self._create_users(options, "complete" in scenarios)
+        try:
+            results = asyncio.run(self._run(scenarios, users, options))
+        finally:
+            if not options["keep_data"]:
+                self._delete_users()
+
+        self.stdout.write(
+            f"{options['url']}: {options['concurrency']} in flight, {options['users']} users, "
+            f"{options['requests']} requests per scenario"
+        )
+        for result in results:
+            errors = ", ".join(f"{kind} x{count}" for kind, count in sorted(result["errors"].items()))
+            self.stdout.write(
+                f"  {result['scenario']:<12} {result['rps']:8.1f} req/s   p50 {result['p50_ms']:7.1f} ms   "
+                f"p99 {result['p99_ms']:7.1f} ms   max {result['max_ms']:7.1f} ms"
+                + (f"   errors: {errors}" if errors else "")
+            )
+        if options["json"]:
+            with open(options["json"], "w") as f:
+                json.dump(results, f, indent=2)
+
+    def _delete_users(self, attempts: int = 5):
+        # The server's event worker keeps writing (EXP, titles) for the test users for a
+        # moment after the last response, which can race the cascade delete
+        for attempt in range(attempts):
+            try:
+                get_user_model().objects.filter(username__startswith=USERNAME_PREFIX).delete()
+                return
+            except IntegrityError:
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(1)
+
+    def _create_users(self, options, with_complete_targets: bool) -> List[LoadUser]:
+        User = get_user_model()
+        self._delete_users()
+        per_user = math.ceil((options["requests"] + options["warmup"]) / options["users"])
+        users = []
+        for n in range(options["users"]):
+            user = User.objects.create_user(username=f"{USERNAME_PREFIX}{n}")
+            Todo.objects.bulk_create([
+                Todo(user=user, title=f"loadtest todo {i}", type=Todo.CHECK)
+                for i in range(options["seed_todos"])
+            ])
+            targets = Todo.objects.bulk_create([
+                Todo(user=user, title=f"loadtest target {i}", type=Todo.CHECK)
+                for i in range(per_user if with_complete_targets else 0)
+            ])
+            users.append(LoadUser(user, [todo.id for todo in targets]))
+        return users
+
+    async def _run(self, scenarios, users: List[LoadUser], options) -> List[Dict]:
+        limits = httpx.Limits(max_connections=options["concurrency"],
+                              max_keepalive_connections=options["concurrency"])
+        async with httpx.AsyncClient(base_url=options["url"], timeout=options["timeout"], limits=limits) as client:
+            results = []
+            for scenario in scenarios:
+                await self._phase(client, scenario, users, options["warmup"], options["concurrency"])
+                latencies, errors, elapsed = await self._phase(
+                    client, scenario, users, options["requests"], options["concurrency"]
+                )
+                latencies.sort()
+                results.append({
+                    "scenario": scenario,
+                    "requests": options["requests"],
+                    "rps": len(latencies) / elapsed if elapsed else 0.0,
+                    "p50_ms": _percentile(latencies, 50) * 1000,
+                    "p99_ms": _percentile(latencies, 99) * 1000,
+                    "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+                    "errors": dict(errors),
+                })
+            return results
+
+    async def _phase(self, client: httpx.AsyncClient, scenario: str, users: List[LoadUser],
+                     count: int, concurrency: int):
+        """Sends count requests, concurrency at a time. Returns (successful latencies, errors by kind, seconds)."""
+        latencies: List[float] = []
+        errors: Counter = Counter()
+        issued = iter(range(count))
+
+        def build(n: int) -> httpx.Request:
+            user = users[n % len(users)]
+            if scenario == "list":
+                return client.build_request("GET", "/todos/todos", headers=user.headers)
+            if scenario == "create":
+                return client.build_request("POST", "/todos/todos", headers=user.headers,
+                                            json={"title": f"loadtest created {n}", "type": Todo.CHECK})
+            if scenario == "complete":
+                return client.build_request("POST", f"/todos/todos/{user.pending.popleft()}/complete",
+                                            headers=user.headers)
+            return client.build_request("GET", "/todos/todos/suggestions", headers=user.headers)
+
+        async def worker():
+            for n in issued:
+                request = build(n)
+                started = time.perf_counter()
+                try:
+                    response = await client.send(request)
+                except httpx.HTTPError as e:
+                    errors[type(e).__name__] += 1
+                    continue
+                if response.is_success:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors[f"HTTP {response.status_code}"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return latencies, errors, time.perf_counter() - started
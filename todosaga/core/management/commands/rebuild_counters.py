@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.services.rebuild_services import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild progress counters from Todo rows and activity bitmaps, then re-run rule evaluation."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Users rebuilt per transaction.")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_counters(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {rebuilt} users"))
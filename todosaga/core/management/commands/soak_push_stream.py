@@ -0,0 +1,98 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from core.management.sessions import login_session
+
+USERNAME = "soak-push"
+
+
+def _session_cookie() -> str:
+    """Creates a logged-in session for the soak user and returns its cookie value."""
+    user, _ = get_user_model().objects.get_or_create(username=USERNAME)
+    return f"{settings.SESSION_COOKIE_NAME}={login_session(user)}"
+
+
+def _rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class Command(BaseCommand):
+    help = (
+        "Open many idle server-sent-event connections to a running ASGI server and hold them, "
+        "reporting how many stay open (and the server's memory with --server-pid)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000/push/stream")
+        parser.add_argument("--connections", type=int, default=10_000)
+        parser.add_argument("--hold", type=float, default=60, help="Seconds to hold the connections.")
+        parser.add_argument("--parallel", type=int, default=200, help="Connection attempts in flight.")
+        parser.add_argument("--server-pid", type=int, default=None)
+
+    def handle(self, *args, **options):
+        cookie = _session_cookie()
+        url = urlsplit(options["url"])
+        request = (
+            f"GET {url.path} HTTP/1.1\r\nHost: {url.netloc}\r\nAccept: text/event-stream\r\n"
+            f"Cookie: {cookie}\r\n\r\n"
+        ).encode()
+        stats = {"open": 0, "failed": 0, "closed_early": 0, "bytes": 0}
+
+        async def hold(gate: asyncio.Semaphore, release: asyncio.Event):
+            async with gate:
+                try:
+                    reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+                    writer.write(request)
+                    status_line = await reader.readline()
+                    if b" 200 " not in status_line:
+                        raise ConnectionError(status_line)
+                    await reader.readuntil(b"\r\n\r\n")
+                except (OSError, ConnectionError, asyncio.IncompleteReadError):
+                    stats["failed"] += 1
+                    return
+            stats["open"] += 1
+            try:
+                while not release.is_set():
+                    try:
+                        chunk = await asyncio.wait_for(reader.read(4096), timeout=1)
+                    except asyncio.TimeoutError:
+                        continue
+                    if not chunk:
+                        stats["closed_early"] += 1
+                        return
+                    stats["bytes"] += len(chunk)
+            except OSError:
+                stats["closed_early"] += 1
+            finally:
+                writer.close()
+
+        def report(prefix: str):
+            rss = f", server RSS {_rss_mb(options['server_pid']):.0f} MB" if options["server_pid"] else ""
+            self.stdout.write(
+                f"{prefix}: {stats['open'] - stats['closed_early']} open, {stats['failed']} failed, "
+                f"{stats['closed_early']} closed early, {stats['bytes']} bytes received{rss}"
+            )
+
+        async def run():
+            gate = asyncio.Semaphore(options["parallel"])
+            release = asyncio.Event()
+            started = time.perf_counter()
+            tasks = [asyncio.create_task(hold(gate, release)) for _ in range(options["connections"])]
+            while stats["open"] + stats["failed"] < options["connections"]:
+                await asyncio.sleep(0.5)
+            report(f"connected in {time.perf_counter() - started:.1f}s")
+            await asyncio.sleep(options["hold"])
+            report(f"after holding {options['hold']:.0f}s")
+            release.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run(run())
@@ -0,0 +1,69 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .instrumentation import RequestStats, current_stats
+from .metrics import db_queries, db_query_seconds, http_request_duration, slow_requests
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentationMiddleware:
+    """
+    Records per-route latency histograms and DB query count/time, and logs a
+    trace of requests slower than CORE_SLOW_REQUEST_MS. Put it first in
+    MIDDLEWARE so the rest of the stack is included. For streaming responses
+    the latency covers the time until the response object is returned.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        self._record(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        self._record(request, response, stats, time.perf_counter() - started)
+        return response
+
+    def _record(self, request, response, stats: RequestStats, elapsed: float):
+        match = request.resolver_match
+        # The URL pattern, not the path, so ids do not explode the label set
+        route = match.route if match is not None else "unmatched"
+        http_request_duration.observe(elapsed, (route, request.method, str(response.status_code)))
+        if stats.db_queries:
+            db_queries.inc((route,), stats.db_queries)
+            db_query_seconds.inc((route,), stats.db_seconds)
+        if elapsed * 1000 >= settings.CORE_SLOW_REQUEST_MS:
+            slow_requests.inc((route,))
+            logger.warning(
+                "Slow request %s %s (%s) %d in %.0f ms: %d queries in %.0f ms, %d LLM calls in %.0f ms; "
+                "slowest queries: %s",
+                request.method, request.get_full_path(), route, response.status_code, elapsed * 1000,
+                stats.db_queries, stats.db_seconds * 1000, stats.llm_calls, stats.llm_seconds * 1000,
+                " | ".join(f"{seconds * 1000:.1f} ms {sql[:200]}" for seconds, sql in sorted(stats.slowest, reverse=True)),
+            )
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+def remove_streak_last_day(apps, schema_editor):
+    # The streak is now counted from stats.UserActivityMonth; the helper counter is unused
+    apps.get_model("core", "UserCounter").objects.filter(key="streak_last_day").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_streak_last_day, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,23 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+class UserCounter(models.Model):
+    """
+    Incremental per-user progress counter (e.g. todos completed, best streak)
+    maintained by event subscribers. Achievement, quest and title rules are
+    thresholds over these values.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="counters", db_index=False,
+    )
+    key = models.CharField(max_length=50)
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="user_counter_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key}={self.value}"
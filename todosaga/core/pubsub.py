@@ -0,0 +1,175 @@
+"""
+Publish/subscribe used to push updates to connected clients.
+
+Publishers are ordinary sync code (views, the event-bus worker) and call
+`publish` from any thread; subscribers are coroutines serving a push stream.
+The backend is chosen by settings.CORE_PUBSUB["BACKEND"]. LocalPubSub only
+reaches subscribers in the same process; PostgresPubSub fans messages out to
+every process (gunicorn workers, the timer scheduler) through LISTEN/NOTIFY.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """한 채널을 구독하는 연결 하나의 수신 큐입니다. 구독을 만든 이벤트 루프에서만 읽습니다."""
+
+    def __init__(self, pubsub: "BasePubSub", channel: str, max_queue: int):
+        self.pubsub = pubsub
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def deliver(self, message: Dict):
+        # Runs on self.loop; a slow client loses its oldest messages, never blocks publishers
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: float) -> Optional[Dict]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.pubsub.unsubscribe(self)
+
+
+class BasePubSub:
+    def publish(self, channel: str, message: Dict):
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> Subscription:
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription: Subscription):
+        raise NotImplementedError
+
+
+class LocalPubSub(BasePubSub):
+    """프로세스 안에서만 전달하는 구현입니다. 개발, 테스트, 단일 워커 배포용입니다."""
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, message: Dict):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # The subscriber's loop has already shut down
+                self.unsubscribe(subscription)
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(self, channel, self.max_queue)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+class PostgresPubSub(LocalPubSub):
+    """
+    PostgreSQL LISTEN/NOTIFY 위에서 프로세스 간에 전달하는 구현입니다.
+    publish는 NOTIFY 한 번이고(트랜잭션 안이면 커밋 시점에 전달), 구독자가 생긴 프로세스만
+    리스너 스레드가 전용 연결 하나로 LISTEN 하다가 받은 메시지를 LocalPubSub처럼 나눠 줍니다.
+    리스너가 재연결하는 동안 보낸 메시지는 유실됩니다.
+    """
+
+    # NOTIFY rejects payloads of 8000 bytes or more
+    MAX_PAYLOAD = 7999
+
+    def __init__(self, max_queue: int = 100, database: str = "default", channel: str = "todosaga_push",
+                 reconnect_delay: float = 1.0):
+        super().__init__(max_queue)
+        self.database = database
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._listener: Optional[threading.Thread] = None
+
+    def publish(self, channel: str, message: Dict):
+        payload = json.dumps({"channel": channel, "message": message}, ensure_ascii=False)
+        size = len(payload.encode())
+        if size > self.MAX_PAYLOAD:
+            logger.error("Push message for %s is too large for NOTIFY (%d bytes)", channel, size)
+            return
+        with connections[self.database].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    def subscribe(self, channel: str) -> Subscription:
+        if self._listener is None:
+            with self._lock:
+                if self._listener is None:
+                    self._listener = threading.Thread(target=self._listen, name="pubsub-listener", daemon=True)
+                    self._listener.start()
+        return super().subscribe(channel)
+
+    def _connect(self):
+        import psycopg
+
+        db = settings.DATABASES[self.database]
+        return psycopg.connect(
+            dbname=db["NAME"], user=db["USER"], password=db["PASSWORD"],
+            host=db["HOST"], port=db["PORT"], autocommit=True,
+        )
+
+    def _listen(self):
+        while True:
+            try:
+                with self._connect() as conn:
+                    conn.execute(f'LISTEN "{self.channel}"')
+                    for notify in conn.notifies():
+                        data = json.loads(notify.payload)
+                        LocalPubSub.publish(self, data["channel"], data["message"])
+            except Exception:
+                logger.exception("Push listener lost its connection; reconnecting")
+                time.sleep(self.reconnect_delay)
+
+
+_pubsub: Optional[BasePubSub] = None
+_pubsub_lock = threading.Lock()
+
+
+def get_pubsub() -> BasePubSub:
+    """settings.CORE_PUBSUB의 BACKEND를 만들어 프로세스 안에서 공유합니다. 나머지 키는 소문자로 바꿔 인자로 넘깁니다."""
+    global _pubsub
+    if _pubsub is None:
+        with _pubsub_lock:
+            if _pubsub is None:
+                config = dict(settings.CORE_PUBSUB)
+                backend = import_string(config.pop("BACKEND"))
+                _pubsub = backend(**{key.lower(): value for key, value in config.items()})
+    return _pubsub
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
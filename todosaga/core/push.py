@@ -0,0 +1,30 @@
+"""Forwards domain events and notifications to the user's push channel."""
+from django.db import transaction
+
+from .events import TimerStarted, TodoCompleted, subscribe
+from .pubsub import get_pubsub, user_channel
+
+
+def push_to_user(user_id: int, event_type: str, data: dict):
+    """현재 트랜잭션이 커밋된 뒤 사용자의 푸시 채널로 {"type", "data"} 메시지를 보냅니다."""
+    message = {"type": event_type, "data": data}
+    transaction.on_commit(lambda: get_pubsub().publish(user_channel(user_id), message))
+
+
+@subscribe(TodoCompleted)
+def push_completions(events):
+    for event in events:
+        push_to_user(event.user_id, "exp_gained", {
+            "todo_id": event.todo_id,
+            "gained_exp": event.gained_exp,
+            "completed_at": event.completed_at.isoformat(),
+        })
+
+
+@subscribe(TimerStarted)
+def push_timer_starts(events):
+    for event in events:
+        push_to_user(event.user_id, "timer_started", {
+            "todo_id": event.todo_id,
+            "started_at": event.started_at.isoformat(),
+        })
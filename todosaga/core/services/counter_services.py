@@ -0,0 +1,169 @@
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import connections, router, transaction
+
+from ..events import CounterChanged
+from ..models import UserCounter
+
+# Counter keys maintained by core.evaluators
+TODOS_COMPLETED = "todos_completed"
+TIMERS_STARTED = "timers_started"
+MONSTERS_DEFEATED = "monsters_defeated"
+STREAK_CURRENT = "streak_current"
+STREAK_BEST = "streak_best"
+
+COUNTER_KEYS = [TODOS_COMPLETED, TIMERS_STARTED, MONSTERS_DEFEATED, STREAK_CURRENT, STREAK_BEST]
+
+CounterKey = Tuple[int, str]
+
+
+class CounterBatch:
+    """counters_for_update가 넘겨주는 (user_id, key) -> 값 작업 공간입니다."""
+
+    def __init__(self, values: Dict[CounterKey, int]):
+        self._original = dict(values)
+        self.values = values
+
+    def get(self, user_id: int, key: str) -> int:
+        return self.values[(user_id, key)]
+
+    def add(self, user_id: int, key: str, delta: int):
+        self.values[(user_id, key)] += delta
+
+    def set(self, user_id: int, key: str, value: int):
+        self.values[(user_id, key)] = value
+
+    def raise_to(self, user_id: int, key: str, value: int):
+        if value > self.values[(user_id, key)]:
+            self.values[(user_id, key)] = value
+
+    def changed(self) -> List[CounterChanged]:
+        return [
+            CounterChanged(user_id, key, value)
+            for (user_id, key), value in self.values.items()
+            if value != self._original[(user_id, key)]
+        ]
+
+
+def _lock_values(user_ids, names, keys) -> Dict[CounterKey, int]:
+    return {
+        (user_id, key): value
+        for user_id, key, value in UserCounter.objects.select_for_update()
+        .filter(user_id__in=user_ids, key__in=names)
+        .values_list("user_id", "key", "value")
+        if (user_id, key) in keys
+    }
+
+
+@contextmanager
+def counters_for_update(keys: Iterable[CounterKey]):
+    """
+    주어진 (user_id, key) 카운터들을 잠그고 CounterBatch로 넘겨준 뒤, 바뀐 값만 upsert로 저장합니다.
+    평소에는 잠금 조회와 저장 두 번의 쿼리이고, 처음 보는 카운터가 있을 때만 생성과 재조회가 더해집니다.
+    """
+    keys = set(keys)
+    if not keys:
+        yield CounterBatch({})
+        return
+    user_ids = {user_id for user_id, _ in keys}
+    names = {key for _, key in keys}
+    with transaction.atomic():
+        values = _lock_values(user_ids, names, keys)
+        missing = keys - values.keys()
+        if missing:
+            # Insert the rows first so concurrent workers serialize on their locks too
+            UserCounter.objects.bulk_create(
+                [UserCounter(user_id=user_id, key=key) for user_id, key in missing],
+                ignore_conflicts=True,
+            )
+            values.update(_lock_values(
+                {user_id for user_id, _ in missing}, {key for _, key in missing}, missing
+            ))
+        original = dict(values)
+        batch = CounterBatch(values)
+        yield batch
+
+        # An upsert on the locked keys is much cheaper than bulk_update's per-row CASE
+        UserCounter.objects.bulk_create(
+            [
+                UserCounter(user_id=user_id, key=key, value=value)
+                for (user_id, key), value in batch.values.items()
+                if value != original[(user_id, key)]
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["user", "key"],
+            update_fields=["value"],
+        )
+
+
+def get_counters(user_id: int) -> Dict[str, int]:
+    return dict(UserCounter.objects.filter(user_id=user_id).values_list("key", "value"))
+
+
+def reached_thresholds(changes: Iterable[CounterChanged], rules) -> List[Tuple[int, object]]:
+    """
+    카운터 변경 목록과 (counter_key, target)을 가진 규칙들을 맞춰, 목표에 도달한 (user_id, 규칙) 쌍을 반환합니다.
+    규칙을 counter_key별로 묶어 두므로 비용은 변경 수 x 해당 키의 규칙 수입니다.
+    """
+    rules_by_key: Dict[str, list] = {}
+    for rule in rules:
+        rules_by_key.setdefault(rule.counter_key, []).append(rule)
+    return [
+        (change.user_id, rule)
+        for change in changes
+        for rule in rules_by_key.get(change.key, [])
+        if change.value >= rule.target
+    ]
+
+
+def _insert_new(model, rule_field: str, pairs: List[Tuple[int, object]]) -> List[Tuple[int, int]]:
+    """
+    (user_id, 규칙) 행들을 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 넣고, 실제로 들어간 행의
+    (user_id, 규칙 id)만 반환합니다. bulk_create(ignore_conflicts=True)는 무엇이 들어갔는지 알려주지 않습니다.
+    """
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    rule_column = model._meta.get_field(rule_field).column
+    row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    inserted = []
+    for start in range(0, len(pairs), 200):
+        objs = [model(user_id=user_id, **{rule_field: rule}) for user_id, rule in pairs[start:start + 200]]
+        params = [
+            field.get_db_prep_save(field.pre_save(obj, True), connection)
+            for obj in objs
+            for field in fields
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(model._meta.db_table)} ({', '.join(quote(f.column) for f in fields)}) "
+                f"VALUES {', '.join([row] * len(objs))} "
+                f"ON CONFLICT DO NOTHING RETURNING {quote('user_id')}, {quote(rule_column)}",
+                params,
+            )
+            inserted.extend(cursor.fetchall())
+    return inserted
+
+
+def grant_reached(changes: Iterable[CounterChanged], rules, model, rule_field: str) -> List[Tuple[int, object]]:
+    """
+    reached_thresholds로 목표에 도달한 (user_id, 규칙) 중 아직 없는 것을 model(user, rule_field)에 부여하고,
+    이번 호출에서 실제로 부여한 쌍만 반환합니다. 여러 프로세스가 같은 변경을 동시에 평가해도
+    unique 제약에 걸린 쪽은 아무것도 돌려받지 않으므로, 부여 알림은 한 번만 만들어집니다.
+    """
+    reached = {(user_id, rule.id): rule for user_id, rule in reached_thresholds(changes, rules)}
+    if not reached:
+        return []
+    # Skips rows already granted, so repeated changes past a target insert nothing
+    existing = set(
+        model.objects.filter(
+            user_id__in={user_id for user_id, _ in reached},
+            **{f"{rule_field}_id__in": {rule_id for _, rule_id in reached}},
+        ).values_list("user_id", f"{rule_field}_id")
+    )
+    new = [(user_id, rule) for (user_id, rule_id), rule in reached.items() if (user_id, rule_id) not in existing]
+    if not new:
+        return []
+    return [(user_id, reached[(user_id, rule_id)]) for user_id, rule_id in _insert_new(model, rule_field, new)]
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from typing import Dict, List
+
+from django.db.models import Count, Q
+
+from stats.models import UserActivityMonth
+from todos.models import Todo
+
+from ..events import bus
+from .counter_services import (
+    STREAK_BEST,
+    STREAK_CURRENT,
+    TIMERS_STARTED,
+    TODOS_COMPLETED,
+    counters_for_update,
+)
+
+
+def _active_ordinals(months) -> List[int]:
+    ordinals = []
+    for month, days in months:
+        while days:
+            low = days & -days
+            ordinals.append((month + timedelta(days=low.bit_length() - 1)).toordinal())
+            days ^= low
+    return ordinals
+
+
+def _streaks(ordinals: List[int]) -> Dict[str, int]:
+    best = current = 0
+    previous = None
+    for ordinal in ordinals:
+        current = current + 1 if previous is not None and ordinal == previous + 1 else 1
+        best = max(best, current)
+        previous = ordinal
+    return {STREAK_CURRENT: current, STREAK_BEST: best}
+
+
+def rebuild_counters(batch_size: int = 1000) -> int:
+    """
+    Todo 행과 일별 활동 비트맵으로부터 완료 수, 타이머 시작 수, 연속 일수 카운터를 다시 계산합니다.
+    바뀐 카운터는 이벤트 처리와 같은 경로(CounterChanged)로 전달되어 놓친 업적/칭호/퀘스트도 반영됩니다.
+    이벤트로만 알 수 있는 카운터(몬스터 처치 수)는 건드리지 않습니다. 다시 계산한 사용자 수를 반환합니다.
+    """
+    user_ids = list(Todo.objects.order_by("user_id").values_list("user_id", flat=True).distinct())
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        totals = {
+            row["user_id"]: row
+            for row in Todo.objects.filter(user_id__in=batch).values("user_id").annotate(
+                completed=Count("id", filter=Q(completed=True)),
+                timers=Count("id", filter=Q(start_time__isnull=False)),
+            )
+        }
+        months: Dict[int, list] = {}
+        for user_id, month, days in (
+            UserActivityMonth.objects.filter(user_id__in=batch)
+            .order_by("user_id", "month")
+            .values_list("user_id", "month", "days")
+        ):
+            months.setdefault(user_id, []).append((month, days))
+
+        keys = [
+            (user_id, key)
+            for user_id in batch
+            for key in (TODOS_COMPLETED, TIMERS_STARTED, STREAK_CURRENT, STREAK_BEST)
+        ]
+        with counters_for_update(keys) as counters:
+            for user_id in batch:
+                counters.set(user_id, TODOS_COMPLETED, totals[user_id]["completed"])
+                counters.set(user_id, TIMERS_STARTED, totals[user_id]["timers"])
+                for key, value in _streaks(_active_ordinals(months.get(user_id, []))).items():
+                    counters.set(user_id, key, value)
+        bus.dispatch(counters.changed())
+    return len(user_ids)
@@ -1,3 +1,205 @@
-from django.test import TestCase
+import base64
+import os
+import runpy
+from datetime import date, datetime, time
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from stats.services.activity_services import record_activity
+from todos.models import Todo
+
+from . import pubsub
+from .events import TodoCompleted, bus
+from .metrics import Registry, db_queries, http_request_duration, slow_requests
+from .models import UserCounter
+from .services.counter_services import (
+    STREAK_BEST, STREAK_CURRENT, TODOS_COMPLETED, get_counters,
+)
+from .services.rebuild_services import rebuild_counters
+
+User = get_user_model()
+
+
+class CompletionStreakTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("streaker")
+
+    def complete_on(self, *days):
+        """Records activity the way complete_todo does, then delivers the events in the given order."""
+        record_activity(self.user.id, days)
+        bus.dispatch([
+            TodoCompleted(self.user.id, 0, timezone.make_aware(datetime.combine(day, time(12))), 10)
+            for day in days
+        ])
+
+    def assertStreak(self, current, best):
+        counters = get_counters(self.user.id)
+        self.assertEqual((counters[STREAK_CURRENT], counters[STREAK_BEST]), (current, best))
+
+    def test_consecutive_days(self):
+        for day in (1, 2, 3):
+            self.complete_on(date(2026, 3, day))
+        self.assertStreak(3, 3)
+        self.assertEqual(get_counters(self.user.id)[TODOS_COMPLETED], 3)
+
+    def test_late_event_does_not_rewind(self):
+        for day in (1, 2, 3):
+            self.complete_on(date(2026, 3, day))
+        self.complete_on(date(2026, 3, 2))
+        self.assertStreak(3, 3)
+
+    def test_out_of_order_events(self):
+        for day in (1, 3, 2):
+            self.complete_on(date(2026, 3, day))
+        self.assertStreak(3, 3)
+
+    def test_gap_resets_current_but_keeps_best(self):
+        for day in (1, 2, 5):
+            self.complete_on(date(2026, 3, day))
+        self.assertStreak(1, 2)
+
+    def test_streak_across_months_in_one_batch(self):
+        self.complete_on(date(2026, 1, 30), date(2026, 1, 31), date(2026, 2, 1))
+        self.assertStreak(3, 3)
+
+    def test_rebuild_matches_incremental_counters(self):
+        # rebuild_counters visits users that have todos
+        Todo.objects.create(user=self.user, title="t", type=Todo.CHECK)
+        for day in (1, 2, 5, 6, 7, 6):
+            self.complete_on(date(2026, 3, day))
+        incremental = get_counters(self.user.id)
+        UserCounter.objects.filter(user=self.user).delete()
+        rebuild_counters()
+        rebuilt = get_counters(self.user.id)
+        self.assertEqual((incremental[STREAK_CURRENT], incremental[STREAK_BEST]), (3, 3))
+        for key in (STREAK_CURRENT, STREAK_BEST):
+            self.assertEqual(rebuilt[key], incremental[key])
+
+
+class PushStreamViewTests(TransactionTestCase):
+    def setUp(self):
+        # PostgresPubSub would keep a LISTEN connection to the test database open
+        patcher = mock.patch.object(pubsub, "_pubsub", pubsub.LocalPubSub())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_open_stream_does_not_hold_a_database_connection(self):
+        user = await User.objects.acreate(username="streamer")
+        await self.async_client.aforce_login(user)
+        response = await self.async_client.get("/push/stream")
+        self.assertEqual(response.status_code, 200)
+        # The session lookup ran in the sync thread; an open stream must give that connection back
+        self.assertIsNone(await sync_to_async(lambda: connection.connection)())
+        self.assertIn(b"event: ready", await anext(aiter(response.streaming_content)))
+
+    async def test_rejects_anonymous(self):
+        response = await self.async_client.get("/push/stream")
+        self.assertEqual(response.status_code, 403)
+
+    async def test_basic_authentication(self):
+        await sync_to_async(User.objects.create_user)("basic", password="secret")
+        credentials = base64.b64encode(b"basic:secret").decode()
+        response = await self.async_client.get(
+            "/push/stream", headers={"Authorization": f"Basic {credentials}", "Accept": "text/event-stream"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"event: ready", await anext(aiter(response.streaming_content)))
+
+    def test_refused_under_wsgi(self):
+        self.client.force_login(User.objects.create_user("wsgi"))
+        response = self.client.get("/push/stream", headers={"Accept": "text/event-stream"})
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+
+class RegistryTests(SimpleTestCase):
+    def test_render(self):
+        registry = Registry()
+        hits = registry.counter("hits_total", "Hits.", ["path"])
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        hits.inc(('a "quoted"\nname',), 2)
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+        registry.register_collector(lambda: ["cache_hits_total 7"])
+        self.assertEqual(registry.render().splitlines(), [
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            'hits_total{path="a \\"quoted\\"\\nname"} 2',
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+            "cache_hits_total 7",
+        ])
+
+    def test_same_name_returns_the_registered_metric(self):
+        registry = Registry()
+        self.assertIs(registry.counter("hits_total", "Hits."), registry.counter("hits_total", "Hits."))
+
+
+class InstrumentationMiddlewareTests(TestCase):
+    route = ("notifications/",)
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("watcher"))
+
+    def test_records_latency_and_queries_by_route(self):
+        requests = http_request_duration.count(self.route + ("GET", "200"))
+        queries = db_queries.value(self.route)
+        self.assertEqual(self.client.get("/notifications/").status_code, 200)
+        self.assertEqual(http_request_duration.count(self.route + ("GET", "200")), requests + 1)
+        self.assertGreater(db_queries.value(self.route), queries)
+        self.assertIn("todosaga_http_request_duration_seconds_bucket", self.client.get("/metrics").content.decode())
+
+    @override_settings(CORE_SLOW_REQUEST_MS=0)
+    def test_slow_request_is_logged(self):
+        slow = slow_requests.value(self.route)
+        with self.assertLogs("core.middleware", "WARNING") as logs:
+            self.client.get("/notifications/")
+        self.assertEqual(slow_requests.value(self.route), slow + 1)
+        self.assertIn("slowest queries: ", logs.output[0])
+
+
+class GunicornConfigTests(SimpleTestCase):
+    path = str(settings.BASE_DIR / "gunicorn.conf.py")
+
+    def load(self, cpu_max=None, affinity=8, **env):
+        """Runs gunicorn.conf.py against a fake cgroup quota and environment, returning its settings and environ."""
+        def fake_open(path, *args, **kwargs):
+            if path != "/sys/fs/cgroup/cpu.max" or cpu_max is None:
+                raise FileNotFoundError(path)
+            return mock.mock_open(read_data=cpu_max)()
+
+        with mock.patch.dict(os.environ, env, clear=True), \
+                mock.patch("builtins.open", fake_open), \
+                mock.patch.object(os, "sched_getaffinity", return_value=set(range(affinity)), create=True):
+            return runpy.run_path(self.path), dict(os.environ)
+
+    def test_cores_follow_the_cgroup_quota(self):
+        self.assertEqual(self.load("200000 100000\n")[0]["workers"], 2)
+        # A fractional quota rounds up
+        self.assertEqual(self.load("150000 100000\n")[0]["workers"], 2)
+        self.assertEqual(self.load("max 100000\n", affinity=3)[0]["workers"], 3)
+        self.assertEqual(self.load(affinity=5)[0]["workers"], 5)
+
+    def test_pool_size_per_worker(self):
+        self.assertEqual(self.load(affinity=4)[1]["DB_POOL_MAX_SIZE"], "4")
+        # Fewer workers than cores: each worker's pool covers several cores
+        self.assertEqual(self.load(affinity=4, WEB_CONCURRENCY="2")[1]["DB_POOL_MAX_SIZE"], "8")
+        # The budget caps the pools, leaving one connection per worker for LISTEN
+        self.assertEqual(self.load(affinity=8, DB_MAX_CONNECTIONS="40")[1]["DB_POOL_MAX_SIZE"], "4")
+        self.assertEqual(self.load(affinity=8, DB_MAX_CONNECTIONS="16")[1]["DB_POOL_MAX_SIZE"], "2")
+
+    def test_environment_overrides(self):
+        config, environ = self.load(affinity=4, DB_POOL_MAX_SIZE="20", GUNICORN_BACKLOG="128")
+        self.assertEqual((environ["DB_POOL_MAX_SIZE"], config["backlog"]), ("20", 128))
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import PushStreamView
+
+urlpatterns = [
+    path('stream', PushStreamView.as_view(), name='push-stream'),
+]
@@ -1,3 +1,123 @@
-from django.shortcuts import render
+import json
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views import View
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import permissions, status
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import registry
+from .pubsub import get_pubsub, user_channel
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines. DRF's dispatch is sync, so this one
+    runs `initial()` (the REST_FRAMEWORK authentication classes, permission and
+    throttle checks, which may hit the database) in a thread and awaits the
+    handler on the event loop. Exceptions go through the usual DRF handling.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if hasattr(response, "__await__"):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+def _release_connections():
+    for conn in connections.all(initialized_only=True):
+        conn.close()
+
+
+def _sse(event_type: str, data) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class FirstRendererNegotiation(BaseContentNegotiation):
+    """
+    Ignores the Accept header. EventSource sends `Accept: text/event-stream`,
+    which no renderer matches; error responses are rendered as JSON anyway.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class PushStreamView(AsyncAPIView):
+    """
+    Server-sent events stream of the user's timer, battle, EXP and notification
+    updates. Async, so under todosaga/asgi.py an idle connection is one
+    suspended coroutine rather than a worker thread. The stream never ends, so
+    it is refused under WSGI (and runserver), where Django would collect the
+    whole body in a thread before sending anything.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [JSONRenderer]
+    content_negotiation_class = FirstRendererNegotiation
+
+    @swagger_auto_schema(responses={200: "text/event-stream", 501: "Not served through ASGI"})
+    async def get(self, request):
+        if not isinstance(request._request, ASGIRequest):
+            return Response({"detail": "The push stream is only served through todosaga/asgi.py."},
+                            status=status.HTTP_501_NOT_IMPLEMENTED)
+        user = request.user
+        # Authentication checked out a database connection that would otherwise stay
+        # with this request until the stream ends; with the pool that caps open streams
+        # at DB_POOL_MAX_SIZE per worker. The stream itself never queries.
+        await sync_to_async(_release_connections)()
+
+        async def stream():
+            subscription = get_pubsub().subscribe(user_channel(user.id))
+            try:
+                yield f"retry: {settings.CORE_PUSH_RETRY_MS}\n" + _sse("ready", {"user_id": user.id})
+                while True:
+                    message = await subscription.get(timeout=settings.CORE_PUSH_HEARTBEAT)
+                    if message is None:
+                        # Comment line: keeps proxies from timing out an idle stream
+                        yield ": keep-alive\n\n"
+                    else:
+                        yield _sse(message["type"], message["data"])
+            finally:
+                subscription.close()
+
+        response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class MetricsView(View):
+    """
+    Prometheus text exposition of this process's metrics. Unauthenticated, so
+    keep it off the public proxy and scrape the app port directly.
+    """
+
+    def get(self, request):
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,8 @@
+from django.contrib import admin
+
+from .models import FocusSession
+
+@admin.register(FocusSession)
+class FocusSessionAdmin(admin.ModelAdmin):
+    list_display = ("user", "category", "started_at", "duration_seconds")
+    list_filter = ("category",)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from focus.services.focus_services import rebuild_focus_totals
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-day, per-category focus totals from ended focus sessions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids",
+                            help="Only this user id (repeatable). Defaults to every user with sessions.")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_focus_totals(options["user_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt focus totals for {rebuilt} users"))
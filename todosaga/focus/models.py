@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+
+class FocusSession(models.Model):
+    """
+    One focus interval, stored as its start plus a length in seconds.
+    `duration_seconds` is NULL while the session is running. Ending a session
+    adds its seconds to FocusDaily, so totals never re-read session rows.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="focus_sessions", db_index=False,
+    )
+    todo = models.ForeignKey(
+        "todos.Todo", on_delete=models.SET_NULL, null=True, blank=True,
+        related_name="focus_sessions", db_index=False,
+    )
+    category = models.CharField(max_length=50)
+    started_at = models.DateTimeField()
+    duration_seconds = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Range queries: sessions of a user starting inside a window
+            models.Index(fields=["user", "started_at"], name="focus_session_user_start_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.started_at:%Y-%m-%d %H:%M}+{self.duration_seconds}"
+
+    @property
+    def ended_at(self):
+        if self.duration_seconds is None:
+            return None
+        return self.started_at + timedelta(seconds=self.duration_seconds)
+
+
+class FocusDaily(models.Model):
+    """
+    Focus seconds per user, local (TIME_ZONE) day and category. Incremented
+    with F() when a session ends; a session crossing midnight is split between
+    the days it covers. Rebuilt from sessions by the `rebuild_focus_totals` command.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="focus_days", db_index=False,
+    )
+    day = models.DateField()
+    category = models.CharField(max_length=50)
+    seconds = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Also the index behind the totals range query (user, day BETWEEN ...)
+            models.UniqueConstraint(fields=["user", "day", "category"], name="focus_daily_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.day}:{self.category}={self.seconds}"
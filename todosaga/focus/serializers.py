@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from todos.services.todo_services import CATEGORIES
+
+# Serializer for the focus session start request
+class FocusStartSerializer(serializers.Serializer):
+    todo_id = serializers.IntegerField(required=False, min_value=1)
+    category = serializers.ChoiceField(choices=CATEGORIES, required=False)
+
+# Serializer for the focus session start response
+class FocusStartResponseSerializer(serializers.Serializer):
+    session_id = serializers.IntegerField()
+    message = serializers.CharField()
+    category = serializers.CharField()
+    started_at = serializers.DateTimeField()
+
+# Serializer for the focus session end response
+class FocusEndResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    duration = serializers.IntegerField()
+
+# Serializer for the focus range query parameters (local dates, both inclusive)
+class FocusRangeQuerySerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, data):
+        end = data.get("end") or timezone.localdate()
+        start = data.get("start") or end - timedelta(days=settings.FOCUS_DEFAULT_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError("start must not be after end.")
+        if (end - start).days + 1 > settings.FOCUS_MAX_DAYS:
+            raise serializers.ValidationError(f"Range must not exceed {settings.FOCUS_MAX_DAYS} days.")
+        return {"start": start, "end": end}
+
+# Serializer for a merged focus interval
+class FocusIntervalSerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+# Serializer for the merged focus intervals response
+class FocusIntervalsSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    total_seconds = serializers.IntegerField()
+    intervals = FocusIntervalSerializer(many=True)
+
+# Serializer for one day/category focus total
+class FocusDailyTotalSerializer(serializers.Serializer):
+    day = serializers.DateField()
+    category = serializers.CharField()
+    seconds = serializers.IntegerField()
+
+# Serializer for the focus totals response
+class FocusTotalsSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    total_seconds = serializers.IntegerField()
+    days = FocusDailyTotalSerializer(many=True)
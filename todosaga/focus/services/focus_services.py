@@ -0,0 +1,196 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from core.exceptions import NotFound, ServiceError
+from stats.services.exp_engine import UNCLASSIFIED_CATEGORY
+from todos.models import Todo
+from todos.services.todo_services import CATEGORIES
+
+from ..models import FocusDaily, FocusSession
+
+Interval = Tuple[datetime, datetime]
+
+
+def _category_for(todo: Optional[Todo]) -> str:
+    """Todo의 카테고리 가중치 중 가장 큰 카테고리를, 분류 전이거나 Todo가 없으면 UNCLASSIFIED_CATEGORY를 씁니다."""
+    vector = todo.category_weight_vector if todo is not None else None
+    if vector is None or not vector.any():
+        return UNCLASSIFIED_CATEGORY
+    return CATEGORIES[int(np.argmax(vector))]
+
+
+def start_session(user, todo_id: Optional[int] = None, category: Optional[str] = None) -> FocusSession:
+    """
+    집중 세션을 시작합니다. category를 주지 않으면 todo_id로 지정한 Todo의 주 카테고리를 씁니다.
+    동시에 여러 세션(예: Todo마다 하나)을 열 수 있으며, 겹치는 시간은 범위 조회에서 합쳐집니다.
+    """
+    todo = None
+    if todo_id is not None:
+        todo = Todo.objects.filter(id=todo_id, user=user).only("id", "category_weights").first()
+        if todo is None:
+            raise NotFound("Todo not found.")
+    return FocusSession.objects.create(
+        user=user,
+        todo=todo,
+        category=category or _category_for(todo),
+        started_at=timezone.now(),
+    )
+
+
+def split_by_day(started_at: datetime, seconds: int) -> Dict[date, int]:
+    """
+    구간 [started_at, started_at + seconds)를 로컬 날짜별 정수 초로 나눕니다. 자정을 넘는 세션은 여러 날에 나뉩니다.
+    각 자정까지의 누적 초를 정수로 자르고 마지막 날이 나머지를 받으므로, 시작 시각에 마이크로초가 있어도 합은 seconds입니다.
+    """
+    by_day: Dict[date, int] = {}
+    cursor = timezone.localtime(started_at)
+    end = cursor + timedelta(seconds=seconds)
+    assigned = 0
+    while cursor < end:
+        next_midnight = timezone.make_aware(
+            datetime.combine(cursor.date() + timedelta(days=1), datetime.min.time())
+        )
+        if next_midnight < end:
+            through = int((next_midnight - started_at).total_seconds())
+        else:
+            next_midnight, through = end, seconds
+        if through > assigned:
+            by_day[cursor.date()] = through - assigned
+            assigned = through
+        cursor = next_midnight
+    return by_day
+
+
+def add_focus_seconds(user_id: int, category: str, seconds_by_day: Dict[date, int]):
+    """
+    일별 집중 시간을 FocusDaily에 원자적으로 더합니다. award_exp와 같이 INSERT ... ON CONFLICT DO NOTHING 후
+    CASE 식을 쓴 UPDATE 한 번으로 처리하므로 쿼리는 항상 2개입니다. 호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+    """
+    seconds_by_day = {day: seconds for day, seconds in seconds_by_day.items() if seconds}
+    if not seconds_by_day:
+        return
+    FocusDaily.objects.bulk_create(
+        [FocusDaily(user_id=user_id, day=day, category=category) for day in seconds_by_day],
+        ignore_conflicts=True,
+    )
+    FocusDaily.objects.filter(
+        user_id=user_id, category=category, day__in=list(seconds_by_day)
+    ).update(
+        seconds=F("seconds") + Case(
+            *[When(day=day, then=Value(seconds)) for day, seconds in seconds_by_day.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def end_session(user, session_id: int) -> FocusSession:
+    """
+    집중 세션을 끝내고 길이를 기록한 뒤, 같은 트랜잭션에서 일별/카테고리별 합계에 더합니다.
+    길이는 FOCUS_MAX_SESSION_SECONDS를 넘지 않습니다. 행을 잠그고 처리하므로 한 번만 종료됩니다.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        session = FocusSession.objects.select_for_update().filter(id=session_id, user=user).first()
+        if session is None:
+            raise NotFound("Focus session not found.")
+        if session.duration_seconds is not None:
+            raise ServiceError("Focus session already ended.")
+        elapsed = max(int((now - session.started_at).total_seconds()), 0)
+        session.duration_seconds = min(elapsed, settings.FOCUS_MAX_SESSION_SECONDS)
+        session.save(update_fields=["duration_seconds"])
+        add_focus_seconds(user.id, session.category, split_by_day(session.started_at, session.duration_seconds))
+    return session
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """겹치거나 맞닿은 구간들을 시작 시각으로 정렬한 뒤 한 번 훑어 합칩니다. O(n log n)입니다."""
+    merged: List[list] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def focus_intervals(user, start: datetime, end: datetime) -> List[Interval]:
+    """
+    [start, end) 창과 겹치는 세션들을 창 안으로 잘라 합친 구간 목록을 반환합니다. 진행 중인 세션은 지금까지로 봅니다.
+    세션 길이가 FOCUS_MAX_SESSION_SECONDS 이하이므로 (user, started_at) 인덱스의 범위 조회 한 번으로 후보를 읽습니다.
+    """
+    now = timezone.now()
+    rows = FocusSession.objects.filter(
+        user=user,
+        started_at__gte=start - timedelta(seconds=settings.FOCUS_MAX_SESSION_SECONDS),
+        started_at__lt=end,
+    ).values_list("started_at", "duration_seconds")
+    clipped = []
+    for started_at, duration_seconds in rows:
+        if duration_seconds is None:
+            session_end = min(now, started_at + timedelta(seconds=settings.FOCUS_MAX_SESSION_SECONDS))
+        else:
+            session_end = started_at + timedelta(seconds=duration_seconds)
+        interval = (max(started_at, start), min(session_end, end))
+        if interval[0] < interval[1]:
+            clipped.append(interval)
+    return merge_intervals(clipped)
+
+
+def focus_totals(user, start: date, end: date) -> List[Tuple[date, str, int]]:
+    """
+    start~end(양 끝 포함)의 (날짜, 카테고리, 초) 목록을 focus_daily_unique 인덱스 범위 조회 한 번으로 읽습니다.
+    재계산이 남긴 0초 행은 빼고 반환합니다.
+    """
+    return list(
+        FocusDaily.objects.filter(user=user, day__gte=start, day__lte=end, seconds__gt=0)
+        .order_by("day", "category")
+        .values_list("day", "category", "seconds")
+    )
+
+
+def rebuild_focus_totals(user_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    끝난 세션들로부터 FocusDaily를 다시 계산합니다. user_ids를 주지 않으면 세션이 있는 모든 사용자를 처리합니다.
+    운영 중에 실행해도 합계를 잃지 않도록 사용자마다 한 트랜잭션 안에서 진행 중인 세션과 FocusDaily 행을 먼저 잠근 뒤
+    세션을 읽습니다. end_session은 세션 행을 잠그고 더하므로, 진행 중인 종료는 커밋을 기다려 읽기에 포함되고
+    잠근 뒤의 종료는 다시 쓴 값 위에 더해집니다. 행은 지우지 않고 upsert로 덮어쓰며, 세션이 없는 날은 0이 됩니다.
+    다시 계산한 사용자 수를 반환합니다.
+    """
+    if user_ids is None:
+        user_ids = list(
+            FocusSession.objects.order_by("user_id").values_list("user_id", flat=True).distinct()
+        )
+    for user_id in user_ids:
+        with transaction.atomic():
+            list(FocusSession.objects.select_for_update().filter(
+                user_id=user_id, duration_seconds__isnull=True
+            ).values_list("id"))
+            totals: Dict[Tuple[date, str], int] = {
+                key: 0 for key in FocusDaily.objects.select_for_update()
+                .filter(user_id=user_id).values_list("day", "category")
+            }
+            rows = FocusSession.objects.filter(
+                user_id=user_id, duration_seconds__isnull=False
+            ).values_list("started_at", "duration_seconds", "category")
+            for started_at, duration_seconds, category in rows.iterator(chunk_size=2000):
+                for day, seconds in split_by_day(started_at, duration_seconds).items():
+                    totals[(day, category)] = totals.get((day, category), 0) + seconds
+            FocusDaily.objects.bulk_create(
+                [
+                    FocusDaily(user_id=user_id, day=day, category=category, seconds=seconds)
+                    for (day, category), seconds in totals.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["user", "day", "category"],
+                update_fields=["seconds"],
+                batch_size=1000,
+            )
+    return len(user_ids)
@@ -0,0 +1,138 @@
+import threading
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from .models import FocusSession
+from .services import focus_services
+from .services.focus_services import (
+    end_session, focus_intervals, focus_totals, merge_intervals, rebuild_focus_totals, split_by_day,
+)
+
+User = get_user_model()
+
+
+def at(day: int, hour: int, minute: int = 0) -> datetime:
+    """A local (TIME_ZONE) time in March 2026."""
+    return timezone.make_aware(datetime(2026, 3, day, hour, minute))
+
+
+class MergeIntervalsTests(SimpleTestCase):
+    def test_empty(self):
+        self.assertEqual(merge_intervals([]), [])
+
+    def test_overlapping_touching_and_nested(self):
+        intervals = [
+            (at(1, 10), at(1, 11)),
+            (at(1, 9), at(1, 10)),          # touches the first
+            (at(1, 10, 15), at(1, 10, 30)),  # nested
+            (at(1, 13), at(1, 14)),
+            (at(1, 13, 30), at(1, 15)),      # overlaps the previous one
+        ]
+        self.assertEqual(merge_intervals(intervals), [(at(1, 9), at(1, 11)), (at(1, 13), at(1, 15))])
+
+    def test_disjoint_are_sorted(self):
+        self.assertEqual(
+            merge_intervals([(at(2, 9), at(2, 10)), (at(1, 9), at(1, 10))]),
+            [(at(1, 9), at(1, 10)), (at(2, 9), at(2, 10))],
+        )
+
+
+class SplitByDayTests(SimpleTestCase):
+    def test_within_one_day(self):
+        self.assertEqual(split_by_day(at(1, 9), 3600), {date(2026, 3, 1): 3600})
+
+    def test_across_local_midnight(self):
+        self.assertEqual(
+            split_by_day(at(1, 23, 30), 2 * 3600),
+            {date(2026, 3, 1): 1800, date(2026, 3, 2): 5400},
+        )
+
+    def test_days_follow_local_time(self):
+        # 16:00 UTC is 01:00 the next day in Seoul
+        started_at = datetime(2026, 3, 1, 16, tzinfo=dt_timezone.utc)
+        self.assertEqual(split_by_day(started_at, 60), {date(2026, 3, 2): 60})
+
+    def test_spanning_several_days(self):
+        split = split_by_day(at(1, 12), 2 * 86400)
+        self.assertEqual(split, {date(2026, 3, 1): 43200, date(2026, 3, 2): 86400, date(2026, 3, 3): 43200})
+
+    def test_zero_seconds(self):
+        self.assertEqual(split_by_day(at(1, 12), 0), {})
+
+    def test_sub_second_start_keeps_the_total(self):
+        started_at = at(1, 23, 59).replace(second=59, microsecond=500000)
+        # The half second before midnight is not a whole second; the next day gets all ten
+        self.assertEqual(split_by_day(started_at, 10), {date(2026, 3, 2): 10})
+        split = split_by_day(at(1, 12).replace(microsecond=250000), 2 * 86400)
+        self.assertEqual(split, {date(2026, 3, 1): 43199, date(2026, 3, 2): 86400, date(2026, 3, 3): 43201})
+        self.assertEqual(sum(split.values()), 2 * 86400)
+
+
+class FocusTotalsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("focuser")
+
+    def run_session(self, started_at: datetime, seconds: int, category: str = "공부"):
+        session = FocusSession.objects.create(user=self.user, category=category, started_at=started_at)
+        with mock.patch.object(focus_services.timezone, "now", return_value=started_at + timedelta(seconds=seconds)):
+            return end_session(self.user, session.id)
+
+    def test_incremental_totals_match_rebuild(self):
+        self.run_session(at(1, 23, 30), 3600)
+        self.run_session(at(2, 9), 1800, category="운동")
+        self.run_session(at(2, 9, 10), 600)
+        incremental = focus_totals(self.user, date(2026, 3, 1), date(2026, 3, 2))
+        self.assertEqual(incremental, [
+            (date(2026, 3, 1), "공부", 1800),
+            (date(2026, 3, 2), "공부", 2400),
+            (date(2026, 3, 2), "운동", 1800),
+        ])
+        rebuild_focus_totals([self.user.id])
+        self.assertEqual(focus_totals(self.user, date(2026, 3, 1), date(2026, 3, 2)), incremental)
+
+    def test_rebuild_zeroes_days_without_sessions(self):
+        self.run_session(at(1, 9), 600)
+        FocusSession.objects.filter(user=self.user).delete()
+        FocusSession.objects.create(user=self.user, category="공부", started_at=at(2, 9), duration_seconds=60)
+        self.assertEqual(rebuild_focus_totals([self.user.id]), 1)
+        self.assertEqual(focus_totals(self.user, date(2026, 3, 1), date(2026, 3, 2)), [(date(2026, 3, 2), "공부", 60)])
+
+    def test_intervals_merge_overlapping_sessions(self):
+        self.run_session(at(2, 9), 1800)
+        self.run_session(at(2, 9, 20), 1800)
+        self.assertEqual(
+            focus_intervals(self.user, at(2, 0), at(3, 0)),
+            [(at(2, 9), at(2, 9, 50))],
+        )
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class RebuildDuringEndSessionTests(TransactionTestCase):
+    def test_session_ended_after_the_read_is_kept(self):
+        user = User.objects.create_user("steady")
+        now = timezone.now()
+        FocusSession.objects.create(user=user, category="공부", started_at=now - timedelta(hours=2), duration_seconds=60)
+        running = FocusSession.objects.create(user=user, category="공부", started_at=now - timedelta(seconds=600))
+        ender = threading.Thread(target=lambda: (end_session(user, running.id), connection.close()))
+
+        def wrapper(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if 'FROM "focus_focussession"' in sql and "IS NOT NULL" in sql and ender.ident is None:
+                # Another request ends a session once the rebuild has read the ended ones
+                ender.start()
+                ender.join(timeout=1)
+            return result
+
+        with connection.execute_wrapper(wrapper):
+            rebuild_focus_totals([user.id])
+        ender.join()
+        running.refresh_from_db()
+        today = timezone.localdate(now)
+        totals = focus_totals(user, today - timedelta(days=1), today)
+        total = sum(seconds for _, _, seconds in totals)
+        self.assertEqual(total, 60 + running.duration_seconds)
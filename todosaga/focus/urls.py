@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import FocusSessionStartView, FocusSessionEndView, FocusSessionListView, FocusTotalsView
+
+urlpatterns = [
+    path('sessions', FocusSessionListView.as_view(), name='focus-session-list'),
+    path('sessions/start', FocusSessionStartView.as_view(), name='focus-session-start'),
+    path('sessions/<int:id>/end', FocusSessionEndView.as_view(), name='focus-session-end'),
+    path('totals', FocusTotalsView.as_view(), name='focus-totals'),
+]
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from django.http import Http404
+from django.utils import timezone
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import NotFound, ServiceError
+from .serializers import (
+    FocusStartSerializer,
+    FocusStartResponseSerializer,
+    FocusEndResponseSerializer,
+    FocusRangeQuerySerializer,
+    FocusIntervalsSerializer,
+    FocusTotalsSerializer,
+)
+from .services.focus_services import end_session, focus_intervals, focus_totals, start_session
+
+class FocusSessionStartView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=FocusStartSerializer,
+        responses={200: FocusStartResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = FocusStartSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            session = start_session(request.user, **serializer.validated_data)
+        except NotFound:
+            raise Http404
+        result = {
+            "session_id": session.id,
+            "message": "Focus session started",
+            "category": session.category,
+            "started_at": session.started_at,
+        }
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class FocusSessionEndView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: FocusEndResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request, id):
+        try:
+            session = end_session(request.user, id)
+        except NotFound:
+            raise Http404
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"message": "Focus session ended", "duration": session.duration_seconds},
+            status=status.HTTP_200_OK,
+        )
+
+
+class FocusSessionListView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        query_serializer=FocusRangeQuerySerializer,
+        responses={200: FocusIntervalsSerializer}
+    )
+    def get(self, request):
+        query = FocusRangeQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        start, end = query.validated_data["start"], query.validated_data["end"]
+        # Local-day window [start 00:00, end + 1 day 00:00)
+        window_start = timezone.make_aware(datetime.combine(start, datetime.min.time()))
+        window_end = timezone.make_aware(datetime.combine(end + timedelta(days=1), datetime.min.time()))
+        intervals = focus_intervals(request.user, window_start, window_end)
+        result = {
+            "start": start,
+            "end": end,
+            "total_seconds": int(sum((b - a).total_seconds() for a, b in intervals)),
+            "intervals": [{"start": a, "end": b} for a, b in intervals],
+        }
+        return Response(FocusIntervalsSerializer(result).data, status=status.HTTP_200_OK)
+
+
+class FocusTotalsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        query_serializer=FocusRangeQuerySerializer,
+        responses={200: FocusTotalsSerializer}
+    )
+    def get(self, request):
+        query = FocusRangeQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        start, end = query.validated_data["start"], query.validated_data["end"]
+        rows = focus_totals(request.user, start, end)
+        result = {
+            "start": start,
+            "end": end,
+            "total_seconds": sum(seconds for _, _, seconds in rows),
+            "days": [{"day": day, "category": category, "seconds": seconds} for day, category, seconds in rows],
+        }
+        return Response(FocusTotalsSerializer(result).data, status=status.HTTP_200_OK)
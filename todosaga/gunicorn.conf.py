@@ -0,0 +1,55 @@
+"""
+Gunicorn settings for serving todosaga/asgi.py with uvicorn workers:
+
+    gunicorn todosaga.asgi:application -c gunicorn.conf.py
+
+Each worker is one event loop, so the worker count follows the CPU cores the
+container may use. Sync views run in a thread per in-flight request (asgiref),
+so a worker's concurrency is bounded by its database pool, not by a thread
+count: DB_POOL_MAX_SIZE is derived here so that all workers together stay
+within DB_MAX_CONNECTIONS. Every value can be overridden from the environment.
+"""
+import math
+import os
+
+
+def available_cores() -> int:
+    """컨테이너가 쓸 수 있는 CPU 코어 수입니다. cgroup v2 쿼터가 있으면 그것을, 없으면 affinity를 씁니다."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return len(os.sched_getaffinity(0))
+
+
+cores = available_cores()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", cores))
+
+# Connections all web workers may hold together; the rest of Postgres'
+# max_connections (100 by default) is left for the scheduler, migrations and psql.
+db_budget = int(os.getenv("DB_MAX_CONNECTIONS", 80))
+# Per worker: the pool, plus one LISTEN connection when PostgresPubSub is used.
+# Beyond ~4 connections per core, more in-flight queries only contend for the GIL
+# (p99 of complete doubled with 8 on one core; loadtest_api).
+os.environ.setdefault(
+    "DB_POOL_MAX_SIZE", str(max(2, min(4 * math.ceil(cores / workers), db_budget // workers - 1)))
+)
+
+# Pending connections per listening socket; streams reconnecting after a deploy arrive
+# together. The kernel caps this at net.core.somaxconn.
+backlog = int(os.getenv("GUNICORN_BACKLOG", 2048))
+
+# Worker heartbeat; long-lived push streams are async and do not block it
+timeout = 30
+graceful_timeout = 30
+# nginx reuses upstream connections (keepalive in nginx/default.conf) and closes them
+# after 60s idle; staying open longer avoids racing a request against our close
+keepalive = 75
+# Fork the workers before Django is imported, so each worker opens its own pool
+preload_app = False
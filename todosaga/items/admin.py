@@ -1,3 +1,14 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Equipment, Material
+
+@admin.register(Equipment)
+class EquipmentAdmin(admin.ModelAdmin):
+    # Saves and deletes bump the catalog version through items.signals
+    list_display = ("name", "equipment_type", "slot", "main_ability", "price", "is_for_sale")
+    list_filter = ("equipment_type", "is_for_sale")
+    filter_horizontal = ("upgrade_materials",)
+
+@admin.register(Material)
+class MaterialAdmin(admin.ModelAdmin):
+    list_display = ("name",)
@@ -0,0 +1,49 @@
+from django.db import migrations
+
+MATERIALS = ["Iron Ore", "Magic Stone", "Leather", "Crystal"]
+
+# name, type, slot, main, main_value, sub, sub_value, price, upgrade_gold, materials
+EQUIPMENT = [
+    ("Wooden Sword", "weapon", "weapon", "STR", 3, "DEX", 1, 100, 50, ["Iron Ore"]),
+    ("Iron Sword", "weapon", "weapon", "STR", 6, "DEX", 2, 300, 120, ["Iron Ore", "Magic Stone"]),
+    ("Steel Sword", "weapon", "weapon", "STR", 10, "DEX", 4, 500, 200, ["Iron Ore", "Magic Stone"]),
+    ("Apprentice Staff", "weapon", "weapon", "INT", 6, "WIS", 3, 300, 120, ["Magic Stone", "Crystal"]),
+    ("Leather Armor", "armor", "body", "CON", 5, "DEX", 2, 250, 100, ["Leather"]),
+    ("Chain Mail", "armor", "body", "CON", 9, "STR", 3, 450, 180, ["Iron Ore", "Leather"]),
+    ("Focus Ring", "accessory", "ring", "WIS", 4, "INT", 2, 350, 150, ["Crystal"]),
+    ("Charm Pendant", "accessory", "neck", "CHA", 4, "WIS", 2, 350, 150, ["Crystal", "Magic Stone"]),
+]
+
+
+def seed(apps, schema_editor):
+    CatalogVersion = apps.get_model('items', 'CatalogVersion')
+    Material = apps.get_model('items', 'Material')
+    Equipment = apps.get_model('items', 'Equipment')
+
+    CatalogVersion.objects.get_or_create(pk=1, defaults={'version': 1})
+    materials = {m.name: m for m in Material.objects.bulk_create([Material(name=n) for n in MATERIALS])}
+    for name, type_, slot, main, main_value, sub, sub_value, price, upgrade_gold, needs in EQUIPMENT:
+        equipment = Equipment.objects.create(
+            name=name, equipment_type=type_, slot=slot,
+            main_ability=main, main_value=main_value, sub_ability=sub, sub_value=sub_value,
+            price=price, upgrade_gold=upgrade_gold,
+        )
+        equipment.upgrade_materials.set([materials[n] for n in needs])
+
+
+def unseed(apps, schema_editor):
+    Material = apps.get_model('items', 'Material')
+    Equipment = apps.get_model('items', 'Equipment')
+    Equipment.objects.filter(name__in=[row[0] for row in EQUIPMENT]).delete()
+    Material.objects.filter(name__in=MATERIALS).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -1,3 +1,74 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+ABILITY_CHOICES = [(ability, ability) for ability in ["STR", "DEX", "CON", "INT", "WIS", "CHA"]]
+
+class Material(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+
+    def __str__(self):
+        return self.name
+
+class Equipment(models.Model):
+    """Catalog entry. Reads go through the versioned in-process catalog cache."""
+    WEAPON = "weapon"
+    ARMOR = "armor"
+    ACCESSORY = "accessory"
+    TYPE_CHOICES = [
+        (WEAPON, "Weapon"),
+        (ARMOR, "Armor"),
+        (ACCESSORY, "Accessory"),
+    ]
+
+    name = models.CharField(max_length=100)
+    equipment_type = models.CharField(max_length=10, choices=TYPE_CHOICES)
+    slot = models.CharField(max_length=20)
+    main_ability = models.CharField(max_length=3, choices=ABILITY_CHOICES)
+    main_value = models.PositiveIntegerField(default=0)
+    main_growth = models.PositiveIntegerField(default=2)
+    sub_ability = models.CharField(max_length=3, choices=ABILITY_CHOICES, blank=True)
+    sub_value = models.PositiveIntegerField(default=0)
+    sub_growth = models.PositiveIntegerField(default=1)
+    price = models.PositiveIntegerField(default=0)
+    is_for_sale = models.BooleanField(default=True)
+    upgrade_gold = models.PositiveIntegerField(default=0)
+    # One of each is consumed per upgrade
+    upgrade_materials = models.ManyToManyField(Material, blank=True, related_name="+")
+
+    def __str__(self):
+        return self.name
+
+class CatalogVersion(models.Model):
+    """Single row; bumped whenever the catalog changes so every process drops its cached copy."""
+    version = models.BigIntegerField(default=1)
+
+class Wallet(models.Model):
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="wallet")
+    gold = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}:{self.gold}"
+
+class UserMaterial(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="materials", db_index=False,
+    )
+    material = models.ForeignKey(Material, on_delete=models.CASCADE, related_name="+")
+    quantity = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "material"], name="user_material_unique"),
+        ]
+
+class InventoryItem(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="inventory")
+    # PROTECT: inventory rows are joined against the cached catalog by id
+    equipment = models.ForeignKey(Equipment, on_delete=models.PROTECT, related_name="+")
+    level = models.PositiveIntegerField(default=1)
+    is_equipped = models.BooleanField(default=False)
+    acquired_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.user_id}:{self.equipment_id}+{self.level}"
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+
+# Serializer for a shop catalog entry
+class ShopItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    price = serializers.IntegerField()
+    equipment_type = serializers.CharField()
+    slot = serializers.CharField()
+    main_ability = serializers.CharField()
+    sub_ability = serializers.CharField()
+
+# Serializer for an owned item
+class InventoryItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    equipment_type = serializers.CharField()
+    slot = serializers.CharField()
+    main_ability = serializers.CharField()
+    sub_ability = serializers.CharField()
+    level = serializers.IntegerField()
+    is_equipped = serializers.BooleanField()
+
+# Serializer for the buy response
+class BuyResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    item_id = serializers.IntegerField()
+
+# Serializer for the upgrade request
+class UpgradeSerializer(serializers.Serializer):
+    upgrade_materials = serializers.ListField(child=serializers.CharField(), required=False)
+
+# Serializer for the stats after an upgrade
+class UpgradeStatsSerializer(serializers.Serializer):
+    main_ability = serializers.CharField()
+    main_ability_value = serializers.IntegerField()
+    sub_ability = serializers.CharField()
+    sub_ability_value = serializers.IntegerField()
+
+# Serializer for the upgrade response
+class UpgradeResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    new_stats = UpgradeStatsSerializer()
@@ -0,0 +1,155 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils.http import quote_etag
+
+from ..models import CatalogVersion, Equipment
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    id: int
+    name: str
+    equipment_type: str
+    slot: str
+    main_ability: str
+    main_value: int
+    main_growth: int
+    sub_ability: str
+    sub_value: int
+    sub_growth: int
+    price: int
+    is_for_sale: bool
+    upgrade_gold: int
+    upgrade_material_ids: Tuple[int, ...]
+    upgrade_material_names: Tuple[str, ...]
+
+    def stats_at(self, level: int) -> Dict:
+        return {
+            "main_ability": self.main_ability,
+            "main_ability_value": self.main_value + self.main_growth * (level - 1),
+            "sub_ability": self.sub_ability,
+            "sub_ability_value": self.sub_value + self.sub_growth * (level - 1),
+        }
+
+
+@dataclass(frozen=True)
+class Catalog:
+    version: int
+    items: Dict[int, CatalogItem]
+    # Precomputed shop payload, shared by every request until the version changes
+    shop: List[Dict]
+
+    @property
+    def etag(self) -> str:
+        return quote_etag(f"catalog-{self.version}")
+
+
+def get_catalog_version() -> int:
+    return CatalogVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+def load_catalog(version: int) -> Catalog:
+    items = {}
+    for equipment in Equipment.objects.prefetch_related("upgrade_materials").order_by("id"):
+        items[equipment.id] = CatalogItem(
+            id=equipment.id,
+            name=equipment.name,
+            equipment_type=equipment.equipment_type,
+            slot=equipment.slot,
+            main_ability=equipment.main_ability,
+            main_value=equipment.main_value,
+            main_growth=equipment.main_growth,
+            sub_ability=equipment.sub_ability,
+            sub_value=equipment.sub_value,
+            sub_growth=equipment.sub_growth,
+            price=equipment.price,
+            is_for_sale=equipment.is_for_sale,
+            upgrade_gold=equipment.upgrade_gold,
+            upgrade_material_ids=tuple(m.id for m in equipment.upgrade_materials.all()),
+            upgrade_material_names=tuple(m.name for m in equipment.upgrade_materials.all()),
+        )
+    shop = [
+        {
+            "id": item.id,
+            "name": item.name,
+            "price": item.price,
+            "equipment_type": item.equipment_type,
+            "slot": item.slot,
+            "main_ability": item.main_ability,
+            "sub_ability": item.sub_ability,
+        }
+        for item in items.values()
+        if item.is_for_sale
+    ]
+    return Catalog(version, items, shop)
+
+
+class CatalogCache:
+    """
+    장비 카탈로그를 프로세스 메모리에 두고, 저장된 버전이 바뀌었을 때만 다시 읽습니다.
+    버전 확인 쿼리도 check_interval초에 한 번만 하므로 다른 프로세스의 변경은 최대 그만큼 늦게 반영됩니다.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._catalog: Optional[Catalog] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Catalog:
+        catalog = self._catalog
+        if catalog is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return catalog
+        with self._lock:
+            # Read the version before the rows so a concurrent edit can only make us reload again
+            version = get_catalog_version()
+            if self._catalog is None or self._catalog.version != version:
+                self._catalog = load_catalog(version)
+            self._checked_at = time.monotonic()
+            return self._catalog
+
+    def invalidate(self):
+        """다음 get()이 버전과 관계없이 카탈로그를 다시 읽게 합니다."""
+        self._catalog = None
+        self._checked_at = 0.0
+
+
+_catalog_cache: Optional[CatalogCache] = None
+
+
+def get_catalog_cache() -> CatalogCache:
+    global _catalog_cache
+    if _catalog_cache is None:
+        _catalog_cache = CatalogCache(settings.ITEMS_CATALOG_VERSION_CHECK_INTERVAL)
+    return _catalog_cache
+
+
+def get_catalog() -> Catalog:
+    return get_catalog_cache().get()
+
+
+def get_catalog_with(equipment_ids: Iterable[int]) -> Catalog:
+    """
+    equipment_ids가 모두 들어 있는 카탈로그를 반환합니다. 하나라도 없으면 캐시가 오래된 것이므로
+    (다른 프로세스의 변경이 아직 확인되지 않았거나 버전을 올리지 않고 장비를 추가한 경우) 한 번 다시 읽습니다.
+    인벤토리처럼 DB에 있는 장비만 가리키는 id에 쓰고, 사용자가 보낸 id에는 쓰지 마세요.
+    """
+    catalog = get_catalog()
+    if not catalog.items.keys() >= set(equipment_ids):
+        cache = get_catalog_cache()
+        cache.invalidate()
+        catalog = cache.get()
+    return catalog
+
+
+def bump_catalog_version():
+    """카탈로그 버전을 올립니다. 커밋된 뒤 이 프로세스의 캐시는 바로, 다른 프로세스는 다음 버전 확인 때 갱신됩니다."""
+    if not CatalogVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        CatalogVersion.objects.get_or_create(pk=1, defaults={"version": 2})
+    transaction.on_commit(get_catalog_cache().invalidate)
@@ -0,0 +1,103 @@
+from typing import Dict, List, Sequence
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from core.exceptions import NotFound, ServiceError
+
+from ..models import InventoryItem, UserMaterial, Wallet
+from .catalog_services import get_catalog, get_catalog_with
+
+
+def credit_gold(user_id: int, amount: int):
+    """지갑에 골드를 원자적으로 더합니다 (없으면 만든 뒤 F() 증가)."""
+    if amount <= 0:
+        return
+    Wallet.objects.bulk_create([Wallet(user_id=user_id)], ignore_conflicts=True)
+    Wallet.objects.filter(user_id=user_id).update(gold=F("gold") + amount)
+
+
+def _debit_gold(user_id: int, amount: int):
+    # Conditional decrement: never reads the balance, never goes negative
+    if amount and not Wallet.objects.filter(user_id=user_id, gold__gte=amount).update(gold=F("gold") - amount):
+        raise ServiceError("Not enough gold.")
+
+
+def _debit_materials(user_id: int, material_ids: Sequence[int]):
+    if not material_ids:
+        return
+    consumed = UserMaterial.objects.filter(
+        user_id=user_id, material_id__in=material_ids, quantity__gte=1
+    ).update(quantity=F("quantity") - 1)
+    if consumed != len(material_ids):
+        raise ServiceError("Not enough materials.")
+
+
+def list_inventory(user) -> List[Dict]:
+    """
+    인벤토리 행만 조회하고 장비 정보는 캐시된 카탈로그에서 붙이므로 쿼리는 행 수와 관계없이 1개입니다.
+    캐시에 없는 장비가 있으면 카탈로그를 한 번 다시 읽습니다.
+    """
+    rows = list(
+        InventoryItem.objects.filter(user=user).order_by("id")
+        .values_list("id", "equipment_id", "level", "is_equipped")
+    )
+    items = get_catalog_with(equipment_id for _, equipment_id, _, _ in rows).items
+    result = []
+    for row_id, equipment_id, level, is_equipped in rows:
+        item = items.get(equipment_id)
+        if item is None:
+            # Not even in the reloaded catalog (read from another snapshot)
+            continue
+        result.append({
+            "id": row_id,
+            "name": item.name,
+            "equipment_type": item.equipment_type,
+            "slot": item.slot,
+            "main_ability": item.main_ability,
+            "sub_ability": item.sub_ability,
+            "level": level,
+            "is_equipped": is_equipped,
+        })
+    return result
+
+
+def buy_item(user, equipment_id: int) -> InventoryItem:
+    """골드 차감과 인벤토리 추가를 한 트랜잭션에서 처리합니다."""
+    item = get_catalog().items.get(equipment_id)
+    if item is None or not item.is_for_sale:
+        raise NotFound("Item not found.")
+    with transaction.atomic():
+        _debit_gold(user.id, item.price)
+        return InventoryItem.objects.create(user=user, equipment_id=item.id)
+
+
+def upgrade_item(user, inventory_id: int, material_names: Sequence[str] = None) -> Dict:
+    """
+    장비를 한 단계 올립니다. 골드와 카탈로그에 정해진 재료(각 1개)를 조건부 UPDATE로 차감하고
+    레벨을 올리는 것까지 한 트랜잭션이라, 하나라도 모자라면 아무것도 차감되지 않습니다.
+    material_names를 주면 필요한 재료와 같은지 확인합니다. 새 능력치를 반환합니다.
+    """
+    with transaction.atomic():
+        owned = (
+            InventoryItem.objects.select_for_update()
+            .filter(user=user, id=inventory_id)
+            .only("id", "equipment_id", "level")
+            .first()
+        )
+        if owned is None:
+            raise NotFound("Inventory item not found.")
+        item = get_catalog_with([owned.equipment_id]).items.get(owned.equipment_id)
+        if item is None:
+            raise NotFound("Item not found.")
+        if owned.level >= settings.ITEMS_MAX_UPGRADE_LEVEL:
+            raise ServiceError("Equipment is already at the maximum level.")
+        if material_names is not None:
+            names = set(item.upgrade_material_names)
+            if set(material_names) != names:
+                raise ServiceError(f"Upgrade requires: {', '.join(sorted(names)) or 'no materials'}.")
+        _debit_gold(user.id, item.upgrade_gold)
+        _debit_materials(user.id, item.upgrade_material_ids)
+        InventoryItem.objects.filter(id=owned.id).update(level=F("level") + 1)
+    return item.stats_at(owned.level + 1)
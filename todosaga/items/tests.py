@@ -1,3 +1,45 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Equipment, InventoryItem, Wallet
+from .services import catalog_services
+from .services.catalog_services import CatalogCache, get_catalog
+from .services.item_services import list_inventory, upgrade_item
+
+User = get_user_model()
+
+
+class StaleCatalogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("collector")
+        Wallet.objects.create(user=self.user, gold=100)
+        Equipment.objects.create(name="Sword", equipment_type=Equipment.WEAPON, slot="hand", main_ability="STR")
+        # A fresh cache that only re-checks the version once an hour
+        patcher = mock.patch.object(catalog_services, "_catalog_cache", CatalogCache(3600))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        get_catalog()
+        # Added without bump_catalog_version, so the cached catalog does not know it
+        self.shield = Equipment.objects.create(
+            name="Shield", equipment_type=Equipment.ARMOR, slot="arm", main_ability="CON", upgrade_gold=10,
+        )
+        self.owned = InventoryItem.objects.create(user=self.user, equipment=self.shield)
+
+    def test_list_inventory_reloads_on_miss(self):
+        self.assertNotIn(self.shield.id, get_catalog().items)
+        self.assertEqual([item["name"] for item in list_inventory(self.user)], ["Shield"])
+        self.assertIn(self.shield.id, get_catalog().items)
+
+    def test_upgrade_reloads_on_miss(self):
+        upgrade_item(self.user, self.owned.id)
+        self.owned.refresh_from_db()
+        self.assertEqual(self.owned.level, 2)
+        self.assertEqual(Wallet.objects.get(user=self.user).gold, 90)
+
+    def test_hit_does_not_reload(self):
+        list_inventory(self.user)
+        # The inventory query only
+        with self.assertNumQueries(1):
+            list_inventory(self.user)
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import InventoryUpgradeView, InventoryView, ShopBuyView, ShopView
+
+urlpatterns = [
+    path('inventory', InventoryView.as_view(), name='item-inventory'),
+    path('inventory/<int:id>/upgrade', InventoryUpgradeView.as_view(), name='item-upgrade'),
+    path('shop', ShopView.as_view(), name='item-shop'),
+    path('shop/<int:id>/buy', ShopBuyView.as_view(), name='item-buy'),
+]
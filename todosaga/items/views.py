@@ -1,3 +1,86 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from django.http import Http404
+from django.utils.http import parse_etags
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import NotFound, ServiceError
+from .serializers import (
+    ShopItemSerializer,
+    InventoryItemSerializer,
+    BuyResponseSerializer,
+    UpgradeSerializer,
+    UpgradeResponseSerializer,
+)
+from .services.catalog_services import get_catalog
+from .services.item_services import buy_item, list_inventory, upgrade_item
 
-# Create your views here.
+class ShopView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: ShopItemSerializer(many=True), 304: "Not Modified"}
+    )
+    def get(self, request):
+        catalog = get_catalog()
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if catalog.etag in etags or "*" in etags:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(catalog.shop, status=status.HTTP_200_OK)
+        response["ETag"] = catalog.etag
+        # Clients may keep the copy but must revalidate with If-None-Match
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+
+class ShopBuyView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: BuyResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request, id):
+        try:
+            buy_item(request.user, id)
+        except NotFound:
+            raise Http404
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"message": "Item purchased successfully", "item_id": id},
+            status=status.HTTP_200_OK,
+        )
+
+
+class InventoryView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: InventoryItemSerializer(many=True)}
+    )
+    def get(self, request):
+        return Response(list_inventory(request.user), status=status.HTTP_200_OK)
+
+
+class InventoryUpgradeView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=UpgradeSerializer,
+        responses={200: UpgradeResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request, id):
+        serializer = UpgradeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            new_stats = upgrade_item(request.user, id, serializer.validated_data.get("upgrade_materials"))
+        except NotFound:
+            raise Http404
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"message": "Equipment upgraded successfully", "new_stats": new_stats},
+            status=status.HTTP_200_OK,
+        )
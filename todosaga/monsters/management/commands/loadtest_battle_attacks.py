@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, close_old_connections
+from django.utils import timezone
+
+from core.exceptions import ServiceError
+from monsters.models import DailyBattle, Monster
+from monsters.services.battle_services import attack
+
+USERNAME = "loadtest-battle"
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent attacks at one battle and check that the final HP and the number of "
+        "defeats match what serial execution would give. Uses and then deletes a throwaway user."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=32)
+        parser.add_argument("--attacks", type=int, default=500)
+        parser.add_argument("--damage", type=int, default=7)
+        parser.add_argument("--hp", type=int, default=3000)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        user, _ = User.objects.get_or_create(username=USERNAME)
+        monster = Monster.objects.create(name="Load test dummy", max_hp=options["hp"], is_active=False)
+        DailyBattle.objects.filter(user=user).delete()
+        DailyBattle.objects.create(
+            user=user, date=timezone.localdate(), monster=monster,
+            hp=monster.max_hp, status=DailyBattle.ONGOING,
+        )
+
+        lock = threading.Lock()
+        outcome = {"hits": 0, "defeats": 0, "rejected": 0, "errors": 0}
+
+        def strike(_):
+            try:
+                result = attack(user, options["damage"])
+                key = "defeats" if result.defeated else "hits"
+            except ServiceError:
+                key = "rejected"
+            except OperationalError:
+                key = "errors"
+            finally:
+                close_old_connections()
+            with lock:
+                outcome[key] += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+            list(pool.map(strike, range(options["attacks"])))
+        elapsed = time.perf_counter() - started
+
+        battle = DailyBattle.objects.get(user=user)
+        landed = outcome["hits"] + outcome["defeats"]
+        expected_hp = max(options["hp"] - landed * options["damage"], 0)
+        ok = battle.hp == expected_hp and outcome["defeats"] == (1 if expected_hp == 0 else 0)
+
+        DailyBattle.objects.filter(user=user).delete()
+        monster.delete()
+        user.delete()
+
+        self.stdout.write(
+            f"{options['attacks']} attacks / {options['threads']} threads in {elapsed:.2f}s "
+            f"({options['attacks'] / elapsed:,.0f}/s): {outcome}, final hp {battle.hp} "
+            f"(expected {expected_hp})"
+        )
+        if ok:
+            self.stdout.write(self.style.SUCCESS("Consistent"))
+        else:
+            self.stderr.write(self.style.ERROR("Inconsistent battle state"))
@@ -0,0 +1,22 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from monsters.services.battle_services import rollover_battles
+
+
+class Command(BaseCommand):
+    help = (
+        "Expire unfinished battles from earlier days and bulk-create the daily battle rows "
+        "for every active user. Schedule shortly before midnight (Asia/Seoul); safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", type=date.fromisoformat, default=None,
+                            help="Battle date to create (YYYY-MM-DD). Defaults to tomorrow.")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Rows per bulk INSERT.")
+
+    def handle(self, *args, **options):
+        created = rollover_battles(day=options["date"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Prepared battles for {created} users"))
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Monster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('max_hp', models.PositiveIntegerField()),
+                ('reward_exp', models.PositiveIntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyBattle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('hp', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('selecting', 'Selecting'), ('ongoing', 'Ongoing'), ('defeated', 'Defeated'), ('ended', 'Ended'), ('expired', 'Expired')], default='selecting', max_length=10)),
+                ('gained_exp', models.PositiveIntegerField(default=0)),
+                ('ended_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_battles', to=settings.AUTH_USER_MODEL)),
+                ('monster', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='battles', to='monsters.monster')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('status__in', ['selecting', 'ongoing'])), fields=['date'], name='daily_battle_open_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='daily_battle_unique')],
+            },
+        ),
+    ]
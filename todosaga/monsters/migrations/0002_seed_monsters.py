@@ -0,0 +1,33 @@
+from django.db import migrations
+
+MONSTERS = [
+    ("Slime", "A weak slime monster", 300, 20),
+    ("Goblin", "A sneaky goblin that steals your focus", 500, 35),
+    ("Procrastination Wraith", "Feeds on postponed todos", 800, 60),
+    ("Stone Golem", "Slow, stubborn and very tough", 1200, 90),
+    ("Deadline Dragon", "Breathes fire when due dates approach", 2000, 150),
+]
+
+
+def seed(apps, schema_editor):
+    Monster = apps.get_model('monsters', 'Monster')
+    Monster.objects.bulk_create([
+        Monster(name=name, description=description, max_hp=hp, reward_exp=exp)
+        for name, description, hp, exp in MONSTERS
+    ])
+
+
+def unseed(apps, schema_editor):
+    Monster = apps.get_model('monsters', 'Monster')
+    Monster.objects.filter(name__in=[row[0] for row in MONSTERS], battles=None).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monsters', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -1,3 +1,57 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+class Monster(models.Model):
+    name = models.CharField(max_length=100)
+    description = models.CharField(max_length=255, blank=True)
+    max_hp = models.PositiveIntegerField()
+    reward_exp = models.PositiveIntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+
+    def __str__(self):
+        return self.name
+
+class DailyBattle(models.Model):
+    """
+    One battle per user per local (TIME_ZONE) day. Rows for the next day are
+    bulk-created by the `rollover_battles` command; `hp` is only ever changed
+    with conditional UPDATEs so concurrent attacks never read-modify-write.
+    """
+    SELECTING = "selecting"
+    ONGOING = "ongoing"
+    DEFEATED = "defeated"
+    ENDED = "ended"
+    EXPIRED = "expired"
+    STATUS_CHOICES = [
+        (SELECTING, "Selecting"),
+        (ONGOING, "Ongoing"),
+        (DEFEATED, "Defeated"),
+        (ENDED, "Ended"),
+        (EXPIRED, "Expired"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="daily_battles", db_index=False,
+    )
+    date = models.DateField()
+    monster = models.ForeignKey(Monster, on_delete=models.PROTECT, null=True, blank=True, related_name="battles")
+    hp = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=SELECTING)
+    gained_exp = models.PositiveIntegerField(default=0)
+    ended_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "date"], name="daily_battle_unique"),
+        ]
+        indexes = [
+            # The rollover expires whatever is still open from earlier days
+            models.Index(
+                fields=["date"], name="daily_battle_open_idx",
+                condition=models.Q(status__in=["selecting", "ongoing"]),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.date}:{self.status}"
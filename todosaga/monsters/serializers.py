@@ -0,0 +1,34 @@
+from django.conf import settings
+from rest_framework import serializers
+
+# Serializer for one of today's monsters
+class DailyMonsterSerializer(serializers.Serializer):
+    monster_id = serializers.IntegerField()
+    name = serializers.CharField()
+    description = serializers.CharField()
+
+# Serializer for selecting today's monster
+class MonsterSelectSerializer(serializers.Serializer):
+    monster_id = serializers.IntegerField()
+
+# Serializer for an attack
+class MonsterAttackSerializer(serializers.Serializer):
+    damage = serializers.IntegerField(min_value=1)
+
+    def validate_damage(self, value):
+        if value > settings.MONSTERS_MAX_ATTACK_DAMAGE:
+            raise serializers.ValidationError(
+                f"Damage must not exceed {settings.MONSTERS_MAX_ATTACK_DAMAGE}."
+            )
+        return value
+
+# Serializer for the attack response
+class MonsterAttackResponseSerializer(serializers.Serializer):
+    monster_hp = serializers.IntegerField()
+    status = serializers.CharField()
+
+# Serializer for the retreat response
+class MonsterRetreatResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    gained_exp = serializers.IntegerField()
+    status = serializers.CharField()
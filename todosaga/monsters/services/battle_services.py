@@ -0,0 +1,157 @@
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.events import MonsterDefeated, publish
+from core.exceptions import ServiceError
+from core.push import push_to_user
+from notifications.models import Notification
+from notifications.services.notification_services import notify
+from stats.services.stat_services import award_completion_exp
+
+from ..models import DailyBattle, Monster
+
+
+@dataclass(frozen=True)
+class AttackResult:
+    monster_hp: int
+    status: str
+    defeated: bool
+
+
+def daily_monsters(day: Optional[date] = None) -> List[Monster]:
+    """날짜를 시드로 활성 몬스터 중 MONSTERS_DAILY_CHOICES마리를 고릅니다. 같은 날에는 모든 사용자에게 같은 목록입니다."""
+    day = day or timezone.localdate()
+    monsters = list(Monster.objects.filter(is_active=True).order_by("id"))
+    count = min(settings.MONSTERS_DAILY_CHOICES, len(monsters))
+    return sorted(random.Random(day.toordinal()).sample(monsters, count), key=lambda m: m.id)
+
+
+def _ensure_battle(user_id: int, day: date):
+    # Normally created by the rollover; covers users who signed up since
+    DailyBattle.objects.bulk_create([DailyBattle(user_id=user_id, date=day)], ignore_conflicts=True)
+
+
+def select_monster(user, monster_id: int) -> Monster:
+    """오늘의 몬스터 중 하나를 골라 전투를 시작합니다. 아직 고르지 않은 전투에만 조건부 UPDATE로 반영됩니다."""
+    today = timezone.localdate()
+    monster = next((m for m in daily_monsters(today) if m.id == monster_id), None)
+    if monster is None:
+        raise ServiceError("Monster is not available today.")
+    _ensure_battle(user.id, today)
+    updated = DailyBattle.objects.filter(
+        user=user, date=today, status=DailyBattle.SELECTING
+    ).update(monster=monster, hp=monster.max_hp, status=DailyBattle.ONGOING)
+    if not updated:
+        raise ServiceError("Monster already selected.")
+    return monster
+
+
+def attack(user, damage: int) -> AttackResult:
+    """
+    오늘 전투 중인 몬스터에 피해를 줍니다. hp = GREATEST(hp - damage, 0)과 처치 판정을
+    조건부 UPDATE 한 번으로 처리하므로 읽고-수정하고-쓰는 경합이 없습니다.
+    UPDATE가 잡은 행 잠금은 커밋까지 유지되어, 같은 트랜잭션에서 다시 읽은 값은 이 공격 직후의 상태입니다.
+    hp를 0으로 만든 공격만 상태를 defeated로 바꾸므로 MonsterDefeated는 정확히 한 번 발행됩니다.
+    """
+    today = timezone.localdate()
+    with transaction.atomic():
+        updated = DailyBattle.objects.filter(
+            user=user, date=today, status=DailyBattle.ONGOING
+        ).update(
+            hp=Greatest(F("hp") - damage, 0),
+            # Evaluated against the pre-update hp, like every SET expression
+            status=Case(
+                When(hp__lte=damage, then=Value(DailyBattle.DEFEATED)),
+                default=Value(DailyBattle.ONGOING),
+            ),
+        )
+        if not updated:
+            status = (
+                DailyBattle.objects.filter(user=user, date=today)
+                .values_list("status", flat=True).first()
+            )
+            if status == DailyBattle.DEFEATED:
+                raise ServiceError("Monster already defeated.")
+            raise ServiceError("No battle in progress.")
+        battle = (
+            DailyBattle.objects.select_related("monster")
+            .only("id", "hp", "status", "monster__name")
+            .get(user=user, date=today)
+        )
+        defeated = battle.status == DailyBattle.DEFEATED
+        push_to_user(user.id, "battle", {"monster_hp": battle.hp, "status": battle.status})
+        if defeated:
+            publish(MonsterDefeated(user.id, battle.monster_id, timezone.now()))
+            notify(user.id, Notification.BATTLE, f"You defeated {battle.monster.name}!")
+    return AttackResult(battle.hp, battle.status, defeated)
+
+
+def retreat(user) -> Tuple[DailyBattle, bool]:
+    """
+    오늘의 전투를 끝내고 보상을 정합니다. 처치했으면 몬스터의 보상 경험치 전부를,
+    아니면 입힌 피해 비율만큼의 절반을 받습니다. 행을 잠그고 처리하므로 한 번만 종료되고,
+    경험치도 같은 트랜잭션에서 한 번만 반영됩니다. 몬스터에는 카테고리가 없어 UNCLASSIFIED_CATEGORY로 들어갑니다.
+    (전투, 처치 여부)를 반환합니다.
+    """
+    today = timezone.localdate()
+    with transaction.atomic():
+        battle = (
+            # Lock only the battle: monster is a nullable FK, so its join is an outer join
+            DailyBattle.objects.select_for_update(of=("self",))
+            .select_related("monster")
+            .filter(user=user, date=today, status__in=[DailyBattle.ONGOING, DailyBattle.DEFEATED])
+            .first()
+        )
+        if battle is None:
+            raise ServiceError("No battle to end.")
+        monster = battle.monster
+        defeated = battle.status == DailyBattle.DEFEATED
+        if defeated:
+            battle.gained_exp = monster.reward_exp
+        else:
+            battle.gained_exp = monster.reward_exp * (monster.max_hp - battle.hp) // (2 * monster.max_hp)
+        battle.status = DailyBattle.ENDED
+        battle.ended_at = timezone.now()
+        battle.save(update_fields=["status", "gained_exp", "ended_at"])
+        award_completion_exp(user.id, [(battle.gained_exp, None)])
+        notify(user.id, Notification.BATTLE, f"Battle with {monster.name} ended: +{battle.gained_exp} EXP")
+        push_to_user(user.id, "battle", {"status": battle.status, "gained_exp": battle.gained_exp})
+    return battle, defeated
+
+
+def rollover_battles(day: Optional[date] = None, batch_size: int = 1000) -> int:
+    """
+    오늘 이전의 끝나지 않은 전투를 UPDATE 한 번으로 만료시키고, 모든 활성 사용자의
+    day(기본값: 내일) 전투 행을 batch_size명 단위의 bulk INSERT(ON CONFLICT DO NOTHING)로 만듭니다.
+    이미 있는 행은 건드리지 않으므로 여러 번 실행해도 안전합니다. 처리한 사용자 수를 반환합니다.
+    """
+    day = day or timezone.localdate() + timedelta(days=1)
+    DailyBattle.objects.filter(
+        date__lt=min(day, timezone.localdate()), status__in=[DailyBattle.SELECTING, DailyBattle.ONGOING]
+    ).update(status=DailyBattle.EXPIRED)
+
+    user_ids = (
+        get_user_model().objects.filter(is_active=True)
+        .order_by("pk").values_list("pk", flat=True)
+    )
+    batch = []
+    total = 0
+    for user_id in user_ids.iterator(chunk_size=batch_size):
+        batch.append(DailyBattle(user_id=user_id, date=day))
+        if len(batch) >= batch_size:
+            DailyBattle.objects.bulk_create(batch, ignore_conflicts=True)
+            total += len(batch)
+            batch = []
+    if batch:
+        DailyBattle.objects.bulk_create(batch, ignore_conflicts=True)
+        total += len(batch)
+    return total
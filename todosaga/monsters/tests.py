@@ -1,3 +1,60 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from core.exceptions import ServiceError
+from stats.models import UserCategoryStat
+from stats.services.exp_engine import UNCLASSIFIED_CATEGORY
+from stats.services.stat_services import rebuild_category_stats
+
+from .models import DailyBattle, Monster
+from .services.battle_services import attack, retreat
+
+User = get_user_model()
+
+
+def total_exp(user):
+    return sum(UserCategoryStat.objects.filter(user=user).values_list("total_exp", flat=True))
+
+
+@override_settings(CORE_EVENT_BUS_ASYNC=False)
+class RetreatExpTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("fighter")
+        self.monster = Monster.objects.create(name="Slime", max_hp=100, reward_exp=50)
+        self.battle = DailyBattle.objects.create(
+            user=self.user, date=timezone.localdate(), monster=self.monster,
+            hp=self.monster.max_hp, status=DailyBattle.ONGOING,
+        )
+
+    def test_defeat_credits_full_reward(self):
+        self.assertTrue(attack(self.user, 100).defeated)
+        battle, defeated = retreat(self.user)
+        self.assertTrue(defeated)
+        self.assertEqual(battle.gained_exp, 50)
+        self.assertEqual(
+            dict(UserCategoryStat.objects.filter(user=self.user).values_list("category", "total_exp")),
+            {UNCLASSIFIED_CATEGORY: 50},
+        )
+
+    def test_retreat_credits_partial_reward(self):
+        attack(self.user, 40)
+        battle, defeated = retreat(self.user)
+        self.assertFalse(defeated)
+        # Half of the reward, scaled by the damage dealt
+        self.assertEqual(battle.gained_exp, 10)
+        self.assertEqual(total_exp(self.user), 10)
+
+    def test_reward_is_credited_once(self):
+        attack(self.user, 100)
+        retreat(self.user)
+        with self.assertRaises(ServiceError):
+            retreat(self.user)
+        self.assertEqual(total_exp(self.user), 50)
+
+    def test_rebuild_keeps_battle_rewards(self):
+        attack(self.user, 100)
+        retreat(self.user)
+        UserCategoryStat.objects.filter(user=self.user).delete()
+        self.assertEqual(rebuild_category_stats(), 1)
+        self.assertEqual(total_exp(self.user), 50)
@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import DailyMonsterView, MonsterAttackView, MonsterRetreatView
+
+urlpatterns = [
+    path('daily', DailyMonsterView.as_view(), name='monster-daily'),
+    path('daily/attack', MonsterAttackView.as_view(), name='monster-attack'),
+    path('daily/retreat', MonsterRetreatView.as_view(), name='monster-retreat'),
+]
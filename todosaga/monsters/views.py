@@ -1,3 +1,85 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import ServiceError
+from .serializers import (
+    DailyMonsterSerializer,
+    MonsterSelectSerializer,
+    MonsterAttackSerializer,
+    MonsterAttackResponseSerializer,
+    MonsterRetreatResponseSerializer,
+)
+from .services.battle_services import attack, daily_monsters, retreat, select_monster
 
-# Create your views here.
+class DailyMonsterView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: DailyMonsterSerializer(many=True)}
+    )
+    def get(self, request):
+        result = [
+            {
+                "monster_id": monster.id,
+                "name": monster.name,
+                "description": monster.description,
+            }
+            for monster in daily_monsters()
+        ]
+        return Response(result, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body=MonsterSelectSerializer,
+        responses={200: "Monster selected", 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = MonsterSelectSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            select_monster(request.user, serializer.validated_data["monster_id"])
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"message": "Monster selected"}, status=status.HTTP_200_OK)
+
+
+class MonsterAttackView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=MonsterAttackSerializer,
+        responses={200: MonsterAttackResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = MonsterAttackSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            result = attack(request.user, serializer.validated_data["damage"])
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"monster_hp": result.monster_hp, "status": result.status},
+            status=status.HTTP_200_OK,
+        )
+
+
+class MonsterRetreatView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: MonsterRetreatResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request):
+        try:
+            battle, defeated = retreat(request.user)
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = {
+            "message": "Battle ended",
+            "gained_exp": battle.gained_exp,
+            "status": "success" if defeated else "retreated",
+        }
+        return Response(result, status=status.HTTP_200_OK)
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'notifications'
+
+    def ready(self):
+        from core.events import bus
+        from .services.notification_services import buffered_notifications
+
+        bus.wrap_batches(buffered_notifications)
@@ -0,0 +1,26 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from .services.notification_services import abuffered_notifications, buffered_notifications
+
+
+class NotificationBufferMiddleware:
+    """Collects notifications created while handling a request and writes them in one batch."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with buffered_notifications():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        # Under ASGI sync views run in sync_to_async threads, which see the same buffer
+        async with abuffered_notifications():
+            return await self.get_response(request)
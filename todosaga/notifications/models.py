@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import models
+
+class Notification(models.Model):
+    LEVEL_UP = "level_up"
+    ACHIEVEMENT = "achievement"
+    QUEST = "quest"
+    TITLE = "title"
+    BATTLE = "battle"
+    KIND_CHOICES = [
+        (LEVEL_UP, "Level up"),
+        (ACHIEVEMENT, "Achievement"),
+        (QUEST, "Quest"),
+        (TITLE, "Title"),
+        (BATTLE, "Battle"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="notifications", db_index=False,
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    message = models.CharField(max_length=255)
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-id"], name="notification_user_idx"),
+            # Unread listing only walks the (usually small) unread set
+            models.Index(
+                fields=["user", "-id"], name="notification_unread_idx",
+                condition=models.Q(is_read=False),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.kind}:{self.message}"
+
+class NotificationCounter(models.Model):
+    """Unread count per user, kept in step with Notification rows so reading it is a PK lookup."""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        primary_key=True, related_name="notification_counter",
+    )
+    unread = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}:{self.unread}"
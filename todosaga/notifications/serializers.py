@@ -0,0 +1,35 @@
+from django.conf import settings
+from rest_framework import serializers
+
+# Serializer for the notification list query parameters
+class NotificationQuerySerializer(serializers.Serializer):
+    unread = serializers.BooleanField(required=False, default=False)
+    before = serializers.IntegerField(required=False, min_value=1)
+
+# Serializer for a notification
+class NotificationSerializer(serializers.Serializer):
+    notification_id = serializers.IntegerField(source="id")
+    kind = serializers.CharField()
+    message = serializers.CharField()
+    is_read = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+
+# Serializer for the mark-read request
+class MarkReadSerializer(serializers.Serializer):
+    notification_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    def validate_notification_ids(self, value):
+        if len(value) > settings.NOTIFICATIONS_MARK_READ_MAX_IDS:
+            raise serializers.ValidationError(
+                f"At most {settings.NOTIFICATIONS_MARK_READ_MAX_IDS} ids per request."
+            )
+        return value
+
+# Serializer for the mark-read response
+class MarkReadResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    updated = serializers.IntegerField()
+
+# Serializer for the unread count
+class UnreadCountSerializer(serializers.Serializer):
+    unread = serializers.IntegerField()
@@ -0,0 +1,128 @@
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Sequence
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+from core.push import push_to_user
+
+from ..models import Notification, NotificationCounter
+
+_buffer: ContextVar[Optional[List[Notification]]] = ContextVar("notification_buffer", default=None)
+
+
+def _write(pending: List[Notification]):
+    """
+    알림들을 bulk INSERT 한 번으로 저장하고, 사용자별 안 읽은 수를 CASE UPDATE 한 번으로 올린 뒤
+    커밋되면 각 사용자의 푸시 채널로 보냅니다.
+    """
+    if not pending:
+        return
+    counts = Counter(notification.user_id for notification in pending)
+    with transaction.atomic():
+        Notification.objects.bulk_create(pending, batch_size=500)
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in counts],
+            ignore_conflicts=True,
+        )
+        NotificationCounter.objects.filter(user_id__in=list(counts)).update(
+            unread=F("unread") + Case(
+                *[When(user_id=user_id, then=Value(count)) for user_id, count in counts.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+        for notification in pending:
+            push_to_user(notification.user_id, "notification", {
+                "notification_id": notification.id,
+                "kind": notification.kind,
+                "message": notification.message,
+            })
+
+
+@contextmanager
+def buffered_notifications():
+    """
+    이 블록 안에서 만들어진 알림을 모았다가 블록이 끝날 때 한 번에 저장합니다.
+    요청 단위(미들웨어)와 이벤트 배치 단위로 사용하며, 중첩되면 가장 바깥 블록이 저장합니다.
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+    pending: List[Notification] = []
+    token = _buffer.set(pending)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+        _write(pending)
+
+
+@asynccontextmanager
+async def abuffered_notifications():
+    """
+    buffered_notifications의 비동기 버전입니다. ContextVar는 sync_to_async 스레드로도 전달되므로
+    ASGI에서 동기 뷰가 만든 알림도 모였다가 블록이 끝날 때 스레드에서 한 번에 저장됩니다.
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+    pending: List[Notification] = []
+    token = _buffer.set(pending)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+        await sync_to_async(_write)(pending)
+
+
+def notify(user_id: int, kind: str, message: str):
+    """
+    알림을 하나 만듭니다. 현재 트랜잭션이 커밋된 뒤에만 버퍼에 들어가므로 롤백된 작업의 알림은 남지 않습니다.
+    버퍼 밖에서 호출되면 바로 저장합니다.
+    """
+    notification = Notification(user_id=user_id, kind=kind, message=message)
+    pending = _buffer.get()
+
+    def _add():
+        if pending is None:
+            _write([notification])
+        else:
+            pending.append(notification)
+
+    transaction.on_commit(_add)
+
+
+def list_notifications(user, unread_only: bool = False, before: Optional[int] = None) -> List[Notification]:
+    """최신순으로 NOTIFICATIONS_PAGE_SIZE개를 반환합니다. before(알림 id)보다 오래된 것부터 이어서 읽습니다."""
+    queryset = Notification.objects.filter(user=user)
+    if unread_only:
+        queryset = queryset.filter(is_read=False)
+    if before is not None:
+        queryset = queryset.filter(id__lt=before)
+    return list(queryset.order_by("-id")[:settings.NOTIFICATIONS_PAGE_SIZE])
+
+
+def mark_read(user, notification_ids: Sequence[int]) -> int:
+    """
+    UPDATE ... WHERE user = ? AND id IN (...) AND is_read = false 한 번으로 읽음 처리하고,
+    실제로 바뀐 행 수만큼 안 읽은 수를 같은 트랜잭션에서 줄입니다. 바뀐 행 수를 반환합니다.
+    """
+    with transaction.atomic():
+        updated = Notification.objects.filter(
+            user=user, id__in=list(notification_ids), is_read=False
+        ).update(is_read=True)
+        if updated:
+            NotificationCounter.objects.filter(user=user).update(unread=F("unread") - updated)
+    return updated
+
+
+def get_unread_count(user) -> int:
+    return (
+        NotificationCounter.objects.filter(user=user)
+        .values_list("unread", flat=True).first()
+    ) or 0
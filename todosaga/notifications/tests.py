@@ -0,0 +1,94 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from monsters.models import DailyBattle, Monster
+
+from .models import Notification
+from .services import notification_services
+from .services.notification_services import (
+    buffered_notifications, get_unread_count, list_notifications, mark_read, notify,
+)
+
+User = get_user_model()
+
+
+class NotificationCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("reader")
+        self.other = User.objects.create_user("bystander")
+
+    def send(self, user, count):
+        with self.captureOnCommitCallbacks(execute=True):
+            for n in range(count):
+                notify(user.id, Notification.QUEST, f"quest {n}")
+
+    def ids(self, user):
+        return sorted(Notification.objects.filter(user=user).values_list("id", flat=True))
+
+    def test_buffered_notifications_are_written_together(self):
+        with buffered_notifications():
+            # Commit callbacks run inside the block, as they do for a request
+            with self.captureOnCommitCallbacks(execute=True):
+                for user in (self.user, self.user, self.user, self.other):
+                    notify(user.id, Notification.BATTLE, "hit")
+            self.assertFalse(Notification.objects.exists())
+        self.assertEqual((get_unread_count(self.user), get_unread_count(self.other)), (3, 1))
+
+    def test_mark_read_decrements_by_rows_changed(self):
+        self.send(self.user, 3)
+        first, second, _ = self.ids(self.user)
+        # Duplicates count once
+        self.assertEqual(mark_read(self.user, [first, second, second]), 2)
+        self.assertEqual(get_unread_count(self.user), 1)
+
+    def test_mark_read_is_idempotent(self):
+        self.send(self.user, 2)
+        first, _ = self.ids(self.user)
+        mark_read(self.user, [first])
+        self.assertEqual(mark_read(self.user, [first]), 0)
+        self.assertEqual(get_unread_count(self.user), 1)
+
+    def test_mark_read_ignores_other_users_notifications(self):
+        self.send(self.user, 1)
+        self.send(self.other, 1)
+        self.assertEqual(mark_read(self.user, self.ids(self.other)), 0)
+        self.assertEqual((get_unread_count(self.user), get_unread_count(self.other)), (1, 1))
+
+    def test_counter_matches_unread_rows(self):
+        self.send(self.user, 5)
+        mark_read(self.user, self.ids(self.user)[:2])
+        self.send(self.user, 2)
+        self.assertEqual(get_unread_count(self.user), Notification.objects.filter(user=self.user, is_read=False).count())
+        self.assertEqual(len(list_notifications(self.user, unread_only=True)), 5)
+
+    def test_mark_read_query_count(self):
+        self.send(self.user, 2)
+        ids = self.ids(self.user)
+        # savepoint, UPDATE notifications, UPDATE counter, release
+        with self.assertNumQueries(4):
+            mark_read(self.user, ids)
+
+
+@override_settings(CORE_EVENT_BUS_ASYNC=False)
+class AsyncRequestBufferTests(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("retreater")
+        monster = Monster.objects.create(name="Golem", max_hp=100, reward_exp=150)
+        DailyBattle.objects.create(
+            user=self.user, date=timezone.localdate(), monster=monster, hp=0, status=DailyBattle.DEFEATED,
+        )
+
+    async def test_sync_view_notifications_are_written_together(self):
+        await self.async_client.aforce_login(self.user)
+        with mock.patch.object(notification_services, "_write", wraps=notification_services._write) as write:
+            response = await self.async_client.post("/monsters/daily/retreat")
+        self.assertEqual(response.status_code, 200)
+        # The battle result and the level-up it caused, in one batch
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(
+            sorted(notification.kind for notification in write.call_args.args[0]),
+            [Notification.BATTLE, Notification.LEVEL_UP],
+        )
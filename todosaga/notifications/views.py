@@ -0,0 +1,58 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+from .serializers import (
+    NotificationQuerySerializer,
+    NotificationSerializer,
+    MarkReadSerializer,
+    MarkReadResponseSerializer,
+    UnreadCountSerializer,
+)
+from .services.notification_services import get_unread_count, list_notifications, mark_read
+
+class NotificationListView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        query_serializer=NotificationQuerySerializer,
+        responses={200: NotificationSerializer(many=True)}
+    )
+    def get(self, request):
+        query = NotificationQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        notifications = list_notifications(
+            request.user,
+            unread_only=query.validated_data["unread"],
+            before=query.validated_data.get("before"),
+        )
+        return Response(NotificationSerializer(notifications, many=True).data, status=status.HTTP_200_OK)
+
+
+class NotificationMarkReadView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=MarkReadSerializer,
+        responses={200: MarkReadResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = MarkReadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        updated = mark_read(request.user, serializer.validated_data["notification_ids"])
+        return Response(
+            {"message": "Notifications marked as read", "updated": updated},
+            status=status.HTTP_200_OK,
+        )
+
+
+class NotificationUnreadCountView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: UnreadCountSerializer}
+    )
+    def get(self, request):
+        return Response({"unread": get_unread_count(request.user)}, status=status.HTTP_200_OK)
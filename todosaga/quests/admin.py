@@ -1,3 +1,7 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Quest
+
+@admin.register(Quest)
+class QuestAdmin(admin.ModelAdmin):
+    list_display = ("name", "counter_key", "target", "reward_gold")
@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.utils import timezone
+
+from core.events import CounterChanged, subscribe
+from items.services.item_services import credit_gold
+from notifications.models import Notification
+from notifications.services.notification_services import notify
+
+from .models import UserQuest
+
+
+@subscribe(CounterChanged)
+def complete_quests(changes):
+    """
+    바뀐 카운터에 걸린 진행 중 퀘스트만 잠그고 읽어, 수락 시점 대비 목표만큼 늘어난 것을 완료 처리하고
+    같은 트랜잭션에서 보상 골드를 사용자별로 합산해 지급하고 알림을 만듭니다.
+    """
+    values = {(change.user_id, change.key): change.value for change in changes}
+    now = timezone.now()
+    with transaction.atomic():
+        open_quests = UserQuest.objects.select_for_update(of=("self",)).filter(
+            user_id__in={change.user_id for change in changes},
+            quest__counter_key__in={change.key for change in changes},
+            completed_at__isnull=True,
+        ).select_related("quest")
+        completed = []
+        rewards = {}
+        for user_quest in open_quests:
+            value = values.get((user_quest.user_id, user_quest.quest.counter_key))
+            if value is not None and value - user_quest.baseline >= user_quest.quest.target:
+                user_quest.completed_at = now
+                completed.append(user_quest)
+                rewards[user_quest.user_id] = rewards.get(user_quest.user_id, 0) + user_quest.quest.reward_gold
+        UserQuest.objects.bulk_update(completed, ["completed_at"], batch_size=1000)
+        for user_id, gold in rewards.items():
+            credit_gold(user_id, gold)
+        for user_quest in completed:
+            notify(user_quest.user_id, Notification.QUEST, f"Quest completed: {user_quest.quest.name}")
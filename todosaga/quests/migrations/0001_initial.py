@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Quest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('counter_key', models.CharField(choices=[('todos_completed', 'todos_completed'), ('timers_started', 'timers_started'), ('monsters_defeated', 'monsters_defeated'), ('streak_current', 'streak_current'), ('streak_best', 'streak_best')], max_length=50)),
+                ('target', models.PositiveIntegerField()),
+                ('reward_gold', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserQuest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('baseline', models.BigIntegerField(default=0)),
+                ('accepted_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('quest', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_quests', to='quests.quest')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='quests', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('completed_at__isnull', True)), fields=['user'], name='user_quest_open_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'quest'), name='user_quest_unique')],
+            },
+        ),
+    ]
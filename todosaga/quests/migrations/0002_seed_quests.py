@@ -0,0 +1,31 @@
+from django.db import migrations
+
+QUESTS = [
+    ("First Blood", "Defeat your first monster", "monsters_defeated", 1, 50),
+    ("Busy Week", "Complete 20 Todos", "todos_completed", 20, 100),
+    ("Timekeeper", "Start 5 timers", "timers_started", 5, 50),
+]
+
+
+def seed(apps, schema_editor):
+    Quest = apps.get_model('quests', 'Quest')
+    Quest.objects.bulk_create([
+        Quest(name=name, description=description, counter_key=key, target=target, reward_gold=gold)
+        for name, description, key, target, gold in QUESTS
+    ])
+
+
+def unseed(apps, schema_editor):
+    Quest = apps.get_model('quests', 'Quest')
+    Quest.objects.filter(name__in=[row[0] for row in QUESTS]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quests', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
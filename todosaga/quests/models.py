@@ -1,3 +1,43 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from core.services.counter_services import COUNTER_KEYS
+
+COUNTER_CHOICES = [(key, key) for key in COUNTER_KEYS]
+
+class Quest(models.Model):
+    """Completed once `counter_key` grows by `target` after the user accepts it."""
+    name = models.CharField(max_length=100)
+    description = models.CharField(max_length=255, blank=True)
+    counter_key = models.CharField(max_length=50, choices=COUNTER_CHOICES)
+    target = models.PositiveIntegerField()
+    reward_gold = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.name
+
+class UserQuest(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="quests", db_index=False,
+    )
+    quest = models.ForeignKey(Quest, on_delete=models.CASCADE, related_name="user_quests")
+    # Counter value when the quest was accepted; progress is measured from here
+    baseline = models.BigIntegerField(default=0)
+    accepted_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "quest"], name="user_quest_unique"),
+        ]
+        indexes = [
+            # The evaluator only looks at quests still in progress
+            models.Index(
+                fields=["user"], name="user_quest_open_idx",
+                condition=models.Q(completed_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.quest_id}"
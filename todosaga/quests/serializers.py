@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+# Serializer for a quest with the user's progress
+class QuestSerializer(serializers.Serializer):
+    quest_id = serializers.IntegerField()
+    name = serializers.CharField()
+    description = serializers.CharField()
+    target = serializers.IntegerField()
+    accepted = serializers.BooleanField()
+    progress = serializers.IntegerField()
+    completed_at = serializers.DateTimeField(allow_null=True)
+
+# Serializer for the accept response
+class QuestAcceptResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
@@ -0,0 +1,47 @@
+from typing import Dict, List
+
+from django.db import IntegrityError, transaction
+
+from core.exceptions import NotFound, ServiceError
+from core.services.counter_services import get_counters
+
+from ..models import Quest, UserQuest
+
+
+def list_quests(user) -> List[Dict]:
+    """퀘스트 목록과 수락한 퀘스트의 진행도(수락 이후 증가분)를 반환합니다."""
+    counters = get_counters(user.id)
+    accepted = {
+        user_quest.quest_id: user_quest
+        for user_quest in UserQuest.objects.filter(user=user)
+    }
+    result = []
+    for quest in Quest.objects.order_by("id"):
+        user_quest = accepted.get(quest.id)
+        if user_quest is None:
+            progress = 0
+        else:
+            progress = min(counters.get(quest.counter_key, 0) - user_quest.baseline, quest.target)
+        result.append({
+            "quest_id": quest.id,
+            "name": quest.name,
+            "description": quest.description,
+            "target": quest.target,
+            "accepted": user_quest is not None,
+            "progress": progress,
+            "completed_at": user_quest.completed_at if user_quest else None,
+        })
+    return result
+
+
+def accept_quest(user, quest_id: int) -> UserQuest:
+    """퀘스트를 수락하고 현재 카운터 값을 기준점으로 저장합니다."""
+    quest = Quest.objects.filter(id=quest_id).first()
+    if quest is None:
+        raise NotFound("Quest not found.")
+    baseline = get_counters(user.id).get(quest.counter_key, 0)
+    try:
+        with transaction.atomic():
+            return UserQuest.objects.create(user=user, quest=quest, baseline=baseline)
+    except IntegrityError:
+        raise ServiceError("Quest already accepted.")
@@ -1,3 +1,42 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from core.events import TimerStarted, bus
+from core.services.counter_services import TIMERS_STARTED, counters_for_update
+from items.models import Wallet
+
+from .models import Quest, UserQuest
+
+User = get_user_model()
+
+
+class CompleteQuestTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("adventurer")
+        Quest.objects.all().delete()
+        # Three timers started before the quest was accepted
+        with counters_for_update([(self.user.id, TIMERS_STARTED)]) as counters:
+            counters.add(self.user.id, TIMERS_STARTED, 3)
+        quest = Quest.objects.create(name="Warm up", counter_key=TIMERS_STARTED, target=2, reward_gold=30)
+        self.user_quest = UserQuest.objects.create(user=self.user, quest=quest, baseline=3)
+
+    def start_timer(self):
+        with self.assertNoLogs("core.events", "ERROR"):
+            bus.dispatch([TimerStarted(self.user.id, 0, timezone.now())])
+        self.user_quest.refresh_from_db()
+
+    def gold(self):
+        return Wallet.objects.filter(user=self.user).values_list("gold", flat=True).first() or 0
+
+    def test_progress_counts_from_the_baseline(self):
+        self.start_timer()
+        self.assertIsNone(self.user_quest.completed_at)
+        self.start_timer()
+        self.assertIsNotNone(self.user_quest.completed_at)
+        self.assertEqual(self.gold(), 30)
+
+    def test_reward_is_paid_once(self):
+        for _ in range(4):
+            self.start_timer()
+        self.assertEqual(self.gold(), 30)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import QuestAcceptView, QuestListView
+
+urlpatterns = [
+    path('', QuestListView.as_view(), name='quest-list'),
+    path('<int:id>/accept', QuestAcceptView.as_view(), name='quest-accept'),
+]
@@ -1,3 +1,33 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from django.http import Http404
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import NotFound, ServiceError
+from .serializers import QuestAcceptResponseSerializer, QuestSerializer
+from .services.quest_services import accept_quest, list_quests
 
-# Create your views here.
+class QuestListView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: QuestSerializer(many=True)}
+    )
+    def get(self, request):
+        return Response(list_quests(request.user), status=status.HTTP_200_OK)
+
+
+class QuestAcceptView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: QuestAcceptResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request, id):
+        try:
+            accept_quest(request.user, id)
+        except NotFound:
+            raise Http404
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"message": "Quest accepted"}, status=status.HTTP_200_OK)
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from stats.services.activity_services import rebuild_activity
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-user daily activity bitmaps from completed Todo rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Users rebuilt per transaction.")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_activity(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt activity for {rebuilt} users"))
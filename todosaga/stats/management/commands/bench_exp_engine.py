@@ -0,0 +1,91 @@
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from stats.services.exp_engine import (
+    ABILITIES,
+    abilities_from_category_exp,
+    get_ability_matrix,
+    split_exp_matrix,
+    sum_by_user,
+    tiers_for,
+)
+from todos.services.todo_services import CATEGORIES
+
+
+def _loop_recompute(owners, gained, weights):
+    """Per-row pure Python version of the same recompute, used as the baseline."""
+    matrix = get_ability_matrix().tolist()
+    thresholds = settings.STATS_TIER_THRESHOLDS
+    totals = {}
+    for user_id, exp, row in zip(owners.tolist(), gained.tolist(), weights.tolist()):
+        total = sum(row)
+        shares = [w / total for w in row] if total else [
+            1.0 if c == "기타" else 0.0 for c in CATEGORIES
+        ]
+        raw = [exp * s for s in shares]
+        split = [int(r) for r in raw]
+        order = sorted(range(len(raw)), key=lambda i: -(raw[i] - split[i]))
+        for i in order[:exp - sum(split)]:
+            split[i] += 1
+        user_totals = totals.setdefault(user_id, [0] * len(CATEGORIES))
+        for i, value in enumerate(split):
+            user_totals[i] += value
+
+    result = {}
+    for user_id, category_exp in totals.items():
+        abilities = [
+            sum(category_exp[c] * matrix[c][a] for c in range(len(CATEGORIES)))
+            / settings.STATS_EXP_PER_ABILITY_POINT
+            for a in range(len(ABILITIES))
+        ]
+        tiers = [max(sum(1 for t in thresholds if t <= exp), 1) for exp in category_exp]
+        result[user_id] = (category_exp, abilities, tiers)
+    return result
+
+
+def _vectorized_recompute(owners, gained, weights):
+    unique_ids, totals = sum_by_user(owners, split_exp_matrix(gained, weights))
+    return unique_ids, totals, abilities_from_category_exp(totals), tiers_for(totals)
+
+
+class Command(BaseCommand):
+    help = "Compare the vectorized EXP engine against a per-row Python loop on synthetic completions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--completions", type=int, default=200_000)
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options["seed"])
+        n = options["completions"]
+        owners = rng.integers(1, options["users"] + 1, size=n)
+        gained = np.full(n, settings.STATS_COMPLETION_EXP, dtype=np.int64)
+        weights = rng.dirichlet(np.ones(len(CATEGORIES)), size=n)
+        # About one in ten completions is still unclassified
+        weights[rng.random(n) < 0.1] = 0
+
+        started = time.perf_counter()
+        baseline = _loop_recompute(owners, gained, weights)
+        loop_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        unique_ids, totals, abilities, tiers = _vectorized_recompute(owners, gained, weights)
+        vector_seconds = time.perf_counter() - started
+
+        for index, user_id in enumerate(unique_ids.tolist()):
+            category_exp, expected_abilities, expected_tiers = baseline[user_id]
+            if (totals[index].tolist() != category_exp
+                    or tiers[index].tolist() != expected_tiers
+                    or not np.allclose(abilities[index], expected_abilities)):
+                self.stderr.write(self.style.ERROR(f"Mismatch for user {user_id}"))
+                return
+
+        self.stdout.write(
+            f"{n} completions / {len(unique_ids)} users: "
+            f"loop {loop_seconds * 1000:.1f} ms, vectorized {vector_seconds * 1000:.1f} ms "
+            f"({loop_seconds / vector_seconds:.1f}x)"
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from stats.services.stat_services import rebuild_category_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-user, per-category EXP aggregate from completed Todo rows and ended battles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Users rebuilt per transaction.")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_category_stats(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt category stats for {rebuilt} users"))
@@ -1,3 +1,48 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+class UserCategoryStat(models.Model):
+    """
+    Per-user, per-category EXP aggregate. Maintained incrementally with F()
+    increments in the same transaction that completes a todo, and rebuilt from
+    Todo rows by the `reconcile_stats` command.
+    """
+    # The plain FK index is redundant with the (user, category) unique constraint
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="category_stats", db_index=False,
+    )
+    category = models.CharField(max_length=50)
+    total_exp = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "category"], name="user_category_stat_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.category}={self.total_exp}"
+
+
+class UserActivityMonth(models.Model):
+    """
+    One row per user per local (TIME_ZONE) calendar month. Bit d-1 of `days`
+    is set when the user completed at least one todo on day d, so streak and
+    heatmap queries read a handful of integers instead of Todo history.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="activity_months", db_index=False,
+    )
+    # Always the first day of the month
+    month = models.DateField()
+    days = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "month"], name="user_activity_month_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.month:%Y-%m}={self.days:031b}"
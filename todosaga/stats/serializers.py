@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+# Serializer for the per-category EXP response
+class UserCategoryStatSerializer(serializers.Serializer):
+    category = serializers.CharField()
+    total_exp = serializers.IntegerField()
+    current_tier = serializers.CharField()
+
+# Serializer for the ability score response
+class UserAbilitiesSerializer(serializers.Serializer):
+    STR = serializers.FloatField()
+    DEX = serializers.FloatField()
+    CON = serializers.FloatField()
+    INT = serializers.FloatField()
+    WIS = serializers.FloatField()
+    CHA = serializers.FloatField()
+
+# Serializer for the activity query parameters
+class UserActivityQuerySerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, data):
+        end = data.get("end") or timezone.localdate()
+        start = data.get("start") or end - timedelta(days=settings.STATS_ACTIVITY_DEFAULT_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError("start must not be after end.")
+        if (end - start).days + 1 > settings.STATS_ACTIVITY_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"Range must not exceed {settings.STATS_ACTIVITY_MAX_DAYS} days."
+            )
+        return {"start": start, "end": end}
+
+# Serializer for the activity (streak / heatmap) response
+class UserActivitySerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    current_streak = serializers.IntegerField()
+    active_days = serializers.IntegerField()
+    active_dates = serializers.ListField(child=serializers.DateField())
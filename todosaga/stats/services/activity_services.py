@@ -0,0 +1,205 @@
+from datetime import date, timedelta
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Case, DateField, F, IntegerField, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from todos.models import Todo
+
+from ..models import UserActivityMonth
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def _masks_by_month(days: Iterable[date]) -> Dict[date, int]:
+    """날짜들을 월별 비트마스크(일 d -> 비트 d-1)로 묶습니다."""
+    masks: Dict[date, int] = {}
+    for day in days:
+        month = _month_start(day)
+        masks[month] = masks.get(month, 0) | (1 << (day.day - 1))
+    return masks
+
+
+def record_activity(user_id: int, days: Iterable[date]):
+    """
+    활동한 날짜(로컬 날짜)들을 월별 비트맵에 원자적으로 OR 합니다.
+    award_exp와 같이 INSERT ... ON CONFLICT DO NOTHING 후 CASE 식을 쓴 UPDATE 한 번으로
+    처리하므로 쿼리는 항상 2개입니다. 호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+    """
+    masks = _masks_by_month(days)
+    if not masks:
+        return
+    UserActivityMonth.objects.bulk_create(
+        [UserActivityMonth(user_id=user_id, month=month) for month in masks],
+        ignore_conflicts=True,
+    )
+    UserActivityMonth.objects.filter(user_id=user_id, month__in=list(masks)).update(
+        days=F("days").bitor(Case(
+            *[When(month=month, then=Value(mask)) for month, mask in masks.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        ))
+    )
+
+
+def get_activity_bitmap(user_id: int, start: date, end: date) -> int:
+    """
+    start~end(양 끝 포함) 구간의 활동을 하나의 정수로 반환합니다. 비트 i는 start + i일입니다.
+    구간에 걸친 월 행만 읽으므로 비용은 O(개월 수)입니다.
+    """
+    bitmap = 0
+    rows = UserActivityMonth.objects.filter(
+        user_id=user_id, month__gte=_month_start(start), month__lte=end
+    ).values_list("month", "days")
+    for month, days in rows:
+        offset = (month - start).days
+        bitmap |= days << offset if offset >= 0 else days >> -offset
+    return bitmap & ((1 << ((end - start).days + 1)) - 1)
+
+
+def get_active_dates(user_id: int, start: date, end: date) -> List[date]:
+    """히트맵용: 구간 안에서 활동한 날짜 목록을 오름차순으로 반환합니다."""
+    bitmap = get_activity_bitmap(user_id, start, end)
+    active = []
+    while bitmap:
+        low = bitmap & -bitmap
+        active.append(start + timedelta(days=low.bit_length() - 1))
+        bitmap ^= low
+    return active
+
+
+def count_active_days(user_id: int, start: date, end: date) -> int:
+    return get_activity_bitmap(user_id, start, end).bit_count()
+
+
+def _trailing_run(days: int, last_day: int) -> int:
+    """비트 last_day-1부터 아래로 연속된 1의 개수를 셉니다."""
+    masked = days & ((1 << last_day) - 1)
+    # The highest zero at or below the start bit ends the run
+    zeros = ~masked & ((1 << last_day) - 1)
+    return last_day - zeros.bit_length()
+
+
+def get_current_streak(user_id: int, today: Optional[date] = None) -> int:
+    """
+    오늘(또는 아직 오늘 활동이 없으면 어제)까지 이어지는 연속 활동 일수를 반환합니다.
+    최근 월부터 거꾸로 읽다가 끊기는 월에서 멈추므로 전체 이력을 읽지 않습니다.
+    """
+    today = today or timezone.localdate()
+    rows = iter(
+        UserActivityMonth.objects.filter(user_id=user_id, month__lte=today)
+        .order_by("-month")
+        .values_list("month", "days")
+        .iterator(chunk_size=12)
+    )
+    first = next(rows, None)
+    if first is None:
+        return 0
+    month, days = first
+    cursor = today
+    if not (month == _month_start(today) and days >> (today.day - 1) & 1):
+        # Today not done yet: the streak is still alive if yesterday counts
+        cursor -= timedelta(days=1)
+    return _run_back(chain([first], rows), cursor)
+
+
+def get_latest_streaks(user_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    사용자별로 마지막 활동일에서 끝나는 연속 활동 일수를 반환합니다(활동이 없으면 0).
+    저장된 비트맵에서 세므로 완료가 어떤 순서로 반영되어도 결과가 같습니다. 월 행을 한 번의 쿼리로 읽습니다.
+    """
+    user_ids = list(user_ids)
+    months: Dict[int, List[Tuple[date, int]]] = {}
+    for user_id, month, days in (
+        UserActivityMonth.objects.filter(user_id__in=user_ids).exclude(days=0)
+        .order_by("user_id", "-month")
+        .values_list("user_id", "month", "days")
+    ):
+        months.setdefault(user_id, []).append((month, days))
+    streaks = {}
+    for user_id in user_ids:
+        rows = months.get(user_id)
+        if not rows:
+            streaks[user_id] = 0
+            continue
+        month, days = rows[0]
+        streaks[user_id] = _run_back(rows, month + timedelta(days=days.bit_length() - 1))
+    return streaks
+
+
+def _run_back(rows: Iterable[Tuple[date, int]], cursor: date) -> int:
+    """최근 월부터 받은 (month, days) 행에서 cursor 날짜부터 거꾸로 이어지는 연속 활동 일수를 셉니다."""
+    streak = 0
+    for month, days in rows:
+        if month > cursor:
+            continue
+        if month != _month_start(cursor):
+            break
+        run = _trailing_run(days, cursor.day)
+        streak += run
+        if run < cursor.day:
+            break
+        cursor = month - timedelta(days=1)
+    return streak
+
+
+def rebuild_activity(batch_size: int = 1000) -> int:
+    """
+    완료된 Todo의 completed_at(로컬 날짜)로부터 활동 비트맵 전체를 다시 만듭니다.
+    운영 중에 실행해도 비트를 잃지 않도록 rebuild_category_stats와 같이 사용자 batch_size명 단위의
+    트랜잭션 안에서 월 행을 먼저 잠근 뒤 원본을 읽고, 행을 지우지 않고 upsert로 덮어씁니다.
+    완료는 항상 지금의 로컬 날짜를 기록하므로 이번 달과 지난달 행을 미리 만들어 잠그면 진행 중인
+    record_activity와 모두 직렬화됩니다. 날짜별 중복 제거는 데이터베이스에서 하며, 원본이 없는 월은 0이 됩니다.
+    다시 만든 사용자 수를 반환합니다.
+    """
+    completed = Todo.objects.filter(completed=True, completed_at__isnull=False)
+    user_ids = sorted(
+        set(completed.values_list("user_id", flat=True).distinct())
+        | set(UserActivityMonth.objects.values_list("user_id", flat=True).distinct())
+    )
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        with transaction.atomic():
+            this_month = _month_start(timezone.localdate())
+            # The months a completion running now may record into
+            recent = [_month_start(this_month - timedelta(days=1)), this_month]
+            UserActivityMonth.objects.bulk_create(
+                [UserActivityMonth(user_id=user_id, month=month) for user_id in batch for month in recent],
+                ignore_conflicts=True,
+                batch_size=1000,
+            )
+            masks: Dict[Tuple[int, date], int] = {
+                key: 0 for key in UserActivityMonth.objects.select_for_update()
+                .filter(user_id__in=batch).values_list("user_id", "month")
+            }
+
+            rows = (
+                completed.filter(user_id__in=batch)
+                .annotate(day=TruncDate("completed_at", output_field=DateField()))
+                .values_list("user_id", "day")
+                .distinct()
+            )
+            days_by_user: Dict[int, List[date]] = {}
+            for user_id, day in rows:
+                days_by_user.setdefault(user_id, []).append(day)
+            for user_id, days in days_by_user.items():
+                for month, mask in _masks_by_month(days).items():
+                    masks[(user_id, month)] = mask
+
+            UserActivityMonth.objects.bulk_create(
+                [UserActivityMonth(user_id=user_id, month=month, days=mask) for (user_id, month), mask in masks.items()],
+                update_conflicts=True,
+                unique_fields=["user", "month"],
+                update_fields=["days"],
+                batch_size=1000,
+            )
+    return len(user_ids)
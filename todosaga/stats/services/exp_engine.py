@@ -0,0 +1,80 @@
+"""
+Vectorized EXP / ability / tier computations.
+
+Everything here works on NumPy arrays aligned to todos.services.todo_services.CATEGORIES
+(columns) so the same code serves one completion, one user, or a full-season
+recompute over every completed todo.
+"""
+import numpy as np
+from django.conf import settings
+
+from todos.services.todo_services import CATEGORIES
+
+ABILITIES = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
+
+# Completed todos that were never classified count toward this category
+UNCLASSIFIED_CATEGORY = "기타"
+_UNCLASSIFIED_INDEX = CATEGORIES.index(UNCLASSIFIED_CATEGORY)
+
+_ability_matrix = None
+
+
+def get_ability_matrix() -> np.ndarray:
+    """
+    settings.STATS_ABILITY_MATRIX ({카테고리: {능력치: 비중}})를 (카테고리 수 x 능력치 수) 행렬로 만듭니다.
+    각 행은 합이 1이 되도록 정규화되어, 카테고리 경험치 1이 능력치들에 나뉘어 들어갑니다.
+    """
+    global _ability_matrix
+    if _ability_matrix is None:
+        matrix = np.zeros((len(CATEGORIES), len(ABILITIES)), dtype=np.float64)
+        for row, category in enumerate(CATEGORIES):
+            for ability, weight in settings.STATS_ABILITY_MATRIX.get(category, {}).items():
+                matrix[row, ABILITIES.index(ability)] = weight
+        totals = matrix.sum(axis=1, keepdims=True)
+        uniform = np.full_like(matrix, 1.0 / len(ABILITIES))
+        _ability_matrix = np.divide(matrix, totals, out=uniform, where=totals > 0)
+    return _ability_matrix
+
+
+def split_exp_matrix(gained_exp: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    완료 N건의 경험치(길이 N)를 가중치 행렬(N x 카테고리 수)에 따라 정수로 나눕니다.
+    최대 나머지 방식으로 반올림하므로 각 행의 합은 항상 gained_exp와 같습니다.
+    가중치가 모두 0인 행(미분류 Todo)은 UNCLASSIFIED_CATEGORY에 전부 배분합니다.
+    """
+    gained_exp = np.asarray(gained_exp, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64).reshape(len(gained_exp), len(CATEGORIES))
+    totals = weights.sum(axis=1, keepdims=True)
+    unclassified = np.zeros_like(weights)
+    unclassified[:, _UNCLASSIFIED_INDEX] = 1.0
+    shares = np.divide(weights, totals, out=unclassified, where=totals > 0)
+
+    raw = gained_exp[:, None] * shares
+    floor = np.floor(raw)
+    remainder = raw - floor
+    shortfall = gained_exp - floor.sum(axis=1).astype(np.int64)
+    # Hand the leftover points to the largest remainders, one each
+    order = np.argsort(-remainder, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(CATEGORIES))[None, :].repeat(len(order), 0), axis=1)
+    return floor.astype(np.int64) + (ranks < shortfall[:, None])
+
+
+def sum_by_user(user_ids: np.ndarray, category_exp: np.ndarray):
+    """완료 건별 카테고리 경험치를 사용자별로 합산해 (고유 user_id 배열, 사용자 x 카테고리 행렬)을 반환합니다."""
+    unique_ids, inverse = np.unique(user_ids, return_inverse=True)
+    totals = np.zeros((len(unique_ids), category_exp.shape[1]), dtype=np.int64)
+    np.add.at(totals, inverse, category_exp)
+    return unique_ids, totals
+
+
+def abilities_from_category_exp(category_exp: np.ndarray) -> np.ndarray:
+    """(사용자 x 카테고리) 경험치 행렬을 (사용자 x 능력치) 행렬로 변환합니다."""
+    category_exp = np.atleast_2d(np.asarray(category_exp, dtype=np.float64))
+    return category_exp @ get_ability_matrix() / settings.STATS_EXP_PER_ABILITY_POINT
+
+
+def tiers_for(total_exp: np.ndarray) -> np.ndarray:
+    """경험치 배열의 각 원소에 대해 1부터 시작하는 티어 번호를 이진 탐색으로 구합니다."""
+    thresholds = np.asarray(settings.STATS_TIER_THRESHOLDS)
+    return np.maximum(np.searchsorted(thresholds, total_exp, side="right"), 1)
@@ -0,0 +1,144 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+from monsters.models import DailyBattle
+from notifications.models import Notification
+from notifications.services.notification_services import notify
+from todos.models import Todo
+from todos.services.todo_services import CATEGORIES
+
+from ..models import UserCategoryStat
+from .exp_engine import split_exp_matrix, sum_by_user, tiers_for
+
+
+def _weights_matrix(vectors) -> np.ndarray:
+    """Stacks stored weight vectors; unclassified todos (None) become zero rows."""
+    matrix = np.zeros((len(vectors), len(CATEGORIES)), dtype=np.float64)
+    for row, vector in enumerate(vectors):
+        if vector is not None:
+            matrix[row] = vector
+    return matrix
+
+
+def split_exp(gained_exp: int, weight_vector: Optional[np.ndarray]) -> Dict[str, int]:
+    """완료로 얻은 경험치를 Todo의 카테고리 가중치에 비례해 정수로 나눕니다."""
+    row = split_exp_matrix(np.array([gained_exp]), _weights_matrix([weight_vector]))[0]
+    return {category: int(exp) for category, exp in zip(CATEGORIES, row) if exp}
+
+
+def award_exp(user_id: int, exp_by_category: Dict[str, int]):
+    """
+    카테고리별 경험치를 집계 테이블에 원자적으로 더합니다.
+    없는 행을 INSERT ... ON CONFLICT DO NOTHING으로 만든 뒤, 모든 카테고리를
+    CASE 식을 쓴 UPDATE 한 번으로 F() 증가시키므로 쿼리는 항상 2개입니다.
+    호출하는 쪽의 트랜잭션 안에서 실행되어야 합니다.
+    """
+    exp_by_category = {c: exp for c, exp in exp_by_category.items() if exp}
+    if not exp_by_category:
+        return
+    UserCategoryStat.objects.bulk_create(
+        [UserCategoryStat(user_id=user_id, category=c) for c in exp_by_category],
+        ignore_conflicts=True,
+    )
+    UserCategoryStat.objects.filter(
+        user_id=user_id, category__in=list(exp_by_category)
+    ).update(
+        total_exp=F("total_exp") + Case(
+            *[When(category=c, then=Value(exp)) for c, exp in exp_by_category.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def award_completion_exp(user_id: int, completions: Iterable[tuple]):
+    """
+    (gained_exp, category_weight_vector) 쌍들을 한 번에 나누고 합산해 award_exp로 반영합니다.
+    반영 후 해당 카테고리 합계를 다시 읽어 티어가 오른 카테고리마다 레벨업 알림을 만듭니다.
+    """
+    completions = list(completions)
+    if not completions:
+        return
+    gained = np.array([gained_exp for gained_exp, _ in completions])
+    split = split_exp_matrix(gained, _weights_matrix([vector for _, vector in completions]))
+    added = {c: int(exp) for c, exp in zip(CATEGORIES, split.sum(axis=0)) if exp}
+    award_exp(user_id, added)
+
+    totals = dict(
+        UserCategoryStat.objects.filter(user_id=user_id, category__in=list(added))
+        .values_list("category", "total_exp")
+    )
+    categories = list(totals)
+    after = tiers_for(np.array([totals[c] for c in categories]))
+    before = tiers_for(np.array([totals[c] - added[c] for c in categories]))
+    for category, old, new in zip(categories, before, after):
+        if new > old:
+            notify(user_id, Notification.LEVEL_UP, f"{category} reached tier{int(new)}!")
+
+
+def get_tier(total_exp: int) -> str:
+    """STATS_TIER_THRESHOLDS 기준으로 현재 티어 이름을 반환합니다."""
+    return f"tier{int(tiers_for(np.array([total_exp]))[0])}"
+
+
+def rebuild_category_stats(batch_size: int = 1000) -> int:
+    """
+    완료된 Todo 행과 끝난 전투의 보상으로부터 집계 테이블 전체를 다시 계산합니다 (시즌 재계산).
+    운영 중에 실행해도 쓰기를 잃지 않도록, 사용자 batch_size명 단위의 트랜잭션 안에서 먼저 그 사용자들의
+    모든 카테고리 행을 만들어 잠근 뒤 원본을 읽습니다. award_exp는 항상 이 행들을 UPDATE하므로,
+    진행 중인 완료는 커밋될 때까지 기다렸다가 읽기에 포함되고, 잠근 뒤의 완료는 다시 쓴 값 위에 더해집니다.
+    경험치는 배열로 읽어 split_exp_matrix와 sum_by_user로 한 번에 계산하고, 행을 지우지 않고 upsert로 덮어씁니다
+    (지운 행을 기다리던 UPDATE는 아무 행도 바꾸지 못하므로). 원본이 없는 사용자의 행은 0이 됩니다.
+    전투 보상은 카테고리 가중치가 없으므로 retreat에서와 같이 UNCLASSIFIED_CATEGORY로 들어갑니다.
+    다시 계산한 사용자 수를 반환합니다.
+    """
+    completed = Todo.objects.filter(completed=True)
+    rewarded = DailyBattle.objects.filter(status=DailyBattle.ENDED, gained_exp__gt=0)
+    user_ids = sorted(
+        set(completed.values_list("user_id", flat=True).distinct())
+        | set(rewarded.values_list("user_id", flat=True).distinct())
+        | set(UserCategoryStat.objects.values_list("user_id", flat=True).distinct())
+    )
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        with transaction.atomic():
+            # Every row award_exp could touch exists and is locked before the sources are read
+            UserCategoryStat.objects.bulk_create(
+                [UserCategoryStat(user_id=user_id, category=category) for user_id in batch for category in CATEGORIES],
+                ignore_conflicts=True,
+                batch_size=1000,
+            )
+            list(UserCategoryStat.objects.select_for_update().filter(user_id__in=batch).values_list("id"))
+
+            rows = list(
+                completed.filter(user_id__in=batch)
+                .values_list("user_id", "gained_exp", "category_weights")
+            )
+            rows += [
+                (user_id, gained_exp, None)
+                for user_id, gained_exp in rewarded.filter(user_id__in=batch).values_list("user_id", "gained_exp")
+            ]
+            owners = np.array([user_id for user_id, _, _ in rows], dtype=np.int64)
+            gained = np.array([gained_exp for _, gained_exp, _ in rows], dtype=np.int64)
+            weights = _weights_matrix([
+                None if blob is None else np.frombuffer(bytes(blob), dtype="<f4")
+                for _, _, blob in rows
+            ])
+            unique_ids, totals = sum_by_user(owners, split_exp_matrix(gained, weights))
+            by_user = {int(user_id): row for user_id, row in zip(unique_ids, totals)}
+
+            UserCategoryStat.objects.bulk_create(
+                [
+                    UserCategoryStat(user_id=user_id, category=category, total_exp=int(exp))
+                    for user_id in batch
+                    for category, exp in zip(CATEGORIES, by_user.get(user_id, np.zeros(len(CATEGORIES))))
+                ],
+                update_conflicts=True,
+                unique_fields=["user", "category"],
+                update_fields=["total_exp", "updated_at"],
+                batch_size=1000,
+            )
+    return len(user_ids)
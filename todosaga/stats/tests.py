@@ -1,3 +1,234 @@
-from django.test import TestCase
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
+
+from notifications.models import Notification
+from todos.models import Todo
+from todos.services.todo_services import CATEGORIES
+from todos.services.transition_services import complete_todo
+
+from .models import UserActivityMonth, UserCategoryStat
+from .services.activity_services import (
+    count_active_days, get_active_dates, get_current_streak, rebuild_activity, record_activity,
+)
+from .services.exp_engine import (
+    ABILITIES, UNCLASSIFIED_CATEGORY, abilities_from_category_exp, split_exp_matrix, sum_by_user, tiers_for,
+)
+from .services.stat_services import award_completion_exp, award_exp, rebuild_category_stats, split_exp
+
+User = get_user_model()
+
+
+def category_totals(user):
+    # A rebuild keeps a zero row for every category
+    return dict(UserCategoryStat.objects.filter(user=user, total_exp__gt=0).values_list("category", "total_exp"))
+
+
+@override_settings(CORE_EVENT_BUS_ASYNC=False, STATS_COMPLETION_EXP=10)
+class CategoryStatTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("grinder")
+
+    def create_todo(self, weights=None):
+        todo = Todo.objects.create(user=self.user, title="t", type=Todo.CHECK)
+        if weights is not None:
+            todo.category_weight_vector = weights
+            todo.save(update_fields=["category_weights"])
+        return todo
+
+    def test_incremental_totals_match_rebuild(self):
+        for weights in ([1.0] + [0.0] * 9, [0.5, 0.5] + [0.0] * 8, [0.0, 1 / 3, 1 / 3, 1 / 3] + [0.0] * 6, None):
+            complete_todo(self.user, self.create_todo(weights).id)
+        # Never completed, so never counted
+        self.create_todo([1.0] + [0.0] * 9)
+        incremental = category_totals(self.user)
+        self.assertEqual(sum(incremental.values()), 40)
+
+        UserCategoryStat.objects.filter(user=self.user).update(total_exp=0)
+        self.assertEqual(rebuild_category_stats(), 1)
+        self.assertEqual(category_totals(self.user), incremental)
+
+    def test_rebuild_zeroes_users_without_completions(self):
+        award_exp(self.user.id, {CATEGORIES[0]: 5})
+        self.assertEqual(rebuild_category_stats(), 1)
+        self.assertEqual(category_totals(self.user), {})
+
+    def test_rebuild_updates_rows_in_place(self):
+        complete_todo(self.user, self.create_todo([1.0] + [0.0] * 9).id)
+        row_id = UserCategoryStat.objects.get(user=self.user, category=CATEGORIES[0]).id
+        rebuild_category_stats()
+        # A completion waiting on the row lock would update nothing if the row had been replaced
+        self.assertEqual(UserCategoryStat.objects.get(user=self.user, category=CATEGORIES[0]).id, row_id)
+        self.assertEqual(UserCategoryStat.objects.filter(user=self.user).count(), len(CATEGORIES))
+        complete_todo(self.user, self.create_todo([1.0] + [0.0] * 9).id)
+        self.assertEqual(category_totals(self.user), {CATEGORIES[0]: 20})
+
+    def test_award_exp_adds_to_existing_rows(self):
+        award_exp(self.user.id, {CATEGORIES[0]: 5, CATEGORIES[1]: 0})
+        # INSERT ... ON CONFLICT DO NOTHING, then one UPDATE
+        with self.assertNumQueries(2):
+            award_exp(self.user.id, {CATEGORIES[0]: 5, CATEGORIES[2]: 7})
+        self.assertEqual(category_totals(self.user), {CATEGORIES[0]: 10, CATEGORIES[2]: 7})
+
+    def test_level_up_notifies_once_per_tier(self):
+        weights = [1.0] + [0.0] * 9
+        with self.captureOnCommitCallbacks(execute=True):
+            award_completion_exp(self.user.id, [(90, weights)])
+            award_completion_exp(self.user.id, [(10, weights)])
+            award_completion_exp(self.user.id, [(10, weights)])
+        self.assertEqual(
+            list(Notification.objects.filter(user=self.user).values_list("kind", "message")),
+            [(Notification.LEVEL_UP, f"{CATEGORIES[0]} reached tier2!")],
+        )
+
+
+@skipUnlessDBFeature("has_select_for_update")
+@override_settings(CORE_EVENT_BUS_ASYNC=False, STATS_COMPLETION_EXP=10)
+class RebuildDuringCompletionTests(TransactionTestCase):
+    def create_todo(self, user):
+        todo = Todo.objects.create(user=user, title="t", type=Todo.CHECK)
+        todo.category_weight_vector = [1.0] + [0.0] * 9
+        todo.save(update_fields=["category_weights"])
+        return todo
+
+    @contextmanager
+    def complete_after_source_read(self, user, todo):
+        """Another request completes `todo` once the rebuild has read a batch's completed todos."""
+        completer = threading.Thread(target=lambda: (complete_todo(user, todo.id), connection.close()))
+
+        def wrapper(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if 'FROM "todos_todo"' in sql and '"user_id" IN (' in sql and completer.ident is None:
+                completer.start()
+                # Blocks on the rebuild's locks when they are taken before the read
+                completer.join(timeout=1)
+            return result
+
+        with connection.execute_wrapper(wrapper):
+            yield
+        completer.join()
+
+    def test_completion_between_read_and_write_is_kept(self):
+        user = User.objects.create_user("busy")
+        complete_todo(user, self.create_todo(user).id)
+        with self.complete_after_source_read(user, self.create_todo(user)):
+            rebuild_category_stats()
+        self.assertEqual(category_totals(user), {CATEGORIES[0]: 20})
+
+    def test_activity_recorded_between_read_and_write_is_kept(self):
+        user = User.objects.create_user("early")
+        # Yesterday's activity only, so today's bit comes from the late completion alone
+        yesterday = timezone.localdate() - timedelta(days=1)
+        Todo.objects.create(
+            user=user, title="t", type=Todo.CHECK, completed=True,
+            completed_at=timezone.make_aware(datetime.combine(yesterday, time(12))),
+        )
+        record_activity(user.id, [yesterday])
+        with self.complete_after_source_read(user, self.create_todo(user)):
+            rebuild_activity()
+        self.assertEqual(get_active_dates(user.id, yesterday, timezone.localdate()), [yesterday, timezone.localdate()])
+
+
+class ExpEngineTests(SimpleTestCase):
+    def test_split_preserves_each_total(self):
+        rng = np.random.default_rng(0)
+        gained = rng.integers(0, 1000, size=200)
+        weights = rng.random((200, len(CATEGORIES))) * (rng.random((200, len(CATEGORIES))) < 0.3)
+        split = split_exp_matrix(gained, weights)
+        self.assertEqual(split.dtype, np.int64)
+        self.assertTrue((split >= 0).all())
+        np.testing.assert_array_equal(split.sum(axis=1), gained)
+
+    def test_largest_remainders_get_the_leftover(self):
+        # 10 split three ways: 3.33 each, one leftover point to the first (stable order)
+        weights = [0.0] * len(CATEGORIES)
+        weights[1:4] = [1.0, 1.0, 1.0]
+        self.assertEqual(split_exp(10, np.array(weights)), dict(zip(CATEGORIES[1:4], [4, 3, 3])))
+        weights[1:4] = [0.2, 0.5, 0.3]
+        self.assertEqual(split_exp(7, np.array(weights)), dict(zip(CATEGORIES[1:4], [1, 4, 2])))
+
+    def test_unclassified_goes_to_the_fallback_category(self):
+        self.assertEqual(split_exp(10, None), {UNCLASSIFIED_CATEGORY: 10})
+        self.assertEqual(split_exp(10, np.zeros(len(CATEGORIES))), {UNCLASSIFIED_CATEGORY: 10})
+
+    def test_sum_by_user(self):
+        user_ids, totals = sum_by_user(np.array([7, 3, 7]), np.array([[1, 0], [0, 2], [4, 5]]))
+        np.testing.assert_array_equal(user_ids, [3, 7])
+        np.testing.assert_array_equal(totals, [[0, 2], [5, 5]])
+
+    @override_settings(STATS_TIER_THRESHOLDS=[0, 100, 300])
+    def test_tiers(self):
+        np.testing.assert_array_equal(tiers_for(np.array([-5, 0, 99, 100, 299, 300, 10 ** 6])), [1, 1, 1, 2, 2, 3, 3])
+
+    def test_abilities_follow_the_matrix(self):
+        exp = np.zeros(len(CATEGORIES))
+        exp[CATEGORIES.index(UNCLASSIFIED_CATEGORY)] = 60
+        abilities = abilities_from_category_exp(exp)
+        self.assertEqual(abilities.shape, (1, len(ABILITIES)))
+        # Spread evenly over the six abilities, 10 EXP per point
+        np.testing.assert_allclose(abilities[0], np.ones(len(ABILITIES)))
+
+
+class ActivityBitmapTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("regular")
+
+    def test_active_dates_across_months(self):
+        days = [date(2026, 1, 31), date(2026, 2, 1), date(2026, 2, 28), date(2026, 3, 1), date(2026, 3, 31)]
+        record_activity(self.user.id, days)
+        # Recording again changes nothing
+        record_activity(self.user.id, days[:2])
+        self.assertEqual(get_active_dates(self.user.id, date(2026, 1, 1), date(2026, 3, 31)), days)
+        # The range clips partial months on both ends
+        self.assertEqual(
+            get_active_dates(self.user.id, date(2026, 2, 1), date(2026, 3, 1)),
+            [date(2026, 2, 1), date(2026, 2, 28), date(2026, 3, 1)],
+        )
+        self.assertEqual(count_active_days(self.user.id, date(2026, 1, 31), date(2026, 2, 28)), 3)
+
+    def test_record_activity_is_two_queries(self):
+        with self.assertNumQueries(2):
+            record_activity(self.user.id, [date(2026, 1, 31), date(2026, 2, 1)])
+
+    def test_current_streak(self):
+        record_activity(self.user.id, [date(2026, 2, 27), date(2026, 2, 28), date(2026, 3, 1), date(2026, 3, 2)])
+        self.assertEqual(get_current_streak(self.user.id, date(2026, 3, 2)), 4)
+        # Today not done yet: yesterday still counts
+        self.assertEqual(get_current_streak(self.user.id, date(2026, 3, 3)), 4)
+        self.assertEqual(get_current_streak(self.user.id, date(2026, 3, 4)), 0)
+        self.assertEqual(get_current_streak(self.user.id, date(2026, 2, 28)), 2)
+
+    def test_full_month_streak(self):
+        record_activity(self.user.id, [date(2026, 1, day) for day in range(1, 32)] + [date(2026, 2, 1)])
+        self.assertEqual(get_current_streak(self.user.id, date(2026, 2, 1)), 32)
+
+    def test_rebuild_matches_recorded_activity(self):
+        days = [date(2026, 1, 31), date(2026, 2, 1), date(2026, 2, 1), date(2026, 3, 15)]
+        for day in days:
+            Todo.objects.create(
+                user=self.user, title="t", type=Todo.CHECK, completed=True,
+                completed_at=timezone.make_aware(datetime.combine(day, time(23, 30))),
+            )
+        record_activity(self.user.id, days)
+        recorded = list(UserActivityMonth.objects.filter(user=self.user).order_by("month").values_list("month", "days"))
+        UserActivityMonth.objects.filter(user=self.user).delete()
+        self.assertEqual(rebuild_activity(), 1)
+        # The rebuild also leaves empty rows for this month and the last one
+        self.assertEqual(
+            list(
+                UserActivityMonth.objects.filter(user=self.user).exclude(days=0)
+                .order_by("month").values_list("month", "days")
+            ),
+            recorded,
+        )
+
+    def test_rebuild_clears_months_without_completions(self):
+        record_activity(self.user.id, [date(2026, 1, 31)])
+        self.assertEqual(rebuild_activity(), 1)
+        self.assertEqual(get_active_dates(self.user.id, date(2026, 1, 1), date(2026, 1, 31)), [])
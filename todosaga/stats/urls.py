@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import UserAbilitiesView, UserActivityView, UserCategoryStatsView
+
+urlpatterns = [
+    path('user-activity', UserActivityView.as_view(), name='user-activity'),
+    path('user-abilities', UserAbilitiesView.as_view(), name='user-abilities'),
+    path('user-category-stats', UserCategoryStatsView.as_view(), name='user-category-stats'),
+]
@@ -1,3 +1,78 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from drf_yasg.utils import swagger_auto_schema
+import numpy as np
+from todos.services.todo_services import CATEGORIES
+from .models import UserCategoryStat
+from .serializers import (
+    UserAbilitiesSerializer,
+    UserActivityQuerySerializer,
+    UserActivitySerializer,
+    UserCategoryStatSerializer,
+)
+from .services.activity_services import get_active_dates, get_current_streak
+from .services.exp_engine import ABILITIES, abilities_from_category_exp
+from .services.stat_services import get_tier
 
-# Create your views here.
+class UserCategoryStatsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: UserCategoryStatSerializer(many=True)}
+    )
+    def get(self, request):
+        # Reads only the aggregate rows: at most one per category
+        totals = dict(
+            UserCategoryStat.objects.filter(user=request.user)
+            .values_list("category", "total_exp")
+        )
+        result = [
+            {
+                "category": category,
+                "total_exp": totals.get(category, 0),
+                "current_tier": get_tier(totals.get(category, 0)),
+            }
+            for category in CATEGORIES
+        ]
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class UserAbilitiesView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: UserAbilitiesSerializer}
+    )
+    def get(self, request):
+        totals = dict(
+            UserCategoryStat.objects.filter(user=request.user)
+            .values_list("category", "total_exp")
+        )
+        category_exp = np.array([totals.get(category, 0) for category in CATEGORIES])
+        abilities = abilities_from_category_exp(category_exp)[0]
+        result = {ability: round(float(value), 1) for ability, value in zip(ABILITIES, abilities)}
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class UserActivityView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        query_serializer=UserActivityQuerySerializer,
+        responses={200: UserActivitySerializer}
+    )
+    def get(self, request):
+        query = UserActivityQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        start, end = query.validated_data["start"], query.validated_data["end"]
+        active_dates = get_active_dates(request.user.id, start, end)
+        result = {
+            "start": start,
+            "end": end,
+            "current_streak": get_current_streak(request.user.id),
+            "active_days": len(active_dates),
+            "active_dates": active_dates,
+        }
+        return Response(result, status=status.HTTP_200_OK)
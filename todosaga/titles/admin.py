@@ -1,3 +1,7 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Title
+
+@admin.register(Title)
+class TitleAdmin(admin.ModelAdmin):
+    list_display = ("name", "counter_key", "target")
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TitlesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'titles'
+
+    def ready(self):
+        from . import evaluators  # noqa: F401
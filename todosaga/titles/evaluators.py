@@ -0,0 +1,17 @@
+from core.events import CounterChanged, subscribe
+from core.services.counter_services import grant_reached
+from notifications.models import Notification
+from notifications.services.notification_services import notify
+
+from .models import Title, UserTitle
+
+
+@subscribe(CounterChanged)
+def grant_titles(changes):
+    """
+    바뀐 카운터 키에 걸린 칭호만 조회해, 목표에 도달했지만 아직 없는 것을 부여하고
+    실제로 새로 얻은 칭호마다 알림을 만듭니다.
+    """
+    rules = Title.objects.filter(counter_key__in={change.key for change in changes})
+    for user_id, title in grant_reached(changes, rules, UserTitle, "title"):
+        notify(user_id, Notification.TITLE, f"New title acquired: {title.name}")
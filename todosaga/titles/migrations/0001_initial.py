@@ -0,0 +1,40 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Title',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('counter_key', models.CharField(choices=[('todos_completed', 'todos_completed'), ('timers_started', 'timers_started'), ('monsters_defeated', 'monsters_defeated'), ('streak_current', 'streak_current'), ('streak_best', 'streak_best')], max_length=50)),
+                ('target', models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserTitle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('acquired_at', models.DateTimeField(auto_now_add=True)),
+                ('is_selected', models.BooleanField(default=False)),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holders', to='titles.title')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='titles', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'title'), name='user_title_unique'), models.UniqueConstraint(condition=models.Q(('is_selected', True)), fields=('user',), name='user_title_one_selected')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+TITLES = [
+    ("Bronze Worker", "Complete 50 Todos", "todos_completed", 50),
+    ("Silver Worker", "Complete 300 Todos", "todos_completed", 300),
+    ("Gold Worker", "Complete 1000 Todos", "todos_completed", 1000),
+    ("Steadfast", "Keep a 14-day completion streak", "streak_best", 14),
+    ("Monster Hunter", "Defeat 10 monsters", "monsters_defeated", 10),
+]
+
+
+def seed(apps, schema_editor):
+    Title = apps.get_model('titles', 'Title')
+    Title.objects.bulk_create([
+        Title(name=name, description=description, counter_key=key, target=target)
+        for name, description, key, target in TITLES
+    ])
+
+
+def unseed(apps, schema_editor):
+    Title = apps.get_model('titles', 'Title')
+    Title.objects.filter(name__in=[row[0] for row in TITLES]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('titles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -1,3 +1,38 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from core.services.counter_services import COUNTER_KEYS
+
+COUNTER_CHOICES = [(key, key) for key in COUNTER_KEYS]
+
+class Title(models.Model):
+    """Granted once the user's `counter_key` counter reaches `target`."""
+    name = models.CharField(max_length=100)
+    description = models.CharField(max_length=255, blank=True)
+    counter_key = models.CharField(max_length=50, choices=COUNTER_CHOICES)
+    target = models.PositiveIntegerField()
+
+    def __str__(self):
+        return self.name
+
+class UserTitle(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="titles", db_index=False,
+    )
+    title = models.ForeignKey(Title, on_delete=models.CASCADE, related_name="holders")
+    acquired_at = models.DateTimeField(auto_now_add=True)
+    is_selected = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "title"], name="user_title_unique"),
+            # At most one representative title per user
+            models.UniqueConstraint(
+                fields=["user"], condition=models.Q(is_selected=True),
+                name="user_title_one_selected",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.title_id}"
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+# Serializer for an acquired title
+class UserTitleSerializer(serializers.Serializer):
+    title_id = serializers.IntegerField()
+    name = serializers.CharField()
+    acquired_date = serializers.DateField()
+    is_selected = serializers.BooleanField()
+
+# Serializer for selecting the representative title
+class TitleSelectSerializer(serializers.Serializer):
+    title_id = serializers.IntegerField()
+
+# Serializer for the select response
+class TitleSelectResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
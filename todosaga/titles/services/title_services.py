@@ -0,0 +1,23 @@
+from typing import List
+
+from django.db import transaction
+
+from core.exceptions import ServiceError
+
+from ..models import UserTitle
+
+
+def list_user_titles(user) -> List[UserTitle]:
+    return list(UserTitle.objects.filter(user=user).select_related("title").order_by("acquired_at"))
+
+
+def select_title(user, title_id: int):
+    """보유한 칭호 하나를 대표 칭호로 설정합니다. 기존 대표 칭호 해제와 설정을 한 트랜잭션에서 처리합니다."""
+    with transaction.atomic():
+        owned = UserTitle.objects.select_for_update().filter(user=user, title_id=title_id).first()
+        if owned is None:
+            raise ServiceError("Title not acquired.")
+        if owned.is_selected:
+            return
+        UserTitle.objects.filter(user=user, is_selected=True).update(is_selected=False)
+        UserTitle.objects.filter(id=owned.id).update(is_selected=True)
@@ -1,3 +1,25 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from core.events import TimerStarted, bus
+from core.services.counter_services import TIMERS_STARTED
+
+from .models import Title, UserTitle
+
+User = get_user_model()
+
+
+class GrantTitleTests(TestCase):
+    def test_granted_once_per_user(self):
+        users = [User.objects.create_user(f"timer-{i}") for i in range(2)]
+        Title.objects.create(name="Clockwork", counter_key=TIMERS_STARTED, target=2)
+        for events in (
+            [TimerStarted(users[0].id, 0, timezone.now())] * 2 + [TimerStarted(users[1].id, 0, timezone.now())],
+            [TimerStarted(users[0].id, 0, timezone.now())],
+        ):
+            with self.assertNoLogs("core.events", "ERROR"):
+                bus.dispatch(events)
+        self.assertQuerySetEqual(
+            UserTitle.objects.values_list("user__username", "title__name"), [("timer-0", "Clockwork")]
+        )
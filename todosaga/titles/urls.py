@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import MyTitlesView, TitleSelectView
+
+urlpatterns = [
+    path('my', MyTitlesView.as_view(), name='title-my'),
+    path('select', TitleSelectView.as_view(), name='title-select'),
+]
@@ -1,3 +1,44 @@
-from django.shortcuts import render
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, permissions
+from django.utils import timezone
+from drf_yasg.utils import swagger_auto_schema
+from core.exceptions import ServiceError
+from .serializers import TitleSelectResponseSerializer, TitleSelectSerializer, UserTitleSerializer
+from .services.title_services import list_user_titles, select_title
 
-# Create your views here.
+class MyTitlesView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: UserTitleSerializer(many=True)}
+    )
+    def get(self, request):
+        result = [
+            {
+                "title_id": user_title.title_id,
+                "name": user_title.title.name,
+                "acquired_date": timezone.localdate(user_title.acquired_at),
+                "is_selected": user_title.is_selected,
+            }
+            for user_title in list_user_titles(request.user)
+        ]
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class TitleSelectView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=TitleSelectSerializer,
+        responses={200: TitleSelectResponseSerializer, 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = TitleSelectSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            select_title(request.user, serializer.validated_data["title_id"])
+        except ServiceError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"message": "Title selected"}, status=status.HTTP_200_OK)
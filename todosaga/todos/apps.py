@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TodosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'todos'
+
+    def ready(self):
+        from core.metrics import registry
+        from .services.cache_services import recommendation_cache_metrics
+
+        registry.register_collector(recommendation_cache_metrics)
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from todos.models import Todo
+from todos.services.classification_queue import classify_and_store
+
+
+class Command(BaseCommand):
+    help = "Classify existing todos that have no stored category weights, in bulk batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        scanned = stored = 0
+        while True:
+            # Keyset walk over the partial index on unclassified rows
+            ids = list(
+                Todo.objects.filter(category_weights__isnull=True, id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            scanned += len(ids)
+            stored += classify_and_store(ids)
+            self.stdout.write(f"classified {stored}/{scanned} todos")
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {stored} classified, {scanned - stored} left unclassified"
+        ))
@@ -0,0 +1,99 @@
+import asyncio
+import multiprocessing
+import secrets
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from core.metrics import llm_request_duration
+
+# Time for forked processes to build the chain before the burst starts together
+START_DELAY = 3.0
+
+
+def _upstream_calls() -> int:
+    return sum(llm_request_duration.count(("recommendation", outcome)) for outcome in ("ok", "error"))
+
+
+def _burst(todo_list: str, requests: int, start_at: float):
+    """Sends `requests` concurrent identical recommendation calls at start_at. Returns (upstream calls, latencies, errors)."""
+    from todos.services.todo_services import aget_todo_recommendations
+
+    async def run():
+        # Warm up on a different key so imports and client setup are not timed
+        await aget_todo_recommendations(f"- warmup {secrets.token_hex(8)}")
+        before = _upstream_calls()
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+
+        async def one():
+            started = time.perf_counter()
+            await aget_todo_recommendations(todo_list)
+            return time.perf_counter() - started
+
+        results = await asyncio.gather(*(one() for _ in range(requests)), return_exceptions=True)
+        latencies = [r for r in results if isinstance(r, float)]
+        errors = [type(r).__name__ for r in results if isinstance(r, BaseException)]
+        return _upstream_calls() - before, latencies, errors
+
+    return asyncio.run(run())
+
+
+class Command(BaseCommand):
+    help = (
+        "Send many concurrent identical recommendation requests that miss the cache and count the "
+        "upstream LLM calls they cause, to check request coalescing (TODO_SINGLE_FLIGHT). Uses "
+        "FakeLLMProvider, so no tokens are spent. With --processes the burst is split over forked "
+        "processes, which only coalesce with CacheLockSingleFlight on a shared cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100, help="Concurrent requests per process.")
+        parser.add_argument("--processes", type=int, default=1)
+        parser.add_argument("--latency", type=float, default=0.5, help="Seconds per fake LLM call.")
+        parser.add_argument("--backend", default=None,
+                            help="Override TODO_SINGLE_FLIGHT's BACKEND, e.g. todos.services.single_flight.SingleFlight.")
+        parser.add_argument("--expect-calls", type=int, default=None,
+                            help="Fail unless the burst causes exactly this many upstream calls.")
+
+    def handle(self, *args, **options):
+        # Set before the provider and single-flight singletons are first built (also in forked processes)
+        settings.TODO_LLM_PROVIDER = {
+            "BACKEND": "todos.services.llm_provider.FakeLLMProvider",
+            "LATENCY": options["latency"],
+        }
+        if options["backend"]:
+            settings.TODO_SINGLE_FLIGHT = {**settings.TODO_SINGLE_FLIGHT, "BACKEND": options["backend"]}
+
+        # A fresh todo list so the recommendation cache misses
+        todo_list = f"- bench single flight {secrets.token_hex(8)}"
+        processes, requests = options["processes"], options["requests"]
+        if processes == 1:
+            results = [_burst(todo_list, requests, time.time())]
+        else:
+            connections.close_all()
+            start_at = time.time() + START_DELAY
+            with ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("fork")) as pool:
+                futures = [pool.submit(_burst, todo_list, requests, start_at) for _ in range(processes)]
+                results = [future.result() for future in futures]
+
+        calls = sum(result[0] for result in results)
+        latencies = sorted(latency for result in results for latency in result[1])
+        errors = [error for result in results for error in result[2]]
+        self.stdout.write(
+            f"{processes * requests} identical requests ({processes} process(es) x {requests}) "
+            f"through {settings.TODO_SINGLE_FLIGHT['BACKEND'].rsplit('.', 1)[-1]}: "
+            f"{calls} upstream call(s)"
+        )
+        if latencies:
+            self.stdout.write(
+                f"  latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+                f"max {latencies[-1] * 1000:.1f} ms"
+            )
+        if errors:
+            self.stdout.write(f"  errors: {', '.join(sorted(set(errors)))} x{len(errors)}")
+        if options["expect_calls"] is not None and calls != options["expect_calls"]:
+            raise CommandError(f"Expected {options['expect_calls']} upstream call(s), got {calls}")
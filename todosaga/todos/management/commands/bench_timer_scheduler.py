@@ -0,0 +1,96 @@
+import random
+import statistics
+import threading
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from todos.models import Todo
+from todos.services.timer_scheduler import TimerScheduler
+from todos.services.transition_services import complete_expired_timers
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the timer scheduler with many running timers: startup load through the "
+        "running-timer index, expiry of one batch through the real handler, and firing lag "
+        "of the scheduler thread. Database rows are created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--timers", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=1_000)
+        parser.add_argument("--lag-timers", type=int, default=20_000,
+                            help="In-memory timers due over --lag-window seconds for the lag test.")
+        parser.add_argument("--lag-window", type=float, default=5.0)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        User = get_user_model()
+        now = timezone.now()
+
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(username=f"bench-timer-{i}") for i in range(options["users"])
+            ])
+            if users[0].pk is None:
+                users = list(User.objects.filter(username__startswith="bench-timer-"))
+            # Half already expired, half due within the next hour
+            Todo.objects.bulk_create([
+                Todo(
+                    user=rng.choice(users), title=f"timer {i}", type=Todo.TIMER,
+                    duration_seconds=rng.randrange(60, 3600),
+                    start_time=now - timedelta(seconds=rng.randrange(0, 3600)),
+                )
+                for i in range(options["timers"])
+            ], batch_size=5000)
+
+            scheduler = TimerScheduler(handler=lambda todo_ids: None)
+            started = time.perf_counter()
+            loaded = scheduler.load()
+            load_elapsed = time.perf_counter() - started
+
+            due = scheduler.pop_due(time.time())
+            started = time.perf_counter()
+            completed = complete_expired_timers(due)
+            fire_elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"load: {loaded} running timers in {load_elapsed:.2f}s; "
+            f"expire batch: {len(completed)}/{len(due)} completed in {fire_elapsed:.2f}s"
+        )
+        self._measure_lag(options["lag_timers"], options["lag_window"], rng)
+
+    def _measure_lag(self, count: int, window: float, rng: random.Random):
+        """Runs a real scheduler thread over in-memory timers and reports how late each fired."""
+        lags = []
+        done = threading.Event()
+
+        def record(todo_ids):
+            fired = time.time()
+            lags.extend(fired - due_at[todo_id] for todo_id in todo_ids)
+            if len(lags) >= count:
+                done.set()
+
+        scheduler = TimerScheduler(handler=record)
+        scheduler.load = lambda: 0
+        scheduler.poll = lambda: 0
+        base = timezone.now() + timedelta(seconds=0.5)
+        rows = [(-(i + 1), base, rng.uniform(0, window)) for i in range(count)]
+        due_at = {todo_id: (start + timedelta(seconds=duration)).timestamp() for todo_id, start, duration in rows}
+        scheduler.schedule(rows)
+        scheduler.start()
+        done.wait(window + 30)
+        scheduler.stop()
+
+        lags.sort()
+        self.stdout.write(
+            f"lag over {len(lags)} timers: median {statistics.median(lags) * 1000:.1f} ms, "
+            f"p99 {lags[int(len(lags) * 0.99) - 1] * 1000:.1f} ms, max {lags[-1] * 1000:.1f} ms"
+        )
@@ -0,0 +1,156 @@
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from todos.models import Category, Todo, TodoCategory
+from todos.pagination import encode_cursor
+from todos.views import TodoListView
+
+
+@contextmanager
+def _explicit_created_at():
+    # auto_now_add would stamp every seeded row with the same instant
+    field = Todo._meta.get_field("created_at")
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure GET /todos/todos as the todo table grows. Seeds rows in steps (--sizes) spread "
+        "over --users users and times one user's first page (no cursor) and a page from the middle "
+        "of that user's list (with cursor), reporting p50/p99 and queries per page. With --categories "
+        "each todo also gets one or two of that many categories and multi-category filters are timed. "
+        "Database rows are created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="10000,100000,1000000",
+                            help="Comma-separated total todo counts to measure at.")
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument("--requests", type=int, default=200, help="Timed requests per page and size.")
+        parser.add_argument("--page-size", type=int, default=settings.TODO_LIST_PAGE_SIZE)
+        parser.add_argument("--categories", type=int, default=10,
+                            help="Distinct categories to tag todos with; 0 skips the category filters.")
+        parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per bulk INSERT.")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted(int(size) for size in options["sizes"].split(","))
+        except ValueError:
+            raise CommandError("--sizes must be comma-separated integers")
+        self.rng = random.Random(options["seed"])
+        self.view = TodoListView.as_view()
+        # The Link header is built from the Host, which must pass ALLOWED_HOSTS
+        host = next((host for host in settings.ALLOWED_HOSTS if host and "*" not in host), "localhost")
+        self.factory = APIRequestFactory(HTTP_HOST=host.lstrip("."))
+        User = get_user_model()
+
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(username=f"bench-list-{i}") for i in range(options["users"])
+            ])
+            if users[0].pk is None:
+                users = list(User.objects.filter(username__startswith="bench-list-").order_by("id"))
+            user = users[0]
+            self.categories = Category.objects.get_or_create_many(
+                f"bench-category-{i}" for i in range(options["categories"])
+            )
+            start = timezone.now()
+            seeded = 0
+            for size in sizes:
+                started = time.perf_counter()
+                self.seed(users, start, seeded, size, options["batch_size"])
+                if connection.vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"ANALYZE {Todo._meta.db_table}")
+                        cursor.execute(f"ANALYZE {TodoCategory._meta.db_table}")
+                self.stdout.write(f"{size} todos (+{size - seeded} in {time.perf_counter() - started:.1f}s):")
+                seeded = size
+
+                params = {"page_size": options["page_size"]}
+                for label, query in self.scenarios(user, params):
+                    latencies, queries = self.measure(user, query, options["requests"])
+                    self.stdout.write(
+                        f"  {label:<24} p50 {statistics.median(latencies) * 1000:6.2f} ms   "
+                        f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:6.2f} ms   "
+                        f"{queries} queries"
+                    )
+            transaction.set_rollback(True)
+
+    def seed(self, users, start, first: int, last: int, batch_size: int):
+        """Adds todos first..last-1, newest first, round-robin over users."""
+        with _explicit_created_at():
+            for offset in range(first, last, batch_size):
+                todos = Todo.objects.bulk_create([
+                    Todo(
+                        user=users[i % len(users)], title=f"todo {i}", type=Todo.CHECK,
+                        completed=self.rng.random() < 0.5,
+                        created_at=start - timedelta(seconds=i),
+                    )
+                    for i in range(offset, min(offset + batch_size, last))
+                ], batch_size=batch_size)
+                if self.categories:
+                    TodoCategory.objects.bulk_create([
+                        TodoCategory(todo=todo, category=category)
+                        for todo in todos
+                        for category in self.rng.sample(self.categories, min(len(self.categories), self.rng.randint(1, 2)))
+                    ], batch_size=batch_size)
+
+    def scenarios(self, user, params):
+        """(label, query params) pairs to time at the current table size."""
+        mine = Todo.objects.filter(user=user).order_by("-created_at", "-id")
+        created_at, pk = mine.values_list("created_at", "id")[mine.count() // 2]
+        middle = encode_cursor(created_at, pk)
+        scenarios = [
+            ("first page", params),
+            ("middle page (cursor)", {**params, "cursor": middle}),
+            ("first page, completed", {**params, "completed": "false"}),
+        ]
+        names = [category.name for category in self.categories]
+        if names:
+            tagged = mine.filter(
+                id__in=TodoCategory.objects.filter(category__name__in=names[:3]).values("todo_id")
+            )
+            created_at, pk = tagged.values_list("created_at", "id")[tagged.count() // 2]
+            scenarios += [
+                ("1 category", {**params, "categories": names[:1]}),
+                ("3 categories", {**params, "categories": names[:3]}),
+                ("3 categories (cursor)", {**params, "categories": names[:3],
+                                           "cursor": encode_cursor(created_at, pk)}),
+            ]
+        return scenarios
+
+    def request(self, user, query):
+        request = self.factory.get("/todos/todos", query)
+        force_authenticate(request, user=user)
+        response = self.view(request)
+        response.render()
+        if response.status_code != 200:
+            raise CommandError(f"GET /todos/todos?{query} answered {response.status_code}")
+        return response
+
+    def measure(self, user, query, requests: int):
+        """Returns (sorted latencies, queries per request); the query count comes from an untimed run."""
+        with CaptureQueriesContext(connection) as captured:
+            self.request(user, query)
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            self.request(user, query)
+            latencies.append(time.perf_counter() - started)
+        return sorted(latencies), len(captured.captured_queries)
@@ -0,0 +1,72 @@
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from todos.services.classification_services import weights_to_vector
+from todos.services.local_classifier import LocalCategoryClassifier
+from todos.services.todo_services import get_category_weights
+
+from .train_category_classifier import load_labelled_todos
+
+
+def _percentiles(samples_ms):
+    return np.percentile(samples_ms, 50), np.percentile(samples_ms, 99)
+
+
+class Command(BaseCommand):
+    help = (
+        "Evaluate the local category classifier against LLM labels: "
+        "top-1 agreement, coverage at the confidence threshold and p50/p99 latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--input", required=True,
+                            help="Held-out JSON Lines file of LLM-labelled todos.")
+        parser.add_argument("--model", default=settings.TODO_LOCAL_CLASSIFIER_PATH)
+        parser.add_argument("--threshold", type=float,
+                            default=settings.TODO_LOCAL_CLASSIFIER_THRESHOLD)
+        parser.add_argument("--llm-sample", type=int, default=0,
+                            help="Also time this many titles through get_category_weights.")
+
+    def handle(self, *args, **options):
+        try:
+            classifier = LocalCategoryClassifier.load(options["model"])
+        except FileNotFoundError:
+            raise CommandError(f"No trained model at {options['model']}.")
+        titles, labels = load_labelled_todos(options["input"])
+
+        predictions = np.zeros_like(labels)
+        confidence = np.zeros(len(titles))
+        local_ms = np.zeros(len(titles))
+        for i, title in enumerate(titles):
+            started = time.perf_counter()
+            probs, conf = classifier.predict([title])
+            local_ms[i] = (time.perf_counter() - started) * 1000
+            predictions[i], confidence[i] = probs[0], conf[0]
+
+        agree = predictions.argmax(axis=1) == labels.argmax(axis=1)
+        confident = confidence >= options["threshold"]
+        p50, p99 = _percentiles(local_ms)
+        self.stdout.write(f"todos: {len(titles)}")
+        self.stdout.write(f"top-1 agreement (all): {agree.mean():.3f}")
+        self.stdout.write(
+            f"coverage at threshold {options['threshold']}: {confident.mean():.3f}"
+        )
+        if confident.any():
+            self.stdout.write(f"top-1 agreement (confident): {agree[confident].mean():.3f}")
+        self.stdout.write(f"local latency ms: p50={p50:.3f} p99={p99:.3f}")
+
+        sample = titles[:options["llm_sample"]]
+        if sample:
+            llm_ms = np.zeros(len(sample))
+            llm_agree = np.zeros(len(sample), dtype=bool)
+            for i, title in enumerate(sample):
+                started = time.perf_counter()
+                weights = get_category_weights(title)
+                llm_ms[i] = (time.perf_counter() - started) * 1000
+                llm_agree[i] = weights_to_vector(weights).argmax() == labels[i].argmax()
+            p50, p99 = _percentiles(llm_ms)
+            self.stdout.write(f"llm latency ms: p50={p50:.1f} p99={p99:.1f}")
+            self.stdout.write(f"llm self-agreement with labels: {llm_agree.mean():.3f}")
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from todos.models import RecommendationPoolEntry
+from todos.services.recommendation_pool import refresh_recommendation_pool
+from todos.services.todo_services import RECOMMENDATION_PROMPT_VERSION
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the pool of recommendations served to users without todos, replacing the "
+        "current pool. Schedule daily and after changing the recommendation prompt; safe to re-run. "
+        "If every LLM call fails the current pool is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=settings.TODO_RECOMMENDATION_POOL_SIZE,
+                            help="LLM calls to make; duplicate answers are stored once.")
+        parser.add_argument("--concurrency", type=int, default=settings.TODO_LLM_MAX_CONCURRENCY,
+                            help="LLM calls in flight at once.")
+        parser.add_argument("--if-empty", action="store_true",
+                            help="Do nothing when the pool already has entries for the current prompt version.")
+
+    def handle(self, *args, **options):
+        if options["if_empty"]:
+            existing = RecommendationPoolEntry.objects.filter(prompt_version=RECOMMENDATION_PROMPT_VERSION).count()
+            if existing:
+                self.stdout.write(f"Pool already has {existing} entries; skipping")
+                return
+        stored = refresh_recommendation_pool(options["size"], options["concurrency"])
+        if not stored:
+            raise CommandError("No recommendations were generated; kept the existing pool")
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {stored} unique recommendation sets from {options['size']} calls"
+        ))
@@ -0,0 +1,89 @@
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+from todos.services.llm_stub import stub_completion, stub_token_usage
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once; the default backlog of 5 drops them
+    request_queue_size = 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve an OpenAI-compatible /v1/chat/completions stub that answers the app's classification "
+        "and recommendation prompts after a fixed latency. Point OPENAI_BASE_URL at it for load tests; "
+        "--error-rate makes some completions fail with 503 to exercise retries and the circuit breaker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="0.0.0.0")
+        parser.add_argument("--port", type=int, default=8080)
+        parser.add_argument("--latency", type=float, default=0.8, help="Seconds per completion.")
+        parser.add_argument("--jitter", type=float, default=0.2,
+                            help="Latency varies uniformly by this fraction either way.")
+        parser.add_argument("--error-rate", type=float, default=0.0,
+                            help="Fraction of completions answered with 503 after the latency.")
+
+    def handle(self, *args, **options):
+        latency, jitter, error_rate = options["latency"], options["jitter"], options["error_rate"]
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, as the OpenAI client reuses its connections
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, body: dict):
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._send_json(200, {"status": "ok"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+                prompt = request["messages"][-1]["content"]
+                time.sleep(max(0.0, latency * random.uniform(1 - jitter, 1 + jitter)))
+                if error_rate and random.random() < error_rate:
+                    self._send_json(503, {"error": {"message": "Injected stub failure", "type": "server_error"}})
+                    return
+                content = json.dumps(stub_completion(prompt), ensure_ascii=False)
+                self._send_json(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "stub"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": stub_token_usage(prompt, content),
+                })
+
+        server = StubServer((options["host"], options["port"]), Handler)
+        self.stdout.write(self.style.SUCCESS(
+            f"LLM stub listening on {options['host']}:{options['port']} ({latency:.2f}s ±{jitter:.0%}, "
+            f"{error_rate:.0%} errors)"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,20 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from todos.services.timer_scheduler import TimerScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the timer expiry scheduler in the foreground. Use this as a dedicated process "
+        "with TODO_TIMER_SCHEDULER_IN_PROCESS=false instead of one scheduler per server process."
+    )
+
+    def handle(self, *args, **options):
+        scheduler = TimerScheduler()
+        signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            scheduler.stop()
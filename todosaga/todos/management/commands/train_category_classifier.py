@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from todos.models import Todo
+from todos.services.classification_services import normalize_weights_matrix, weights_to_vector
+from todos.services.local_classifier import LocalCategoryClassifier
+from todos.services.todo_services import CATEGORIES
+
+
+def load_labelled_todos(path):
+    """JSON Lines 파일에서 {"title": ..., "weights": {카테고리: 가중치}} 항목을 읽습니다."""
+    titles, rows = [], []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                titles.append(item["title"])
+                rows.append(weights_to_vector(item["weights"]))
+            except (ValueError, KeyError) as e:
+                raise CommandError(f"{path}:{line_no}: invalid labelled todo ({e})")
+    if not titles:
+        raise CommandError(f"{path} has no labelled todos.")
+    return titles, normalize_weights_matrix(np.vstack(rows))
+
+
+def load_persisted_todos(limit):
+    """
+    LLM이 분류한 Todo의 category_weights를 학습 데이터로 읽습니다.
+    로컬 분류기 자신의 예측은 제외해야 오류가 학습 데이터로 되먹임되지 않습니다.
+    """
+    titles, rows = [], []
+    queryset = (
+        Todo.objects.filter(category_weights__isnull=False, category_source=Todo.SOURCE_LLM)
+        .order_by("-id")
+        .only("id", "title", "category_weights")[:limit]
+    )
+    for todo in queryset.iterator(chunk_size=2000):
+        titles.append(todo.title)
+        rows.append(todo.category_weight_vector)
+    if not titles:
+        raise CommandError("No LLM-classified todos stored yet.")
+    return titles, normalize_weights_matrix(np.vstack(rows))
+
+
+class Command(BaseCommand):
+    help = "Train the local first-tier category classifier from LLM-labelled todos."
+
+    def add_arguments(self, parser):
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--input",
+                            help='JSON Lines file of {"title": ..., "weights": {...}} items.')
+        source.add_argument("--from-db", action="store_true",
+                            help="Train on category weights persisted on Todo rows by the LLM tier.")
+        parser.add_argument("--limit", type=int, default=200000,
+                            help="Most recent LLM-classified todos to use with --from-db.")
+        parser.add_argument("--output", default=settings.TODO_LOCAL_CLASSIFIER_PATH)
+        parser.add_argument("--temperature", type=float, default=0.05)
+
+    def handle(self, *args, **options):
+        if options["from_db"]:
+            titles, weights = load_persisted_todos(options["limit"])
+        else:
+            titles, weights = load_labelled_todos(options["input"])
+        classifier = LocalCategoryClassifier.fit(
+            CATEGORIES, titles, weights, temperature=options["temperature"]
+        )
+        classifier.save(options["output"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Trained on {len(titles)} todos; saved to {options['output']}"
+        ))
@@ -0,0 +1,94 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_json_categories(apps, schema_editor):
+    """Moves the legacy JSON category lists into Category / TodoCategory rows."""
+    Todo = apps.get_model('todos', 'Todo')
+    Category = apps.get_model('todos', 'Category')
+    TodoCategory = apps.get_model('todos', 'TodoCategory')
+
+    rows = list(Todo.objects.exclude(legacy_categories=None).values_list('id', 'legacy_categories'))
+    pairs = []
+    for todo_id, names in rows:
+        if not isinstance(names, list):
+            continue
+        for name in dict.fromkeys(str(n) for n in names if n):
+            pairs.append((todo_id, name))
+    if not pairs:
+        return
+
+    names = {name for _, name in pairs}
+    Category.objects.bulk_create([Category(name=name) for name in names], ignore_conflicts=True)
+    category_ids = dict(Category.objects.filter(name__in=names).values_list('name', 'id'))
+    TodoCategory.objects.bulk_create(
+        [TodoCategory(todo_id=todo_id, category_id=category_ids[name]) for todo_id, name in pairs],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+def copy_categories_to_json(apps, schema_editor):
+    Todo = apps.get_model('todos', 'Todo')
+    TodoCategory = apps.get_model('todos', 'TodoCategory')
+
+    names_by_todo = {}
+    for todo_id, name in TodoCategory.objects.values_list('todo_id', 'category__name'):
+        names_by_todo.setdefault(todo_id, []).append(name)
+    todos = list(Todo.objects.only('id'))
+    for todo in todos:
+        todo.legacy_categories = names_by_todo.get(todo.id, [])
+    Todo.objects.bulk_update(todos, ['legacy_categories'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='todo',
+            old_name='categories',
+            new_name='legacy_categories',
+        ),
+        migrations.AlterField(
+            model_name='todo',
+            name='legacy_categories',
+            field=models.JSONField(null=True),
+        ),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TodoCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='todos.category')),
+                ('todo', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='todos.todo')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='categories',
+            field=models.ManyToManyField(blank=True, related_name='todos', through='todos.TodoCategory', to='todos.category'),
+        ),
+        migrations.AddIndex(
+            model_name='todocategory',
+            index=models.Index(fields=['category', 'todo'], name='todocategory_category_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='todocategory',
+            constraint=models.UniqueConstraint(fields=('todo', 'category'), name='todo_category_unique'),
+        ),
+        migrations.RunPython(copy_json_categories, copy_categories_to_json),
+        migrations.RemoveField(
+            model_name='todo',
+            name='legacy_categories',
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-18 08:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0002_category_todocategory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='todo',
+            name='category_weights',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(condition=models.Q(('category_weights__isnull', True)), fields=['id'], name='todo_unclassified_idx'),
+        ),
+    ]
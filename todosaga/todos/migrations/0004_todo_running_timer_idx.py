@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0003_todo_category_weights'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(condition=models.Q(('completed', False), ('start_time__isnull', False)), fields=['start_time', 'completed'], name='todo_running_timer_idx'),
+        ),
+    ]
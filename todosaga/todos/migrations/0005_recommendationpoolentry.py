@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0004_todo_running_timer_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationPoolEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recommendations', models.JSONField()),
+                ('prompt_version', models.CharField(max_length=16)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
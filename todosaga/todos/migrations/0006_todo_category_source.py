@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0005_recommendationpoolentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='todo',
+            name='category_source',
+            field=models.CharField(blank=True, choices=[('local', 'Local'), ('llm', 'LLM')], editable=False, max_length=5, null=True),
+        ),
+    ]
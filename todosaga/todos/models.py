@@ -1,6 +1,26 @@
+import numpy as np
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+class CategoryManager(models.Manager):
+    def get_or_create_many(self, names):
+        """Returns Category rows for the given names, creating missing ones in one INSERT."""
+        names = list(dict.fromkeys(name for name in names if name))
+        if not names:
+            return []
+        self.bulk_create([Category(name=name) for name in names], ignore_conflicts=True)
+        by_name = {category.name: category for category in self.filter(name__in=names)}
+        return [by_name[name] for name in names]
+
+class Category(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+
+    objects = CategoryManager()
+
+    def __str__(self):
+        return self.name
+
 class Todo(models.Model):
     # Todo types
     CHECK = "check"
@@ -9,10 +29,26 @@ class Todo(models.Model):
         (CHECK, "Check"),
         (TIMER, "Timer"),
     ]
+
+    # Which classification tier produced category_weights
+    SOURCE_LOCAL = "local"
+    SOURCE_LLM = "llm"
+    CATEGORY_SOURCE_CHOICES = [
+        (SOURCE_LOCAL, "Local"),
+        (SOURCE_LLM, "LLM"),
+    ]
     
+    # The plain FK index is redundant with the composite (user, ...) indexes in Meta
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+        related_name="todos", db_index=False,
+    )
     title = models.CharField(max_length=255)
-    # Storing categories as a JSON list; PostgreSQL’s JSONField is used here
-    categories = models.JSONField()
+    # Categories live in a normalized table so "any of these categories" filters
+    # are index lookups on TodoCategory instead of scans over a JSON column.
+    categories = models.ManyToManyField(
+        Category, through="TodoCategory", related_name="todos", blank=True
+    )
     type = models.CharField(max_length=10, choices=TODO_TYPE_CHOICES)
     # For timer-type todos, store the duration in seconds
     duration_seconds = models.IntegerField(null=True, blank=True)
@@ -23,6 +59,78 @@ class Todo(models.Model):
     start_time = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     gained_exp = models.IntegerField(default=0)
+    # Category weight vector aligned to todo_services.CATEGORIES, packed as
+    # little-endian float32 (40 bytes). NULL until the classification queue fills it.
+    category_weights = models.BinaryField(null=True, blank=True, editable=False)
+    # The local classifier is trained on LLM labels only, so its own predictions
+    # must not feed back in. NULL for rows classified before this was recorded.
+    category_source = models.CharField(
+        max_length=5, choices=CATEGORY_SOURCE_CHOICES, null=True, blank=True, editable=False
+    )
+    
+    class Meta:
+        # Composite indexes matching the keyset pagination order of the list view,
+        # with and without the completed filter.
+        indexes = [
+            models.Index(fields=["user", "created_at", "id"], name="todo_user_created_idx"),
+            models.Index(
+                fields=["user", "completed", "created_at", "id"],
+                name="todo_user_completed_idx",
+            ),
+            # Lets the classification backfill find unclassified rows without a full scan
+            models.Index(
+                fields=["id"],
+                condition=models.Q(category_weights__isnull=True),
+                name="todo_unclassified_idx",
+            ),
+            # Running timers only, so the timer scheduler's startup load and its
+            # "started since" polls are range scans over live timers
+            models.Index(
+                fields=["start_time", "completed"],
+                condition=models.Q(completed=False, start_time__isnull=False),
+                name="todo_running_timer_idx",
+            ),
+        ]
     
     def __str__(self):
         return self.title
+
+    @property
+    def category_weight_vector(self):
+        """Unpacked category weights as a float32 array, or None if not classified yet."""
+        if self.category_weights is None:
+            return None
+        return np.frombuffer(bytes(self.category_weights), dtype="<f4")
+
+    @category_weight_vector.setter
+    def category_weight_vector(self, vector):
+        self.category_weights = np.asarray(vector, dtype="<f4").tobytes()
+
+
+class TodoCategory(models.Model):
+    # Both FK indexes are covered by the composite unique constraint / index below
+    todo = models.ForeignKey(Todo, on_delete=models.CASCADE, db_index=False)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["todo", "category"], name="todo_category_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["category", "todo"], name="todocategory_category_idx"),
+        ]
+
+
+class RecommendationPoolEntry(models.Model):
+    """
+    One pre-generated recommendation triple for users without todos (the
+    fallback todo list), written by `refresh_recommendation_pool` and sampled
+    at request time instead of calling the LLM.
+    """
+    recommendations = models.JSONField()
+    # RECOMMENDATION_PROMPT_VERSION the entry was generated with; other versions are ignored
+    prompt_version = models.CharField(max_length=16)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return " / ".join(self.recommendations)
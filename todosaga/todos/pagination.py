@@ -0,0 +1,63 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, pk: int) -> str:
+    """Encodes the (created_at, id) position of the last row on a page."""
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        created_at, pk = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor("Invalid cursor.")
+
+
+def get_page_size(value) -> int:
+    """Returns the requested page size clamped to TODO_LIST_MAX_PAGE_SIZE."""
+    default = settings.TODO_LIST_PAGE_SIZE
+    if value is None:
+        return default
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(page_size, settings.TODO_LIST_MAX_PAGE_SIZE))
+
+
+def paginate_keyset(queryset, cursor: str | None, page_size: int):
+    """
+    Keyset pagination over (created_at, id), newest first.
+
+    Instead of OFFSET, each page continues strictly after the position encoded
+    in the cursor, so the cost of a page depends only on page_size and the
+    (user, ..., created_at, id) indexes on Todo, not on how many rows precede it.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    queryset = queryset.order_by("-created_at", "-id")
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        # The OR alone is only a filter; the redundant created_at <= bound is what
+        # lets the index scan start at the cursor instead of at the newest row
+        queryset = queryset.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+    # Fetch one extra row to know whether another page exists without a COUNT(*)
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
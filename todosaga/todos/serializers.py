@@ -5,15 +5,24 @@ from .models import Todo
 class TodoCreateSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=255)
     categories = serializers.ListField(
-        child=serializers.CharField(), default=list, help_text="List of categories."
+        child=serializers.CharField(max_length=100), default=list, help_text="List of categories."
     )
     type = serializers.ChoiceField(choices=[(Todo.CHECK, "Check"), (Todo.TIMER, "Timer")])
     duration_seconds = serializers.IntegerField(
         required=False, help_text="Required if type is 'timer'."
     )
 
+    def validate(self, attrs):
+        if attrs["type"] == Todo.TIMER and attrs.get("duration_seconds") is None:
+            raise serializers.ValidationError(
+                {"duration_seconds": "duration_seconds is required for timer type."}
+            )
+        return attrs
+
 # Serializer for returning a Todo
 class TodoSerializer(serializers.ModelSerializer):
+    categories = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
+
     class Meta:
         model = Todo
         fields = ("id", "title", "categories", "type", "completed", "created_at")
@@ -29,6 +38,23 @@ class TodoCompleteResponseSerializer(serializers.Serializer):
     gained_exp = serializers.IntegerField()
     completed_at = serializers.DateTimeField()
 
+# Serializers for bulk create / complete
+class TodoBulkCompleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+class TodoBulkResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    status = serializers.IntegerField()
+    todo = TodoSerializer(required=False)
+    errors = serializers.DictField(required=False)
+
+class TodoBulkCompleteResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.IntegerField()
+    gained_exp = serializers.IntegerField(required=False)
+    completed_at = serializers.DateTimeField(required=False)
+    detail = serializers.CharField(required=False)
+
 # Serializer for Todo Suggestions
 class TodoSuggestionSerializer(serializers.Serializer):
     id = serializers.IntegerField()
@@ -0,0 +1,45 @@
+from typing import Dict, List, Sequence, Tuple
+
+from django.db import transaction
+
+from ..models import Category, Todo, TodoCategory
+from .classification_queue import enqueue_classification
+
+
+def bulk_create_todos(user, items: Sequence[Dict]) -> List[Tuple[Todo, List[str]]]:
+    """
+    검증된 Todo 데이터 여러 개를 하나의 트랜잭션에서 생성합니다.
+    Todo, 카테고리, 연결 테이블을 각각 한 번의 bulk INSERT로 저장하므로
+    항목 수와 관계없이 쿼리 수가 일정합니다. (Todo, 카테고리 이름 목록) 쌍을 입력 순서대로 반환합니다.
+    """
+    if not items:
+        return []
+    with transaction.atomic():
+        todos = Todo.objects.bulk_create([
+            Todo(
+                user=user,
+                title=item["title"],
+                type=item["type"],
+                duration_seconds=item.get("duration_seconds"),
+            )
+            for item in items
+        ])
+        names_per_todo = [list(dict.fromkeys(item.get("categories", []))) for item in items]
+        categories = {
+            category.name: category
+            for category in Category.objects.get_or_create_many(
+                name for names in names_per_todo for name in names
+            )
+        }
+        TodoCategory.objects.bulk_create([
+            TodoCategory(todo=todo, category=categories[name])
+            for todo, names in zip(todos, names_per_todo)
+            for name in names
+            if name in categories
+        ])
+        enqueue_classification([todo.id for todo in todos])
+    return [
+        (todo, [name for name in names if name in categories])
+        for todo, names in zip(todos, names_per_todo)
+    ]
+
@@ -0,0 +1,253 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def normalize_todo_list(todo_list: str) -> str:
+    """공백/빈 줄 차이만 있는 TODO 리스트가 같은 키를 갖도록 정규화합니다."""
+    lines = (" ".join(line.split()) for line in todo_list.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def fingerprint(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Thread-safe hit/miss/eviction counters used to size the cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class BaseRecommendationCache:
+    """
+    추천 결과 캐시 백엔드의 공통 인터페이스입니다.
+    키는 정규화된 TODO 리스트와 프롬프트 버전의 해시이며, 사용자별로 마지막에 사용한
+    키를 기억해 두었다가 Todo 생성/완료 시 invalidate_user()로 지웁니다.
+    """
+
+    def __init__(self, timeout: int = 3600, **options):
+        self.timeout = timeout
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def remember_user(self, user_id: int, key: str):
+        raise NotImplementedError
+
+    def invalidate_user(self, user_id: int):
+        raise NotImplementedError
+
+    def peek(self, key: str) -> Optional[Any]:
+        """get과 같지만 적중/실패 수에 세지 않습니다 (다른 프로세스의 결과를 기다리며 반복 조회할 때)."""
+        return self.get(key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def apeek(self, key: str) -> Optional[Any]:
+        return self.peek(key)
+
+    async def aset(self, key: str, value: Any):
+        self.set(key, value)
+
+    async def aremember_user(self, user_id: int, key: str):
+        self.remember_user(user_id, key)
+
+    def get_stats(self) -> Dict[str, int]:
+        return self.stats.as_dict()
+
+
+class LocMemRecommendationCache(BaseRecommendationCache):
+    """
+    In-process cache with TTL expiry and LRU eviction beyond max_entries.
+    Each entry carries the users remembered for it, and their user -> key
+    mappings go when the entry does, so the map never outgrows the cache.
+    """
+
+    def __init__(self, timeout: int = 3600, max_entries: int = 10000, **options):
+        super().__init__(timeout=timeout)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires, value, users remembered for the key)
+        self._entries: "OrderedDict[str, tuple[float, Any, Set[int]]]" = OrderedDict()
+        self._user_keys: Dict[int, str] = {}
+
+    def _pop_entry(self, key: str):
+        """Removes an entry with its users' mappings. Called with the lock held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            for user_id in entry[2]:
+                if self._user_keys.get(user_id) == key:
+                    del self._user_keys[user_id]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._pop_entry(key)
+                entry = None
+            if entry is None:
+                self.stats.incr("misses")
+                return None
+            self._entries.move_to_end(key)
+        self.stats.incr("hits")
+        return entry[1]
+
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key, value):
+        evicted = 0
+        with self._lock:
+            previous = self._entries.get(key)
+            users = previous[2] if previous is not None else set()
+            self._entries[key] = (time.monotonic() + self.timeout, value, users)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._pop_entry(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self.stats.incr("evictions", evicted)
+
+    def delete(self, key):
+        with self._lock:
+            self._pop_entry(key)
+
+    def remember_user(self, user_id, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            # Nothing to invalidate once the entry is gone
+            if entry is None:
+                return
+            previous = self._user_keys.get(user_id)
+            if previous is not None and previous != key and previous in self._entries:
+                self._entries[previous][2].discard(user_id)
+            self._user_keys[user_id] = key
+            entry[2].add(user_id)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            key = self._user_keys.get(user_id)
+            if key is not None:
+                self._pop_entry(key)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        with self._lock:
+            stats["size"] = len(self._entries)
+            stats["users"] = len(self._user_keys)
+        return stats
+
+
+class DjangoRecommendationCache(BaseRecommendationCache):
+    """
+    Stores entries in a Django cache alias (e.g. a Redis backend) so every
+    worker shares them. Expiry and eviction are left to the cache server;
+    hit/miss counters are per process.
+    """
+
+    key_prefix = "todo-rec"
+
+    def __init__(self, timeout: int = 3600, cache_alias: str = "default", **options):
+        super().__init__(timeout=timeout)
+        from django.core.cache import caches
+        self.cache = caches[cache_alias]
+
+    def _entry_key(self, key):
+        return f"{self.key_prefix}:{key}"
+
+    def _user_key(self, user_id):
+        return f"{self.key_prefix}:user:{user_id}"
+
+    def _count(self, value):
+        self.stats.incr("misses" if value is None else "hits")
+        return value
+
+    def get(self, key):
+        return self._count(self.cache.get(self._entry_key(key)))
+
+    def peek(self, key):
+        return self.cache.get(self._entry_key(key))
+
+    def set(self, key, value):
+        self.cache.set(self._entry_key(key), value, self.timeout)
+
+    def delete(self, key):
+        self.cache.delete(self._entry_key(key))
+
+    def remember_user(self, user_id, key):
+        self.cache.set(self._user_key(user_id), key, self.timeout)
+
+    def invalidate_user(self, user_id):
+        key = self.cache.get(self._user_key(user_id))
+        if key is not None:
+            self.cache.delete_many([self._entry_key(key), self._user_key(user_id)])
+
+    async def aget(self, key):
+        return self._count(await self.cache.aget(self._entry_key(key)))
+
+    async def apeek(self, key):
+        return await self.cache.aget(self._entry_key(key))
+
+    async def aset(self, key, value):
+        await self.cache.aset(self._entry_key(key), value, self.timeout)
+
+    async def aremember_user(self, user_id, key):
+        await self.cache.aset(self._user_key(user_id), key, self.timeout)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_recommendation_cache() -> BaseRecommendationCache:
+    """settings.TODO_RECOMMENDATION_CACHE에 설정된 백엔드 인스턴스를 반환합니다."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                config = dict(settings.TODO_RECOMMENDATION_CACHE)
+                backend = import_string(config.pop("BACKEND"))
+                _cache = backend(**{k.lower(): v for k, v in config.items()})
+    return _cache
+
+
+def recommendation_cache_metrics():
+    """core.metrics 수집기: 이 프로세스의 추천 캐시 적중/실패/축출 수와 (로컬 백엔드면) 항목 수를 반환합니다."""
+    lines = []
+    for key, value in sorted(get_recommendation_cache().get_stats().items()):
+        if key == "size":
+            name, kind = "todosaga_recommendation_cache_size", "gauge"
+        else:
+            name, kind = f"todosaga_recommendation_cache_{key}_total", "counter"
+        lines += [f"# TYPE {name} {kind}", f"{name} {value}"]
+    return lines
@@ -0,0 +1,90 @@
+import logging
+import queue
+import threading
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from ..models import Todo
+from .classification_services import classify_todos_with_source, weights_to_vector
+
+logger = logging.getLogger(__name__)
+
+_queue: "queue.Queue[int]" = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def classify_and_store(todo_ids: Iterable[int]) -> int:
+    """
+    주어진 Todo들 중 아직 분류되지 않은 것들을 한 번에 분류하고 bulk_update로 저장합니다.
+    저장한 Todo 수를 반환합니다. 분류에 실패한 Todo는 NULL로 남아 백필 때 다시 처리됩니다.
+    """
+    todos = list(
+        Todo.objects.filter(id__in=list(todo_ids), category_weights__isnull=True).only("id", "title")
+    )
+    if not todos:
+        return 0
+    results = classify_todos_with_source([todo.title for todo in todos])
+    classified = []
+    for todo, (weights, source) in zip(todos, results):
+        if weights is None:
+            continue
+        todo.category_weight_vector = weights_to_vector(weights)
+        todo.category_source = source
+        classified.append(todo)
+    Todo.objects.bulk_update(classified, ["category_weights", "category_source"], batch_size=500)
+    return len(classified)
+
+
+def _drain(first: int) -> List[int]:
+    """Collects whatever else is already queued (up to the batch size) behind `first`."""
+    batch = [first]
+    while len(batch) < settings.TODO_CLASSIFICATION_QUEUE_BATCH_SIZE:
+        try:
+            batch.append(_queue.get(timeout=settings.TODO_CLASSIFICATION_QUEUE_LINGER))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _run():
+    while True:
+        batch = _drain(_queue.get())
+        try:
+            classify_and_store(batch)
+        except Exception:
+            logger.exception("Failed to classify todos %s", batch)
+        finally:
+            close_old_connections()
+            for _ in batch:
+                _queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    if _worker is None or not _worker.is_alive():
+        with _worker_lock:
+            if _worker is None or not _worker.is_alive():
+                _worker = threading.Thread(
+                    target=_run, name="todo-classification", daemon=True
+                )
+                _worker.start()
+
+
+def enqueue_classification(todo_ids: Iterable[int]):
+    """
+    Todo 분류를 백그라운드 큐에 넣습니다. 현재 트랜잭션이 커밋된 뒤에 실행되므로
+    생성 요청의 응답 시간에는 영향을 주지 않습니다.
+    """
+    if not settings.TODO_CLASSIFICATION_QUEUE_ENABLED:
+        return
+    todo_ids = list(todo_ids)
+
+    def _submit():
+        _ensure_worker()
+        for todo_id in todo_ids:
+            _queue.put(todo_id)
+
+    transaction.on_commit(_submit)
@@ -0,0 +1,161 @@
+from asgiref.sync import async_to_sync
+from django.conf import settings
+import numpy as np
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..models import Todo
+from .local_classifier import classify_locally
+from .todo_services import CATEGORIES, build_chain, get_category_weights
+
+# Output tokens the model spends per classified item (a weight for each of the 10 categories)
+OUTPUT_TOKENS_PER_ITEM = 120
+PROMPT_OVERHEAD_TOKENS = 400
+
+BATCH_CLASSIFICATION_TEMPLATE = """다음은 번호가 매겨진 사용자의 TODO 목록입니다:
+{todos}
+
+각 TODO를 다음 카테고리들의 가중치로 답변해주세요:
+{categories}
+
+{format_instructions}
+
+모든 TODO 번호에 대해 하나씩 항목을 작성하고, index에는 TODO 번호를 그대로 사용하세요.
+각 카테고리에 대해 0.0에서 1.0 사이의 가중치를 할당해주세요.
+가중치는 해당 카테고리와의 관련성을 나타냅니다."""
+
+_batch_chain = None
+_batch_chain_lock = threading.Lock()
+
+def _get_batch_chain():
+    global _batch_chain
+    if _batch_chain is None:
+        with _batch_chain_lock:
+            if _batch_chain is None:
+                from .llm_schemas import BatchCategoryWeights
+
+                _batch_chain = build_chain(
+                    BATCH_CLASSIFICATION_TEMPLATE, BatchCategoryWeights, "classification",
+                    categories="\n".join(CATEGORIES),
+                )
+    return _batch_chain
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수를 대략 추정합니다.
+    ASCII는 4글자당 1토큰, 한글 등 그 외 문자는 1글자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars) + 1
+
+def chunk_by_token_budget(
+    titles: Sequence[str], token_budget: int, max_items: int
+) -> List[List[int]]:
+    """프롬프트 하나에 들어갈 TODO 인덱스 묶음을 토큰 예산에 맞춰 나눕니다."""
+    chunks, current, used = [], [], PROMPT_OVERHEAD_TOKENS
+    for i, title in enumerate(titles):
+        cost = estimate_tokens(title) + OUTPUT_TOKENS_PER_ITEM
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            chunks.append(current)
+            current, used = [], PROMPT_OVERHEAD_TOKENS
+        current.append(i)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+def weights_to_vector(weights: Dict[str, float]) -> np.ndarray:
+    """카테고리 이름 -> 가중치 dict를 CATEGORIES 순서의 벡터로 변환합니다. 모르는 카테고리는 무시합니다."""
+    return np.array([max(float(weights.get(c, 0.0)), 0.0) for c in CATEGORIES], dtype=np.float64)
+
+def normalize_weights_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    normalize_weights의 행렬 버전: 각 행(TODO)의 가중치 합이 1이 되도록 한 번에 정규화합니다.
+    합이 0인 행은 균등 분포로 채웁니다.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    totals = matrix.sum(axis=1, keepdims=True)
+    uniform = np.full_like(matrix, 1.0 / matrix.shape[1])
+    return np.divide(matrix, totals, out=uniform, where=totals > 0)
+
+async def aclassify_todos_with_llm(titles: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+    """
+    여러 TODO를 토큰 예산 단위로 묶어 프롬프트 몇 개로 분류합니다.
+    묶음들은 chain.abatch로 최대 TODO_CLASSIFICATION_MAX_CONCURRENCY개씩 동시에 실행되며,
+    결과는 입력 순서대로 반환합니다. 실패한 묶음이나 응답에서 빠진 항목은 None입니다.
+    """
+    titles = list(titles)
+    if not titles:
+        return []
+    chunks = chunk_by_token_budget(
+        titles,
+        settings.TODO_CLASSIFICATION_TOKEN_BUDGET,
+        settings.TODO_CLASSIFICATION_MAX_ITEMS,
+    )
+    inputs = [
+        {"todos": "\n".join(f"{n}. {titles[i]}" for n, i in enumerate(chunk, 1))}
+        for chunk in chunks
+    ]
+    responses = await _get_batch_chain().abatch(
+        inputs,
+        config={"max_concurrency": settings.TODO_CLASSIFICATION_MAX_CONCURRENCY},
+        return_exceptions=True,
+    )
+
+    matrix = np.zeros((len(titles), len(CATEGORIES)), dtype=np.float64)
+    classified = np.zeros(len(titles), dtype=bool)
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            continue
+        for item in response.items:
+            if 1 <= item.index <= len(chunk):
+                row = chunk[item.index - 1]
+                matrix[row] = weights_to_vector(item.weights)
+                classified[row] = True
+
+    normalized = normalize_weights_matrix(matrix)
+    return [
+        dict(zip(CATEGORIES, row.tolist())) if ok else None
+        for row, ok in zip(normalized, classified)
+    ]
+
+async def aclassify_todos_with_source(
+    titles: Sequence[str],
+) -> List[Tuple[Optional[Dict[str, float]], Optional[str]]]:
+    """
+    로컬 분류기로 먼저 분류하고, 신뢰도가 낮은 TODO만 모아 LLM 배치 분류로 넘깁니다.
+    (가중치, 분류한 단계) 쌍을 입력 순서대로 반환합니다. 단계는 Todo.SOURCE_LOCAL 또는 Todo.SOURCE_LLM이고,
+    분류에 실패한 항목은 (None, None)입니다.
+    """
+    titles = list(titles)
+    results = [
+        (weights, Todo.SOURCE_LOCAL if weights is not None else None)
+        for weights in classify_locally(titles)
+    ]
+    pending = [i for i, (weights, _) in enumerate(results) if weights is None]
+    if pending:
+        llm_results = await aclassify_todos_with_llm([titles[i] for i in pending])
+        for i, weights in zip(pending, llm_results):
+            results[i] = (weights, Todo.SOURCE_LLM if weights is not None else None)
+    return results
+
+async def aclassify_todos(titles: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+    """
+    로컬 분류기로 먼저 분류하고, 신뢰도가 낮은 TODO만 모아 LLM 배치 분류로 넘깁니다.
+    """
+    return [weights for weights, _ in await aclassify_todos_with_source(titles)]
+
+def classify_todo(title: str) -> Dict[str, float]:
+    """TODO 하나를 분류합니다. 로컬 분류기가 확신하지 못할 때만 get_category_weights를 호출합니다."""
+    weights = classify_locally([title])[0]
+    if weights is None:
+        weights = get_category_weights(title)
+    return weights
+
+def classify_todos(titles: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+    """aclassify_todos의 동기 버전입니다 (관리 명령, 백그라운드 작업용)."""
+    return async_to_sync(aclassify_todos)(titles)
+
+def classify_todos_with_source(titles: Sequence[str]) -> List[Tuple[Optional[Dict[str, float]], Optional[str]]]:
+    """aclassify_todos_with_source의 동기 버전입니다."""
+    return async_to_sync(aclassify_todos_with_source)(titles)
@@ -0,0 +1,53 @@
+"""LangChain callback that feeds LLM latency and token usage into core.metrics."""
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from core.instrumentation import RequestStats, current_stats
+from core.metrics import llm_request_duration, llm_tokens
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """
+    LangChain 채팅 모델 호출의 지연 시간과 토큰 사용량을 기록합니다.
+    체인의 metadata["operation"]을 라벨로 쓰며, 요청 처리 중이면 요청 통계에도 더합니다.
+    """
+    # Runs on the caller's thread/task so the request ContextVar is visible
+    run_inline = True
+
+    def __init__(self):
+        self._started: Dict[UUID, Tuple[float, str, Optional[RequestStats]]] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs):
+        operation = (metadata or {}).get("operation", "other")
+        self._started[run_id] = (time.perf_counter(), operation, current_stats.get())
+
+    def _finish(self, run_id: UUID, outcome: str) -> Optional[str]:
+        entry = self._started.pop(run_id, None)
+        if entry is None:
+            return None
+        started, operation, stats = entry
+        elapsed = time.perf_counter() - started
+        llm_request_duration.observe(elapsed, (operation, outcome))
+        if stats is not None:
+            stats.llm_calls += 1
+            stats.llm_seconds += elapsed
+        return operation
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        operation = self._finish(run_id, "ok")
+        if operation is None:
+            return
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        for kind in ("prompt_tokens", "completion_tokens"):
+            if usage.get(kind):
+                llm_tokens.inc((operation, kind.split("_")[0]), usage[kind])
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        self._finish(run_id, "error")
+
+
+llm_metrics_callback = LLMMetricsCallback()
@@ -0,0 +1,296 @@
+"""
+LLM providers. The recommendation and classification chains get their chat
+model from `get_llm_provider()`, chosen by settings.TODO_LLM_PROVIDER["BACKEND"].
+
+Nothing here imports LangChain or the OpenAI SDK at module load: a provider
+builds its chat model the first time a chain needs it, so worker boot,
+`migrate` and commands that never call the LLM skip those imports and do not
+need an API key.
+
+Every call goes through the provider's runnable (`get_runnable()`), which puts
+a circuit breaker and jittered exponential-backoff retries around the model.
+Callers see `LLMUnavailable` when the upstream is down: either the retries ran
+out or the breaker is open and no request was sent.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from core.metrics import llm_rejected_calls, llm_retries, registry
+
+
+class LLMUnavailable(Exception):
+    """LLM 업스트림을 쓸 수 없습니다. 재시도를 모두 실패했거나 서킷 브레이커가 열려 있습니다."""
+
+
+class CircuitBreaker:
+    """
+    연속으로 failure_threshold번 실패하면 reset_timeout초 동안 호출을 막습니다(open).
+    그 뒤 호출 하나만 시험 삼아 통과시키고(half-open), 성공하면 다시 닫고 실패하면 다시 엽니다.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return
+            raise LLMUnavailable("LLM circuit breaker is open.")
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+def _operation(config: Optional[Dict[str, Any]]) -> str:
+    return ((config or {}).get("metadata") or {}).get("operation", "other")
+
+
+class BaseLLMProvider:
+    """
+    채팅 모델을 처음 쓸 때 한 번 만들어 프로세스 안에서 재사용합니다.
+    하위 클래스는 build_chat_model과, 필요하면 retryable_errors를 구현합니다.
+    """
+
+    def __init__(self, model: str = "gpt-3.5-turbo", temperature: float = 0.7,
+                 retry_backoff: float = 0.5, retry_backoff_max: float = 8.0,
+                 failure_threshold: int = 10, reset_timeout: float = 30.0, **options):
+        self.model = model
+        self.temperature = temperature
+        self.max_retries = settings.TODO_LLM_MAX_RETRIES
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._chat_model = None
+        self._runnable = None
+        self._retryable: Optional[Tuple[Type[BaseException], ...]] = None
+        self._lock = threading.Lock()
+        registry.register_collector(self._render_breaker_state)
+
+    def build_chat_model(self):
+        raise NotImplementedError
+
+    def retryable_errors(self) -> Tuple[Type[BaseException], ...]:
+        """업스트림 장애로 보고 재시도하며 서킷 브레이커 실패로 세는 예외입니다."""
+        return (ConnectionError, TimeoutError)
+
+    def get_chat_model(self):
+        if self._chat_model is None:
+            with self._lock:
+                if self._chat_model is None:
+                    self._chat_model = self.build_chat_model()
+                    self._retryable = self.retryable_errors()
+        return self._chat_model
+
+    def get_async_chat_model(self):
+        """ainvoke에 쓸 모델입니다. 비동기 HTTP 커넥션이 이벤트 루프에 묶이는 제공자는 루프마다 따로 만듭니다."""
+        return self.get_chat_model()
+
+    def get_runnable(self):
+        """체인에 넣을 Runnable입니다. 모델 호출마다 서킷 브레이커와 재시도를 거칩니다."""
+        if self._runnable is None:
+            from langchain_core.runnables import RunnableLambda
+
+            self.get_chat_model()
+            with self._lock:
+                if self._runnable is None:
+                    self._runnable = RunnableLambda(self.invoke, afunc=self.ainvoke,
+                                                    name=type(self).__name__)
+        return self._runnable
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": spreads the retries of callers that failed together
+        return random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * 2 ** attempt))
+
+    def _failed(self, error: BaseException, attempt: int, config) -> bool:
+        """실패를 기록하고 재시도할지 반환합니다. 업스트림 장애가 아닌 오류는 응답이 온 것이므로 성공으로 셉니다."""
+        if isinstance(error, Exception) and not isinstance(error, self._retryable):
+            self.breaker.record_success()
+            return False
+        # Retryable errors and cancellation (a caller's deadline ran out while waiting on the upstream)
+        self.breaker.record_failure()
+        if not isinstance(error, Exception) or attempt >= self.max_retries:
+            return False
+        llm_retries.inc((_operation(config),))
+        return True
+
+    def _before_call(self, config):
+        try:
+            self.breaker.before_call()
+        except LLMUnavailable:
+            llm_rejected_calls.inc((_operation(config),))
+            raise
+
+    def invoke(self, input, config=None):
+        model = self.get_chat_model()
+        for attempt in range(self.max_retries + 1):
+            self._before_call(config)
+            try:
+                result = model.invoke(input, config)
+            except BaseException as e:
+                if not self._failed(e, attempt, config):
+                    if isinstance(e, self._retryable):
+                        raise LLMUnavailable(str(e)) from e
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def ainvoke(self, input, config=None):
+        for attempt in range(self.max_retries + 1):
+            self._before_call(config)
+            try:
+                result = await self.get_async_chat_model().ainvoke(input, config)
+            except BaseException as e:
+                if not self._failed(e, attempt, config):
+                    if isinstance(e, self._retryable):
+                        raise LLMUnavailable(str(e)) from e
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            self.breaker.record_success()
+            return result
+
+    def _render_breaker_state(self) -> Iterable[str]:
+        name = "todosaga_llm_circuit_open"
+        return [
+            f"# HELP {name} 1 while the LLM circuit breaker rejects calls (open or half-open).",
+            f"# TYPE {name} gauge",
+            f"{name} {0 if self.breaker.state == CircuitBreaker.CLOSED else 1}",
+        ]
+
+
+class OpenAIProvider(BaseLLMProvider):
+    """
+    OpenAI(또는 OPENAI_BASE_URL의 호환 서버) ChatOpenAI를 씁니다. API 키는 처음 쓸 때 확인합니다.
+    커넥션 풀은 동기 httpx 클라이언트 하나를 프로세스 안에서 공유하고, 비동기 클라이언트는
+    이벤트 루프마다 하나씩 둡니다(ASGI 워커에서는 하나). 재시도는 SDK가 아니라 이 제공자가 합니다.
+    """
+
+    def __init__(self, max_connections: int = 20, connect_timeout: float = 5.0, **options):
+        super().__init__(**options)
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self._http_client = None
+        # Pooled asyncio connections cannot be reused once their loop has closed, and
+        # async_to_sync runs each call on a new loop (e.g. the classification worker)
+        self._async_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _client_options(self) -> Dict[str, Any]:
+        import httpx
+
+        return {
+            "limits": httpx.Limits(max_connections=self.max_connections,
+                                   max_keepalive_connections=self.max_connections),
+            "timeout": httpx.Timeout(settings.TODO_LLM_TIMEOUT, connect=self.connect_timeout),
+        }
+
+    def _chat_openai(self, http_async_client=None):
+        from langchain_openai import ChatOpenAI
+
+        from .llm_metrics import llm_metrics_callback
+
+        return ChatOpenAI(
+            model_name=self.model,
+            temperature=self.temperature,
+            openai_api_base=settings.OPENAI_BASE_URL,
+            request_timeout=settings.TODO_LLM_TIMEOUT,
+            max_retries=0,
+            http_client=self._http_client,
+            http_async_client=http_async_client,
+            callbacks=[llm_metrics_callback],
+        )
+
+    def build_chat_model(self):
+        import httpx
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        if not os.getenv("OPENAI_API_KEY"):
+            raise ImproperlyConfigured("Please set OPENAI_API_KEY environment variable")
+        self._http_client = httpx.Client(**self._client_options())
+        return self._chat_openai()
+
+    def get_async_chat_model(self):
+        import httpx
+
+        self.get_chat_model()
+        loop = asyncio.get_running_loop()
+        model = self._async_models.get(loop)
+        if model is None:
+            with self._lock:
+                model = self._async_models.get(loop)
+                if model is None:
+                    model = self._chat_openai(httpx.AsyncClient(**self._client_options()))
+                    self._async_models[loop] = model
+        return model
+
+    def retryable_errors(self):
+        import openai
+
+        # 429 and 5xx responses, connection failures and timeouts; other 4xx are not retried
+        return (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)
+
+
+class FakeLLMProvider(BaseLLMProvider):
+    """
+    프롬프트 형식에 맞는 고정 응답을 프로세스 안에서 돌려줍니다. 키와 네트워크 없이 개발/테스트에 씁니다.
+    error_rate를 주면 그 비율의 호출이 ConnectionError로 실패해 재시도와 서킷 브레이커를 시험할 수 있습니다.
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, **options):
+        super().__init__(**options)
+        self.latency = latency
+        self.error_rate = error_rate
+
+    def build_chat_model(self):
+        from .llm_metrics import llm_metrics_callback
+        from .llm_stub import StubChatModel
+
+        return StubChatModel(latency=self.latency, error_rate=self.error_rate,
+                             callbacks=[llm_metrics_callback])
+
+
+_provider: Optional[BaseLLMProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_llm_provider() -> BaseLLMProvider:
+    """settings.TODO_LLM_PROVIDER의 BACKEND를 만들어 프로세스 안에서 공유합니다. 나머지 키는 소문자로 바꿔 인자로 넘깁니다."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                config = dict(settings.TODO_LLM_PROVIDER)
+                backend = import_string(config.pop("BACKEND"))
+                _provider = backend(**{key.lower(): value for key, value in config.items()})
+    return _provider
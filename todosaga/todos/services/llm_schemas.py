@@ -0,0 +1,31 @@
+"""Pydantic output schemas of the LLM chains, imported when a chain is first built."""
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class CategoryWeights(BaseModel):
+    weights: Dict[str, float] = Field(
+        description="각 카테고리별 가중치 (0.0 ~ 1.0)"
+    )
+
+
+class TodoRecommendations(BaseModel):
+    recommendations: List[str] = Field(
+        description="추천할 TODO 항목 목록 (3개)",
+        min_items=3,
+        max_items=3
+    )
+
+
+class IndexedCategoryWeights(BaseModel):
+    index: int = Field(description="TODO 번호 (1부터 시작)")
+    weights: Dict[str, float] = Field(
+        description="각 카테고리별 가중치 (0.0 ~ 1.0)"
+    )
+
+
+class BatchCategoryWeights(BaseModel):
+    items: List[IndexedCategoryWeights] = Field(
+        description="각 TODO 번호별 카테고리 가중치 목록"
+    )
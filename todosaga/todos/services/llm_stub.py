@@ -0,0 +1,90 @@
+"""
+Canned LLM responses. `run_llm_stub` serves them over the OpenAI HTTP API, and
+FakeLLMProvider (settings.TODO_LLM_PROVIDER) answers with them in process.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from .todo_services import CATEGORIES
+
+NUMBERED_LINE = re.compile(r"^(\d+)\. (.*)$", re.M)
+
+
+def _weights(text: str) -> dict:
+    """제목 해시로 고른 카테고리 두 개에 0.8/0.2를 주는, 입력마다 항상 같은 가중치입니다."""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    primary, secondary = CATEGORIES[digest[0] % len(CATEGORIES)], CATEGORIES[digest[1] % len(CATEGORIES)]
+    weights = {primary: 0.8}
+    weights[secondary] = weights.get(secondary, 0) + 0.2
+    return weights
+
+
+def stub_completion(prompt: str) -> dict:
+    """
+    프롬프트에 들어 있는 응답 형식(추천, 배치 분류, 단일 분류)에 맞는 JSON 본문을 만듭니다.
+    형식 안내의 예시 스키마에는 늘 "items"가 들어 있으므로, 배치 분류는 "index" 필드로 구분합니다.
+    """
+    if '"recommendations"' in prompt:
+        seed = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:6]
+        return {"recommendations": [f"추천 할 일 {seed}-{n}" for n in range(1, 4)]}
+    if '"index"' in prompt:
+        return {"items": [
+            {"index": int(number), "weights": _weights(title)}
+            for number, title in NUMBERED_LINE.findall(prompt)
+        ]}
+    return {"weights": _weights(prompt)}
+
+
+def stub_token_usage(prompt: str, content: str) -> dict:
+    """실제 토크나이저 없이 4글자를 1토큰으로 어림한 사용량입니다."""
+    prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+class StubChatModel(BaseChatModel):
+    """
+    stub_completion으로 답하는 LangChain 채팅 모델입니다. latency초 뒤에 응답하며,
+    error_rate 비율의 호출은 ConnectionError로 실패합니다.
+    """
+
+    latency: float = 0.0
+    error_rate: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "todosaga-stub"
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        if self.error_rate and random.random() < self.error_rate:
+            raise ConnectionError("Injected stub failure")
+        prompt = messages[-1].content
+        content = json.dumps(stub_completion(prompt), ensure_ascii=False)
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=content))],
+            llm_output={"token_usage": stub_token_usage(prompt, content), "model_name": self._llm_type},
+        )
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._result(messages)
@@ -0,0 +1,142 @@
+import os
+import threading
+import unicodedata
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+
+# Hashed character n-gram space; 2**14 columns keeps the centroid matrix at ~650KB
+N_FEATURES = 2 ** 14
+NGRAM_RANGE = (1, 3)
+
+def _normalize_title(title: str) -> str:
+    title = unicodedata.normalize("NFKC", title).lower()
+    return " ".join(title.split())
+
+def char_ngram_features(title: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TODO 제목을 해시된 문자 n-gram (1~3글자) 빈도 벡터로 변환합니다.
+    희소 벡터를 (인덱스, 값) 배열 쌍으로 반환합니다.
+    """
+    text = f" {_normalize_title(title)} "
+    counts: Dict[int, float] = {}
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        for i in range(len(text) - n + 1):
+            gram = text[i:i + n]
+            if gram.isspace():
+                continue
+            idx = zlib.crc32(gram.encode("utf-8")) % N_FEATURES
+            counts[idx] = counts.get(idx, 0.0) + 1.0
+    if not counts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    # Sublinear TF dampens repeated n-grams in long titles
+    return indices, 1.0 + np.log(values)
+
+class LocalCategoryClassifier:
+    """
+    LLM이 분류한 과거 TODO로 학습하는 CPU 전용 1차 분류기입니다.
+    TF-IDF 문자 n-gram 벡터와 카테고리별 중심 벡터의 코사인 유사도를 softmax로 바꿔
+    카테고리 가중치와 신뢰도(최고 확률)를 계산합니다.
+    """
+
+    def __init__(self, categories: Sequence[str], idf: np.ndarray, centroids: np.ndarray,
+                 temperature: float = 0.05):
+        self.categories = list(categories)
+        self.idf = idf.astype(np.float32)
+        # Stored transposed (features x categories) so scoring one title is a row gather
+        self.centroids_t = np.ascontiguousarray(centroids.T, dtype=np.float32)
+        self.temperature = temperature
+
+    @classmethod
+    def fit(cls, categories: Sequence[str], titles: Sequence[str], weights: np.ndarray,
+            temperature: float = 0.05) -> "LocalCategoryClassifier":
+        """weights는 (len(titles), len(categories)) 크기의 정규화된 가중치 행렬입니다."""
+        features = [char_ngram_features(title) for title in titles]
+        doc_freq = np.zeros(N_FEATURES, dtype=np.float64)
+        for indices, _ in features:
+            doc_freq[indices] += 1.0
+        idf = np.log((1.0 + len(titles)) / (1.0 + doc_freq)) + 1.0
+
+        centroids = np.zeros((len(categories), N_FEATURES), dtype=np.float64)
+        for (indices, values), row in zip(features, np.asarray(weights, dtype=np.float64)):
+            vector = _l2_normalize(values * idf[indices])
+            centroids[:, indices] += np.outer(row, vector)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroids = np.divide(centroids, norms, out=np.zeros_like(centroids), where=norms > 0)
+        return cls(categories, idf, centroids, temperature=temperature)
+
+    def predict(self, titles: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """(가중치 행렬, 신뢰도 벡터)를 반환합니다."""
+        scores = np.zeros((len(titles), len(self.categories)), dtype=np.float32)
+        for row, title in enumerate(titles):
+            indices, values = char_ngram_features(title)
+            if len(indices):
+                vector = _l2_normalize(values * self.idf[indices])
+                scores[row] = vector @ self.centroids_t[indices]
+        logits = scores / self.temperature
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        return probs, probs.max(axis=1)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(
+            path,
+            categories=np.array(self.categories),
+            idf=self.idf,
+            centroids=self.centroids_t.T,
+            temperature=np.array(self.temperature),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LocalCategoryClassifier":
+        with np.load(path) as data:
+            return cls(
+                data["categories"].tolist(),
+                data["idf"],
+                data["centroids"],
+                temperature=float(data["temperature"]),
+            )
+
+def _l2_normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+_classifier = None
+_classifier_loaded = False
+_classifier_lock = threading.Lock()
+
+def get_local_classifier() -> Optional[LocalCategoryClassifier]:
+    """
+    settings.TODO_LOCAL_CLASSIFIER_PATH의 모델을 한 번만 로드해 반환합니다.
+    학습된 모델 파일이 없으면 None을 반환하며, 이 경우 모든 분류는 LLM으로 처리됩니다.
+    """
+    global _classifier, _classifier_loaded
+    if not _classifier_loaded:
+        with _classifier_lock:
+            if not _classifier_loaded:
+                path = settings.TODO_LOCAL_CLASSIFIER_PATH
+                if path and os.path.exists(path):
+                    _classifier = LocalCategoryClassifier.load(path)
+                _classifier_loaded = True
+    return _classifier
+
+def classify_locally(titles: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+    """
+    신뢰도가 TODO_LOCAL_CLASSIFIER_THRESHOLD 이상인 TODO만 가중치를 반환하고,
+    애매한 TODO(또는 모델이 없는 경우)는 None으로 남겨 LLM이 처리하도록 합니다.
+    """
+    classifier = get_local_classifier()
+    if classifier is None or not titles:
+        return [None] * len(titles)
+    probs, confidence = classifier.predict(titles)
+    threshold = settings.TODO_LOCAL_CLASSIFIER_THRESHOLD
+    return [
+        dict(zip(classifier.categories, row.tolist())) if conf >= threshold else None
+        for row, conf in zip(probs, confidence)
+    ]
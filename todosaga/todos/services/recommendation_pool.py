@@ -0,0 +1,114 @@
+"""
+Pre-generated recommendations for users without todos.
+
+Every new user's suggestions come from the same FALLBACK_TODO_LIST, so instead
+of sending it to the LLM on each request, `refresh_recommendation_pool` fills
+RecommendationPoolEntry with many generated triples (temperature makes them
+differ) and each worker samples from an in-memory copy of that table. The copy
+is re-read every TODO_RECOMMENDATION_POOL_RELOAD seconds, so a refresh reaches
+running workers without a restart.
+"""
+import random
+import threading
+import time
+from typing import List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+
+from todos.models import RecommendationPoolEntry
+
+from .todo_services import RECOMMENDATION_PROMPT_VERSION, generate_todo_recommendations
+
+# Fallback default TODO list for users without any todos yet
+FALLBACK_TODO_LIST = (
+    "- 아침 루틴 정립하기 (기상 시간, 스트레칭, 물 마시기 등)\n"
+    "- 주간 회의 안건 정리 및 공유\n"
+    "- 'Effective Python' 1~3장 읽고 요약 정리하기\n"
+    "- 냉장고 정리 및 유통기한 지난 식재료 폐기\n"
+    "- 30분간 걷기 운동 후 심박수 기록하기\n"
+    "- 후쿠오카 여행 일정 Google Calendar에 정리하기\n"
+    "- 3월 생활비 지출 내역 가계부에 입력하기\n"
+    "- Django 서버에 OAuth 로그인 기능 통합 테스트\n"
+    "- ChatGPT를 활용한 단편 시나리오 1편 초안 작성\n"
+    "- 책상 위 케이블 정리하고 선정리함 설치"
+)
+
+
+class RecommendationPool:
+    """
+    DB의 추천 풀을 프로세스 메모리에 올려 둔 스냅샷입니다.
+    reload_interval초가 지나면 처음 요청한 호출자 하나만 다시 읽고, 그동안 다른 요청은 이전 스냅샷을 씁니다.
+    """
+
+    def __init__(self, reload_interval: float = 300):
+        self.reload_interval = reload_interval
+        self._entries: List[List[str]] = []
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def claim_reload(self) -> bool:
+        """다시 읽을 때가 되었으면 True를 반환하고, 다른 호출자가 중복으로 읽지 않도록 표시합니다."""
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at < self.reload_interval:
+                return False
+            self._loaded_at = now
+            return True
+
+    def load(self):
+        entries = list(
+            RecommendationPoolEntry.objects.filter(prompt_version=RECOMMENDATION_PROMPT_VERSION)
+            .values_list("recommendations", flat=True)
+        )
+        self._entries = entries
+
+    def sample(self) -> Optional[List[str]]:
+        entries = self._entries
+        return random.choice(entries) if entries else None
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_pool: Optional[RecommendationPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_recommendation_pool() -> RecommendationPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = RecommendationPool(settings.TODO_RECOMMENDATION_POOL_RELOAD)
+    return _pool
+
+
+async def asample_fallback_recommendations() -> Optional[List[str]]:
+    """
+    추천 풀에서 무작위로 고른 추천 3개를 반환합니다. 풀이 비어 있으면 None입니다.
+    다시 읽을 때(프로세스마다 reload_interval초에 한 번)를 빼면 DB나 LLM을 거치지 않습니다.
+    """
+    pool = get_recommendation_pool()
+    if pool.claim_reload():
+        await sync_to_async(pool.load)()
+    return pool.sample()
+
+
+def refresh_recommendation_pool(size: int, max_concurrency: int) -> int:
+    """
+    FALLBACK_TODO_LIST로 추천을 size번 새로 만들어 풀을 통째로 바꿉니다. 중복은 하나만 남깁니다.
+    하나도 만들지 못하면(LLM 장애) 기존 풀을 그대로 둡니다. 저장한 항목 수를 반환합니다.
+    """
+    generated = generate_todo_recommendations(FALLBACK_TODO_LIST, size, max_concurrency)
+    unique = list({tuple(recommendations): recommendations for recommendations in generated}.values())
+    if not unique:
+        return 0
+    with transaction.atomic():
+        RecommendationPoolEntry.objects.all().delete()
+        RecommendationPoolEntry.objects.bulk_create([
+            RecommendationPoolEntry(recommendations=recommendations, prompt_version=RECOMMENDATION_PROMPT_VERSION)
+            for recommendations in unique
+        ])
+    return len(unique)
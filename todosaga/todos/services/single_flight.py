@@ -0,0 +1,190 @@
+"""
+Request coalescing ("single flight") for LLM calls.
+
+Callers that miss the recommendation cache for the same key at the same time
+share one upstream call instead of each sending the same prompt. The backend
+is chosen by settings.TODO_SINGLE_FLIGHT["BACKEND"]:
+
+- LocalSingleFlight coalesces callers within a process: async callers per
+  event loop (one per ASGI worker), sync callers per process.
+- CacheLockSingleFlight also takes a lock in a shared Django cache alias, so
+  one process calls upstream while the others poll `lookup` (the shared
+  recommendation cache, i.e. DjangoRecommendationCache) for its result.
+- SingleFlight, the base class, calls straight through.
+"""
+import asyncio
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+Lookup = Optional[Callable[[], Any]]
+AsyncLookup = Optional[Callable[[], Awaitable[Any]]]
+
+
+class SingleFlight:
+    """
+    백엔드 공통 인터페이스이자 합치지 않는 기본 구현입니다.
+    fn은 실제 호출, lookup은 다른 프로세스가 만든 결과를 찾는 함수(없으면 None 반환)입니다.
+    """
+
+    def __init__(self, **options):
+        pass
+
+    def do(self, key: str, fn: Callable[[], Any], lookup: Lookup = None) -> Any:
+        return fn()
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]], lookup: AsyncLookup = None) -> Any:
+        return await fn()
+
+
+class _Call:
+    """동기 호출 하나의 결과를 기다리는 스레드들이 공유하는 자리입니다."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+def _retrieve(task: asyncio.Task):
+    # Every waiter may have given up (timeout) before the task failed
+    if not task.cancelled():
+        task.exception()
+
+
+class LocalSingleFlight(SingleFlight):
+    """
+    같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과(또는 예외)를 함께 받습니다.
+    비동기 호출은 Task로 실행하고 asyncio.shield로 기다리므로, 기다리던 요청 하나가
+    타임아웃으로 취소되어도 다른 요청이 기다리는 호출은 계속됩니다.
+    """
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        # Tasks belong to the loop that created them, so keep one table per running loop
+        self._tasks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def do(self, key, fn, lookup=None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = self._lead(key, fn, lookup)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key, fn, lookup=None):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._tasks.setdefault(loop, {})
+        task = tasks.get(key)
+        if task is None:
+            task = loop.create_task(self._alead(key, fn, lookup))
+            tasks[key] = task
+
+            def _forget(finished: asyncio.Task):
+                if tasks.get(key) is finished:
+                    del tasks[key]
+                _retrieve(finished)
+
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+
+    def _lead(self, key, fn, lookup):
+        return fn()
+
+    async def _alead(self, key, fn, lookup):
+        return await fn()
+
+
+class CacheLockSingleFlight(LocalSingleFlight):
+    """
+    프로세스 안에서 합친 뒤, 키마다 공유 캐시(cache_alias)에 잠금을 잡은 프로세스 하나만 호출합니다.
+    나머지 프로세스는 poll_interval마다 lookup으로 결과를 찾고, 잠금이 풀렸는데 결과가 없으면
+    (호출 실패) 직접 잠금을 잡아 호출합니다. 잠금은 lock_timeout초 뒤 저절로 풀립니다.
+    캐시 별칭은 Redis나 DatabaseCache처럼 프로세스 사이에 공유되고 add가 원자적이어야 합니다.
+    """
+
+    key_prefix = "todo-flight"
+
+    def __init__(self, cache_alias: str = "default", lock_timeout: int = 30,
+                 poll_interval: float = 0.05, **options):
+        super().__init__(**options)
+        from django.core.cache import caches
+        self.cache = caches[cache_alias]
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    def _lock_key(self, key):
+        return f"{self.key_prefix}:{key}"
+
+    def _lead(self, key, fn, lookup):
+        lock_key, token = self._lock_key(key), uuid.uuid4().hex
+        while True:
+            if self.cache.add(lock_key, token, self.lock_timeout):
+                try:
+                    # The previous holder may have stored the result just before releasing
+                    value = lookup() if lookup is not None else None
+                    return value if value is not None else fn()
+                finally:
+                    if self.cache.get(lock_key) == token:
+                        self.cache.delete(lock_key)
+            if lookup is not None:
+                value = lookup()
+                if value is not None:
+                    return value
+            time.sleep(self.poll_interval)
+
+    async def _alead(self, key, fn, lookup):
+        lock_key, token = self._lock_key(key), uuid.uuid4().hex
+        while True:
+            if await self.cache.aadd(lock_key, token, self.lock_timeout):
+                try:
+                    value = await lookup() if lookup is not None else None
+                    return value if value is not None else await fn()
+                finally:
+                    if await self.cache.aget(lock_key) == token:
+                        await self.cache.adelete(lock_key)
+            if lookup is not None:
+                value = await lookup()
+                if value is not None:
+                    return value
+            await asyncio.sleep(self.poll_interval)
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """settings.TODO_SINGLE_FLIGHT에 설정된 백엔드 인스턴스를 반환합니다."""
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                config = dict(settings.TODO_SINGLE_FLIGHT)
+                backend = import_string(config.pop("BACKEND"))
+                _single_flight = backend(**{k.lower(): v for k, v in config.items()})
+    return _single_flight
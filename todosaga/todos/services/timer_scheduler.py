@@ -0,0 +1,172 @@
+"""
+Fires expiry for running timer-type todos.
+
+Running timers (start_time set, not completed) are kept in a min-heap keyed by
+their due time. On start the scheduler loads them through the partial index
+todo_running_timer_idx, so the cost is proportional to the running timers, not
+the table. It then polls the same index for timers started since the newest
+start_time it has seen, which picks up timers started by any process. Expired
+timers are handed to the handler in batches; the default handler completes
+them with a conditional UPDATE, so several schedulers never double-complete.
+"""
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from ..models import Todo
+from .transition_services import complete_expired_timers
+
+logger = logging.getLogger(__name__)
+
+# (due timestamp, todo id)
+Entry = Tuple[float, int]
+
+
+def running_timers(started_after: Optional[datetime] = None):
+    """실행 중인 타이머를 (id, start_time, duration_seconds)로 읽습니다. todo_running_timer_idx를 사용합니다."""
+    queryset = Todo.objects.filter(
+        completed=False, start_time__isnull=False, type=Todo.TIMER, duration_seconds__isnull=False
+    )
+    if started_after is not None:
+        queryset = queryset.filter(start_time__gte=started_after)
+    return queryset.values_list("id", "start_time", "duration_seconds")
+
+
+class TimerScheduler:
+    def __init__(self, handler: Callable[[Sequence[int]], object] = complete_expired_timers):
+        self.handler = handler
+        self.poll_interval = settings.TODO_TIMER_POLL_INTERVAL
+        self.batch_size = settings.TODO_TIMER_BATCH_SIZE
+        self._heap: List[Entry] = []
+        self._scheduled: Set[int] = set()
+        self._watermark: Optional[datetime] = None
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, rows: Iterable[Tuple[int, datetime, int]]) -> int:
+        """(id, start_time, duration_seconds) 행들을 힙에 넣습니다. 이미 있는 타이머는 건너뛰고 추가한 수를 반환합니다."""
+        added = 0
+        with self._cond:
+            earliest = self._heap[0][0] if self._heap else None
+            for todo_id, start_time, duration_seconds in rows:
+                if todo_id in self._scheduled:
+                    continue
+                self._scheduled.add(todo_id)
+                heapq.heappush(self._heap, ((start_time + timedelta(seconds=duration_seconds)).timestamp(), todo_id))
+                if self._watermark is None or start_time > self._watermark:
+                    self._watermark = start_time
+                added += 1
+            if self._heap and (earliest is None or self._heap[0][0] < earliest):
+                self._cond.notify()
+        return added
+
+    def load(self) -> int:
+        """실행 중인 타이머 전체를 읽어 힙을 만듭니다. 시작할 때 한 번 호출합니다."""
+        rows = list(running_timers().iterator(chunk_size=10_000))
+        with self._cond:
+            for todo_id, start_time, duration_seconds in rows:
+                if todo_id in self._scheduled:
+                    continue
+                self._scheduled.add(todo_id)
+                self._heap.append(((start_time + timedelta(seconds=duration_seconds)).timestamp(), todo_id))
+                if self._watermark is None or start_time > self._watermark:
+                    self._watermark = start_time
+            heapq.heapify(self._heap)
+            self._cond.notify()
+        return len(rows)
+
+    def poll(self) -> int:
+        """
+        마지막으로 본 start_time 이후에 시작된 타이머를 인덱스 범위 조회로 읽어 추가합니다.
+        늦게 커밋된 시작을 놓치지 않도록 TODO_TIMER_POLL_OVERLAP만큼 겹쳐 읽습니다.
+        """
+        since = self._watermark
+        if since is not None:
+            since -= timedelta(seconds=settings.TODO_TIMER_POLL_OVERLAP)
+        return self.schedule(running_timers(started_after=since))
+
+    def pop_due(self, now: float) -> List[int]:
+        """now까지 만료된 타이머를 최대 batch_size개 꺼냅니다."""
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+                _, todo_id = heapq.heappop(self._heap)
+                self._scheduled.discard(todo_id)
+                due.append(todo_id)
+        return due
+
+    def fire(self, todo_ids: List[int]):
+        try:
+            self.handler(todo_ids)
+        except Exception:
+            logger.exception("Failed to expire timers %s; retrying", todo_ids)
+            # Re-queue with a delay; the poll would also find them again
+            retry_at = time.time() + settings.TODO_TIMER_RETRY_DELAY
+            with self._cond:
+                for todo_id in todo_ids:
+                    if todo_id not in self._scheduled:
+                        self._scheduled.add(todo_id)
+                        heapq.heappush(self._heap, (retry_at, todo_id))
+
+    def run(self):
+        """만료된 타이머를 처리하고, 다음 만료 시각이나 다음 폴링 시각까지 기다리기를 반복합니다."""
+        loaded = False
+        next_poll = time.monotonic() + self.poll_interval
+        while not self._stopped.is_set():
+            try:
+                if not loaded:
+                    logger.info("Timer scheduler loaded %d running timers", self.load())
+                    loaded = True
+                due = self.pop_due(time.time())
+                if due:
+                    self.fire(due)
+                    continue
+                if time.monotonic() >= next_poll:
+                    self.poll()
+                    next_poll = time.monotonic() + self.poll_interval
+                with self._cond:
+                    wait = next_poll - time.monotonic()
+                    if self._heap:
+                        wait = min(wait, self._heap[0][0] - time.time())
+                    if wait > 0:
+                        self._cond.wait(wait)
+            except Exception:
+                logger.exception("Timer scheduler iteration failed")
+                self._stopped.wait(self.poll_interval)
+            finally:
+                close_old_connections()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.run, name="todo-timer-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify()
+
+
+_scheduler: Optional[TimerScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def start_scheduler() -> TimerScheduler:
+    """프로세스에 하나인 스케줄러를 백그라운드 스레드로 시작합니다. 여러 번 호출해도 한 번만 시작합니다."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TimerScheduler()
+        _scheduler.start()
+    return _scheduler
+
@@ -1,15 +1,15 @@
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
-from dotenv import load_dotenv
-import os
-from typing import Dict, List
-
-# Load environment variables
-load_dotenv()
-if not os.getenv("OPENAI_API_KEY"):
-    raise ValueError("Please set OPENAI_API_KEY environment variable")
+from django.conf import settings
+import asyncio
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+from .cache_services import fingerprint, get_recommendation_cache, normalize_todo_list
+from .llm_provider import get_llm_provider
+from .single_flight import get_single_flight
+
+# LangChain, the OpenAI SDK and the output schemas are imported only when a chain
+# is first built (see llm_provider), so importing this module stays cheap.
 
 # Define available categories
 CATEGORIES = [
@@ -18,19 +18,6 @@ CATEGORIES = [
     "재무 및 소비관리", "개발 작업", "창작활동", "기타"
 ]
 
-# Pydantic models for output parsing
-class CategoryWeights(BaseModel):
-    weights: Dict[str, float] = Field(
-        description="각 카테고리별 가중치 (0.0 ~ 1.0)"
-    )
-
-class TodoRecommendations(BaseModel):
-    recommendations: List[str] = Field(
-        description="추천할 TODO 항목 목록 (3개)",
-        min_items=3,
-        max_items=3
-    )
-
 def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
     """정규화 함수: 각 카테고리의 가중치를 총합 1이 되도록 변환합니다."""
     total = sum(weights.values())
@@ -38,15 +25,7 @@ def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
         return {k: 1.0 / len(weights) for k in weights}
     return {k: v / total for k, v in weights.items()}
 
-def get_category_weights(todo: str) -> Dict[str, float]:
-    """
-    주어진 TODO 항목에 대해 각 카테고리별 가중치를 계산하고 정규화한 결과를 반환합니다.
-    """
-    parser = PydanticOutputParser(pydantic_object=CategoryWeights)
-    
-    prompt_template = PromptTemplate(
-        input_variables=["todo", "categories", "format_instructions"],
-        template="""다음은 사용자의 TODO 입니다:
+CLASSIFICATION_TEMPLATE = """다음은 사용자의 TODO 입니다:
 {todo}
 
 위의 TODO를 다음 카테고리들의 가중치로 답변해주세요:
@@ -56,29 +35,11 @@ def get_category_weights(todo: str) -> Dict[str, float]:
 
 각 카테고리에 대해 0.0에서 1.0 사이의 가중치를 할당해주세요.
 가중치는 해당 카테고리와의 관련성을 나타냅니다."""
-    )
-    
-    llm = ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0.7)
-    chain = prompt_template | llm | parser
-    
-    response = chain.invoke({
-        "todo": todo,
-        "categories": "\n".join(CATEGORIES),
-        "format_instructions": parser.get_format_instructions()
-    })
-    
-    normalized = normalize_weights(response.weights)
-    return normalized
 
-def get_todo_recommendations(todo_list: str) -> List[str]:
-    """
-    기존 TODO 리스트를 바탕으로 새로운 TODO 추천 항목 3개를 반환합니다.
-    """
-    parser = PydanticOutputParser(pydantic_object=TodoRecommendations)
-    
-    prompt_template = PromptTemplate(
-        input_variables=["todo_list", "format_instructions"],
-        template="""다음은 사용자의 기존 TODO 리스트입니다:
+# Bump whenever RECOMMENDATION_TEMPLATE or the model settings change so cached results are not reused
+RECOMMENDATION_PROMPT_VERSION = "1"
+
+RECOMMENDATION_TEMPLATE = """다음은 사용자의 기존 TODO 리스트입니다:
 {todo_list}
 
 위의 리스트를 분석한 뒤, 사용자가 할 만한 새로운 TODO를 3개 추천해 주세요.
@@ -101,13 +62,140 @@ TODO 성격은 다음과 같아서는 안됩니다.
 }}
 
 {format_instructions}"""
+
+_chain_lock = threading.Lock()
+_classification_chain = None
+_recommendation_chain = None
+# asyncio primitives are bound to the loop they are first used on, so keep one
+# semaphore per running loop (one per process under ASGI).
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def get_llm():
+    """
+    settings.TODO_LLM_PROVIDER가 만든, 프로세스 전체에서 공유하는 LLM Runnable을 반환합니다.
+    처음 호출할 때 만들어지며, 내부 HTTP 클라이언트(커넥션 풀)를 요청마다 새로 만들지 않고 재사용합니다.
+    호출마다 재시도와 서킷 브레이커를 거치고, 업스트림을 쓸 수 없으면 LLMUnavailable을 발생시킵니다.
+    """
+    return get_llm_provider().get_runnable()
+
+def build_chain(template: str, schema, operation: str, **partials):
+    """
+    template | LLM | schema 파서 체인을 만듭니다. format_instructions와 partials는 미리 채워 둡니다.
+    LangChain은 여기서 처음 import됩니다.
+    """
+    from langchain.output_parsers import PydanticOutputParser
+    from langchain.prompts import PromptTemplate
+
+    parser = PydanticOutputParser(pydantic_object=schema)
+    prompt = PromptTemplate.from_template(template).partial(
+        format_instructions=parser.get_format_instructions(), **partials
+    )
+    return (prompt | get_llm() | parser).with_config(metadata={"operation": operation})
+
+def _get_classification_chain():
+    global _classification_chain
+    if _classification_chain is None:
+        with _chain_lock:
+            if _classification_chain is None:
+                from .llm_schemas import CategoryWeights
+
+                _classification_chain = build_chain(
+                    CLASSIFICATION_TEMPLATE, CategoryWeights, "classification",
+                    categories="\n".join(CATEGORIES),
+                )
+    return _classification_chain
+
+def get_category_weights(todo: str) -> Dict[str, float]:
+    """
+    주어진 TODO 항목에 대해 각 카테고리별 가중치를 계산하고 정규화한 결과를 반환합니다.
+    """
+    response = _get_classification_chain().invoke({"todo": todo})
+    normalized = normalize_weights(response.weights)
+    return normalized
+
+def _get_recommendation_chain():
+    global _recommendation_chain
+    if _recommendation_chain is None:
+        with _chain_lock:
+            if _recommendation_chain is None:
+                from .llm_schemas import TodoRecommendations
+
+                _recommendation_chain = build_chain(
+                    RECOMMENDATION_TEMPLATE, TodoRecommendations, "recommendation"
+                )
+    return _recommendation_chain
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.TODO_LLM_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+def recommendation_cache_key(todo_list: str) -> str:
+    return fingerprint(RECOMMENDATION_PROMPT_VERSION, normalize_todo_list(todo_list))
+
+def get_todo_recommendations(todo_list: str, user_id: Optional[int] = None) -> List[str]:
+    """
+    기존 TODO 리스트를 바탕으로 새로운 TODO 추천 항목 3개를 반환합니다.
+    같은 TODO 리스트에 대한 결과는 캐시에서 반환하며, user_id가 주어지면 해당 사용자의
+    Todo가 바뀔 때 무효화할 수 있도록 키를 기억합니다.
+    캐시에 없는 같은 TODO 리스트를 동시에 요청하면 LLM 호출 하나를 함께 기다립니다 (TODO_SINGLE_FLIGHT).
+    """
+    cache = get_recommendation_cache()
+    key = recommendation_cache_key(todo_list)
+    recommendations = cache.get(key)
+    if recommendations is None:
+        def _call():
+            response = _get_recommendation_chain().invoke({"todo_list": todo_list})
+            cache.set(key, response.recommendations)
+            return response.recommendations
+
+        recommendations = get_single_flight().do(key, _call, lookup=lambda: cache.peek(key))
+    if user_id is not None:
+        cache.remember_user(user_id, key)
+    return recommendations
+
+def generate_todo_recommendations(todo_list: str, count: int, max_concurrency: int) -> List[List[str]]:
+    """
+    캐시와 호출 합치기를 거치지 않고 같은 TODO 리스트로 추천을 count번 새로 만듭니다.
+    temperature 때문에 결과가 호출마다 다르며, 실패한 호출은 결과에서 빠집니다.
+    """
+    responses = _get_recommendation_chain().batch(
+        [{"todo_list": todo_list}] * count,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
     )
-    
-    llm = ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0.7)
-    chain = prompt_template | llm | parser
-    
-    response = chain.invoke({
-        "todo_list": todo_list,
-        "format_instructions": parser.get_format_instructions()
-    })
-    return response.recommendations
+    return [response.recommendations for response in responses if not isinstance(response, Exception)]
+
+async def aget_todo_recommendations(todo_list: str, user_id: Optional[int] = None) -> List[str]:
+    """
+    get_todo_recommendations의 비동기 버전입니다.
+    동시에 진행되는 LLM 호출 수를 TODO_LLM_MAX_CONCURRENCY로 제한하고,
+    대기 시간을 포함한 전체 소요 시간이 TODO_LLM_TIMEOUT을 넘으면 asyncio.TimeoutError를 발생시킵니다.
+    같은 키로 이미 진행 중인 호출이 있으면 그 결과를 함께 기다리며, 기다리던 요청이 타임아웃되어도
+    공유 호출은 자신의 TODO_LLM_TIMEOUT까지 계속되어 결과를 캐시에 넣습니다.
+    """
+    cache = get_recommendation_cache()
+    key = recommendation_cache_key(todo_list)
+    recommendations = await cache.aget(key)
+    if recommendations is None:
+        async def _run():
+            async with _get_semaphore():
+                return await _get_recommendation_chain().ainvoke({"todo_list": todo_list})
+
+        async def _call():
+            response = await asyncio.wait_for(_run(), timeout=settings.TODO_LLM_TIMEOUT)
+            await cache.aset(key, response.recommendations)
+            return response.recommendations
+
+        recommendations = await asyncio.wait_for(
+            get_single_flight().ado(key, _call, lookup=lambda: cache.apeek(key)),
+            timeout=settings.TODO_LLM_TIMEOUT,
+        )
+    if user_id is not None:
+        await cache.aremember_user(user_id, key)
+    return recommendations
@@ -0,0 +1,186 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+import numpy as np
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.events import TimerStarted, TodoCompleted, publish
+from core.push import push_to_user
+from notifications.services.notification_services import buffered_notifications
+from stats.services.activity_services import record_activity
+from stats.services.stat_services import award_completion_exp
+
+from ..models import Todo
+
+class TransitionError(Exception):
+    """상태 전이가 불가능할 때 발생합니다. detail은 API 응답 메시지로 그대로 사용합니다."""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class TodoNotFound(TransitionError):
+    def __init__(self):
+        super().__init__("Todo not found.")
+
+
+@dataclass(frozen=True)
+class CompletedTodo:
+    todo_id: int
+    gained_exp: int
+    completed_at: datetime
+
+
+def _mark_completed(user_id: int, todo_id: int, now: datetime, exp: int) -> Tuple[bool, Optional[np.ndarray]]:
+    """
+    UPDATE ... WHERE completed = false RETURNING category_weights 한 번으로 완료 처리하고
+    (바뀌었는지, 카테고리 가중치)를 반환합니다. 가중치를 읽으려고 SELECT를 한 번 더 하지 않습니다.
+    """
+    quote = connection.ops.quote_name
+    column = {name: quote(Todo._meta.get_field(name).column) for name in (
+        "id", "user", "completed", "completed_at", "gained_exp", "category_weights",
+    )}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(Todo._meta.db_table)} "
+            f"SET {column['completed']} = %s, {column['completed_at']} = %s, {column['gained_exp']} = %s "
+            f"WHERE {column['id']} = %s AND {column['user']} = %s AND {column['completed']} = %s "
+            f"RETURNING {column['category_weights']}",
+            [True, Todo._meta.get_field("completed_at").get_db_prep_save(now, connection), exp, todo_id, user_id, False],
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return False, None
+    return True, Todo(category_weights=row[0]).category_weight_vector
+
+
+def complete_todo(user, todo_id: int) -> CompletedTodo:
+    """
+    Todo를 조건부 UPDATE 한 번으로 완료 처리합니다 (UPDATE ... WHERE completed = false RETURNING).
+    동시에 여러 요청이 들어와도 데이터베이스가 행 단위로 직렬화하므로 정확히 하나만 성공하고,
+    나머지는 TransitionError를 받습니다. 성공한 경우 같은 트랜잭션에서 카테고리별 경험치 집계와
+    일별 활동 비트맵을 갱신합니다.
+    """
+    now = timezone.now()
+    exp = settings.STATS_COMPLETION_EXP
+    with transaction.atomic():
+        updated, weights = _mark_completed(user.id, todo_id, now, exp)
+        if updated:
+            award_completion_exp(user.id, [(exp, weights)])
+            record_activity(user.id, [timezone.localdate(now)])
+            publish(TodoCompleted(user.id, todo_id, now, exp))
+            return CompletedTodo(todo_id, exp, now)
+    # Only failed transitions pay for a second query to tell the two errors apart
+    if Todo.objects.filter(id=todo_id, user=user).exists():
+        raise TransitionError("Todo already completed.")
+    raise TodoNotFound()
+
+
+def complete_todos(user, todo_ids: Sequence[int]) -> Dict[int, Dict]:
+    """
+    사용자의 Todo 여러 개를 한 번의 UPDATE로 완료 처리합니다.
+    id별 결과를 {"gained_exp", "completed_at"} 또는 {"error": "not_found" | "already_completed"}
+    형태로 반환합니다.
+    """
+    todo_ids = list(dict.fromkeys(todo_ids))
+    now = timezone.now()
+    exp = settings.STATS_COMPLETION_EXP
+    with transaction.atomic():
+        # Lock the rows so a concurrent single complete cannot slip in between read and UPDATE
+        rows = (
+            Todo.objects.select_for_update()
+            .filter(user=user, id__in=todo_ids)
+            .only("id", "completed", "category_weights")
+        )
+        todos = {todo.id: todo for todo in rows}
+        state = {todo_id: todo.completed for todo_id, todo in todos.items()}
+        pending = [todo_id for todo_id in todo_ids if state.get(todo_id) is False]
+        if pending:
+            Todo.objects.filter(id__in=pending).update(
+                completed=True, completed_at=now, gained_exp=exp
+            )
+            award_completion_exp(user.id, [
+                (exp, todos[todo_id].category_weight_vector) for todo_id in pending
+            ])
+            record_activity(user.id, [timezone.localdate(now)])
+            publish(*[TodoCompleted(user.id, todo_id, now, exp) for todo_id in pending])
+
+    results = {}
+    for todo_id in todo_ids:
+        if todo_id not in state:
+            results[todo_id] = {"error": "not_found"}
+        elif state[todo_id]:
+            results[todo_id] = {"error": "already_completed"}
+        else:
+            results[todo_id] = {
+                "gained_exp": exp,
+                "completed_at": now,
+            }
+    return results
+
+
+def start_timer(user, todo_id: int) -> datetime:
+    """
+    타이머형 Todo의 타이머를 조건부 UPDATE 한 번으로 시작하고 시작 시각을 반환합니다
+    (UPDATE ... WHERE type = 'timer' AND start_time IS NULL).
+    """
+    now = timezone.now()
+    updated = Todo.objects.filter(
+        id=todo_id, user=user, type=Todo.TIMER, start_time__isnull=True
+    ).update(start_time=now)
+    if updated:
+        publish(TimerStarted(user.id, todo_id, now))
+        return now
+    todo = Todo.objects.filter(id=todo_id, user=user).only("type", "start_time").first()
+    if todo is None:
+        raise TodoNotFound()
+    if todo.type != Todo.TIMER:
+        raise TransitionError("Only timer type todos can be started.")
+    raise TransitionError("Timer already started.")
+
+
+def complete_expired_timers(todo_ids: Sequence[int]) -> List[CompletedTodo]:
+    """
+    시간이 다 된 타이머형 Todo들을 한 번의 UPDATE로 완료 처리합니다. 타이머 스케줄러가 호출합니다.
+    행을 잠근 뒤 아직 완료되지 않았고 실제로 만료된 것만 처리하므로, 사용자가 먼저 완료했거나
+    여러 스케줄러가 같은 타이머를 처리해도 한 번만 완료됩니다. 완료된 Todo마다 timer_finished를 푸시합니다.
+    """
+    now = timezone.now()
+    exp = settings.STATS_COMPLETION_EXP
+    with buffered_notifications(), transaction.atomic():
+        rows = (
+            Todo.objects.select_for_update()
+            .filter(
+                id__in=list(todo_ids), type=Todo.TIMER, completed=False,
+                start_time__isnull=False, duration_seconds__isnull=False,
+            )
+            .only("id", "user_id", "start_time", "duration_seconds", "category_weights")
+        )
+        expired = [
+            todo for todo in rows
+            if todo.start_time + timedelta(seconds=todo.duration_seconds) <= now
+        ]
+        if not expired:
+            return []
+        Todo.objects.filter(id__in=[todo.id for todo in expired]).update(
+            completed=True, completed_at=now, gained_exp=exp
+        )
+        by_user = defaultdict(list)
+        for todo in expired:
+            by_user[todo.user_id].append(todo)
+        for user_id, todos in by_user.items():
+            award_completion_exp(user_id, [(exp, todo.category_weight_vector) for todo in todos])
+            record_activity(user_id, [timezone.localdate(now)])
+            for todo in todos:
+                push_to_user(user_id, "timer_finished", {
+                    "todo_id": todo.id,
+                    "gained_exp": exp,
+                    "completed_at": now.isoformat(),
+                })
+        publish(*[TodoCompleted(todo.user_id, todo.id, now, exp) for todo in expired])
+    return [CompletedTodo(todo.id, exp, now) for todo in expired]
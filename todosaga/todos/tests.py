@@ -1,3 +1,572 @@
-from django.test import TestCase
+import asyncio
+import base64
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+from stats.models import UserCategoryStat
+
+from .models import Category, RecommendationPoolEntry, Todo
+from .management.commands.train_category_classifier import load_persisted_todos
+from .pagination import InvalidCursor, paginate_keyset
+from .services import cache_services, classification_services, llm_provider, recommendation_pool, todo_services
+from .services.cache_services import LocMemRecommendationCache
+from .services.classification_queue import classify_and_store
+from .services.llm_provider import CircuitBreaker, FakeLLMProvider, LLMUnavailable, OpenAIProvider
+from .services.recommendation_pool import RecommendationPool, refresh_recommendation_pool
+from .services.single_flight import LocalSingleFlight
+from .services.timer_scheduler import TimerScheduler
+from .services.todo_services import CATEGORIES, aget_todo_recommendations, get_todo_recommendations
+from .services.transition_services import TransitionError, TodoNotFound, complete_expired_timers, complete_todo
+
+User = get_user_model()
+
+# Events dispatch right after commit in the calling thread, so nothing outlives the test
+SYNC_EVENTS = override_settings(CORE_EVENT_BUS_ASYNC=False)
+
+
+@SYNC_EVENTS
+class CompleteTodoRaceTests(TransactionTestCase):
+    threads = 8
+
+    def test_exactly_one_concurrent_completion_wins(self):
+        user = User.objects.create_user("racer")
+        todo = Todo.objects.create(user=user, title="race", type=Todo.CHECK)
+        todo.category_weight_vector = [1.0] + [0.0] * 9
+        todo.save(update_fields=["category_weights"])
+
+        barrier = threading.Barrier(self.threads)
+        results, lock = [], threading.Lock()
+
+        def worker():
+            try:
+                barrier.wait()
+                try:
+                    outcome = complete_todo(user, todo.id)
+                except TransitionError as e:
+                    outcome = e
+                with lock:
+                    results.append(outcome)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker) for _ in range(self.threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        wins = [r for r in results if not isinstance(r, Exception)]
+        losses = [r for r in results if isinstance(r, TransitionError)]
+        self.assertEqual(len(wins), 1)
+        self.assertEqual(len(losses), self.threads - 1)
+        self.assertTrue(all(e.detail == "Todo already completed." for e in losses))
+
+        todo.refresh_from_db()
+        self.assertTrue(todo.completed)
+        self.assertEqual(todo.gained_exp, wins[0].gained_exp)
+        self.assertEqual(
+            sum(UserCategoryStat.objects.filter(user=user).values_list("total_exp", flat=True)),
+            wins[0].gained_exp,
+        )
+
+
+@SYNC_EVENTS
+class CompleteTodoQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("counter")
+        self.todo = Todo.objects.create(user=self.user, title="count", type=Todo.CHECK)
+        self.todo.category_weight_vector = [0.5, 0.5] + [0.0] * 8
+        self.todo.save(update_fields=["category_weights"])
+
+    def test_transition_is_one_statement(self):
+        with CaptureQueriesContext(connection) as queries:
+            outcome = complete_todo(self.user, self.todo.id)
+        # Reading the todo and saving it took two; UPDATE ... RETURNING also brings back the weights
+        self.assertEqual(len([q for q in queries if '"todos_todo"' in q["sql"]]), 1)
+        self.assertEqual(
+            dict(UserCategoryStat.objects.filter(user=self.user).values_list("category", "total_exp")),
+            {CATEGORIES[0]: outcome.gained_exp // 2, CATEGORIES[1]: outcome.gained_exp // 2},
+        )
+
+    def test_already_completed_query_count(self):
+        complete_todo(self.user, self.todo.id)
+        # savepoint, UPDATE (0 rows), release, EXISTS
+        with self.assertNumQueries(4):
+            with self.assertRaisesMessage(TransitionError, "Todo already completed."):
+                complete_todo(self.user, self.todo.id)
+
+    def test_other_users_todo_is_not_found(self):
+        other = User.objects.create_user("other")
+        with self.assertRaises(TodoNotFound):
+            complete_todo(other, self.todo.id)
+
+
+@SYNC_EVENTS
+class CompleteExpiredTimersTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("timekeeper")
+        now = timezone.now()
+        self.expired, self.running, self.finished = Todo.objects.bulk_create([
+            Todo(user=self.user, title=title, type=Todo.TIMER, duration_seconds=60,
+                 start_time=now - timedelta(seconds=age), completed=completed)
+            for title, age, completed in [("expired", 120, False), ("running", 30, False), ("finished", 120, True)]
+        ])
+        self.ids = [self.expired.id, self.running.id, self.finished.id]
+
+    def total_exp(self):
+        return sum(UserCategoryStat.objects.filter(user=self.user).values_list("total_exp", flat=True))
+
+    def test_completes_only_expired_running_timers(self):
+        completed = complete_expired_timers(self.ids)
+        self.assertEqual([c.todo_id for c in completed], [self.expired.id])
+        self.assertEqual(
+            dict(Todo.objects.filter(id__in=self.ids).values_list("title", "completed")),
+            {"expired": True, "running": False, "finished": True},
+        )
+
+    def test_second_run_is_a_no_op(self):
+        first = complete_expired_timers(self.ids)
+        exp = self.total_exp()
+        self.assertEqual(complete_expired_timers(self.ids), [])
+        self.assertEqual(self.total_exp(), exp)
+        self.assertEqual(exp, first[0].gained_exp)
+
+    def test_user_completion_first_wins(self):
+        complete_todo(self.user, self.expired.id)
+        exp = self.total_exp()
+        self.assertEqual(complete_expired_timers([self.expired.id]), [])
+        self.assertEqual(self.total_exp(), exp)
+
+
+class TimerSchedulerTests(SimpleTestCase):
+    def test_schedules_each_timer_once_and_pops_in_due_order(self):
+        scheduler = TimerScheduler(handler=mock.Mock())
+        now = timezone.now()
+        rows = [(1, now, 60), (2, now, 10), (3, now, 30)]
+        self.assertEqual(scheduler.schedule(rows), 3)
+        # The overlapping poll sees the same rows again
+        self.assertEqual(scheduler.schedule(rows), 0)
+        self.assertEqual(scheduler.pop_due(now.timestamp() + 30), [2, 3])
+        self.assertEqual(scheduler.pop_due(now.timestamp() + 30), [])
+        self.assertEqual(len(scheduler), 1)
+
+    def test_failed_batch_is_requeued(self):
+        scheduler = TimerScheduler(handler=mock.Mock(side_effect=RuntimeError))
+        with self.assertLogs("todos.services.timer_scheduler", "ERROR"):
+            scheduler.fire([1, 2])
+        self.assertEqual(len(scheduler), 2)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(llm_provider.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    def fail(self, times):
+        for _ in range(times):
+            self.breaker.before_call()
+            self.breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(LLMUnavailable):
+            self.breaker.before_call()
+
+    def test_success_resets_the_count(self):
+        self.fail(2)
+        self.breaker.record_success()
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open_lets_one_probe_through(self):
+        self.fail(3)
+        self.now += 29
+        with self.assertRaises(LLMUnavailable):
+            self.breaker.before_call()
+        self.now += 1
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        # Everyone else waits for the probe's outcome
+        with self.assertRaises(LLMUnavailable):
+            self.breaker.before_call()
+
+    def test_probe_success_closes(self):
+        self.fail(3)
+        self.now += 30
+        self.breaker.before_call()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.breaker.before_call()
+
+    def test_probe_failure_reopens_for_another_timeout(self):
+        self.fail(3)
+        self.now += 30
+        self.fail(1)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.now += 29
+        with self.assertRaises(LLMUnavailable):
+            self.breaker.before_call()
+        self.now += 1
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+
+    @override_settings(TODO_LLM_MAX_RETRIES=0)
+    def test_open_breaker_stops_upstream_calls(self):
+        provider = FakeLLMProvider(failure_threshold=2, retry_backoff=0)
+        provider.get_chat_model()
+        upstream = mock.Mock(invoke=mock.Mock(side_effect=ConnectionError("down")))
+        provider._chat_model = upstream
+        for _ in range(2):
+            with self.assertRaisesMessage(LLMUnavailable, "down"):
+                provider.invoke("prompt")
+        with self.assertRaisesMessage(LLMUnavailable, "circuit breaker is open"):
+            provider.invoke("prompt")
+        self.assertEqual(upstream.invoke.call_count, 2)
+
+
+class LazyLLMImportTests(SimpleTestCase):
+    def test_url_loading_skips_llm_imports(self):
+        # A fresh interpreter: this one has imported LangChain for other tests already
+        script = (
+            "import sys, django; django.setup(); import todosaga.urls; "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & {'langchain', 'langchain_core', 'langchain_openai', 'openai'}))"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "OPENAI_API_KEY"}
+        env["DJANGO_SETTINGS_MODULE"] = "todosaga.settings.development"
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=settings.BASE_DIR, env=env,
+            capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_api_key_is_checked_on_first_use(self):
+        # Constructing the provider is fine without a key
+        provider = OpenAIProvider()
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": ""}), mock.patch("dotenv.load_dotenv"):
+            with self.assertRaises(ImproperlyConfigured):
+                provider.get_chat_model()
+
+
+class LocMemRecommendationCacheTests(SimpleTestCase):
+    def test_user_mappings_go_with_evicted_entries(self):
+        cache = LocMemRecommendationCache(timeout=60, max_entries=2)
+        for n in range(100):
+            cache.set(f"key-{n}", [n])
+            cache.remember_user(n, f"key-{n}")
+        self.assertEqual((cache.get_stats()["size"], cache.get_stats()["users"]), (2, 2))
+
+    def test_user_mappings_go_with_expired_entries(self):
+        cache = LocMemRecommendationCache(timeout=60)
+        cache.set("key", ["a"])
+        cache.remember_user(1, "key")
+        with mock.patch.object(cache_services.time, "monotonic", return_value=time.monotonic() + 61):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get_stats()["users"], 0)
+        # Remembering a key that is no longer cached records nothing
+        cache.remember_user(1, "key")
+        self.assertEqual(cache.get_stats()["users"], 0)
+
+    def test_invalidate_user(self):
+        cache = LocMemRecommendationCache(timeout=60)
+        cache.set("old", ["a"])
+        cache.set("new", ["b"])
+        cache.remember_user(1, "old")
+        cache.remember_user(1, "new")
+        cache.invalidate_user(1)
+        self.assertEqual((cache.peek("old"), cache.peek("new")), (["a"], None))
+        self.assertEqual(cache.get_stats()["users"], 0)
+
+
+class CountingLLMProvider(FakeLLMProvider):
+    """FakeLLMProvider that counts calls reaching the upstream (retries included in one call)."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.calls = 0
+
+    def invoke(self, input, config=None):
+        self.calls += 1
+        return super().invoke(input, config)
+
+    async def ainvoke(self, input, config=None):
+        self.calls += 1
+        return await super().ainvoke(input, config)
+
+
+@override_settings(TODO_LLM_MAX_RETRIES=0, TODO_LLM_TIMEOUT=5)
+class RecommendationSingleFlightTests(SimpleTestCase):
+    requests = 100
+
+    def setUp(self):
+        self.todo_list = f"- single flight {uuid.uuid4().hex}"
+        self.cache = LocMemRecommendationCache(timeout=60)
+        self.flight = LocalSingleFlight()
+        for target, attribute, value in [
+            (todo_services, "get_recommendation_cache", lambda: self.cache),
+            (todo_services, "get_single_flight", lambda: self.flight),
+            # Rebuilt on first use around the provider below
+            (todo_services, "_recommendation_chain", None),
+        ]:
+            patcher = mock.patch.object(target, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.use_provider(latency=0.3)
+
+    def use_provider(self, **options):
+        self.provider = CountingLLMProvider(retry_backoff=0, **options)
+        patcher = mock.patch.object(llm_provider, "_provider", self.provider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_concurrent_async_requests_share_one_call(self):
+        results = await asyncio.gather(*(
+            aget_todo_recommendations(self.todo_list) for _ in range(self.requests)
+        ))
+        self.assertEqual(self.provider.calls, 1)
+        self.assertEqual(len({tuple(result) for result in results}), 1)
+
+    def test_concurrent_sync_requests_share_one_call(self):
+        barrier = threading.Barrier(self.requests)
+        results, lock = [], threading.Lock()
+
+        def worker():
+            barrier.wait()
+            result = get_todo_recommendations(self.todo_list)
+            with lock:
+                results.append(result)
+
+        workers = [threading.Thread(target=worker) for _ in range(self.requests)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(self.provider.calls, 1)
+        self.assertEqual(len(results), self.requests)
+
+    async def test_failure_is_shared_by_all_waiters(self):
+        self.use_provider(latency=0.3, error_rate=1.0)
+        results = await asyncio.gather(*(
+            aget_todo_recommendations(self.todo_list) for _ in range(10)
+        ), return_exceptions=True)
+        self.assertEqual(self.provider.calls, 1)
+        self.assertTrue(all(isinstance(result, LLMUnavailable) for result in results))
+        # Nothing was cached, so the next request calls again
+        with self.assertRaises(LLMUnavailable):
+            await aget_todo_recommendations(self.todo_list)
+        self.assertEqual(self.provider.calls, 2)
+
+    async def test_waiter_timeout_does_not_cancel_shared_call(self):
+        patient = asyncio.ensure_future(aget_todo_recommendations(self.todo_list))
+        await asyncio.sleep(0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(aget_todo_recommendations(self.todo_list), timeout=0.05)
+        self.assertEqual(len(await patient), 3)
+        self.assertEqual(self.provider.calls, 1)
+
+    async def test_call_completes_after_every_waiter_gave_up(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(aget_todo_recommendations(self.todo_list), timeout=0.05)
+        # The shared call finishes on its own and fills the cache (first use also imports LangChain)
+        key = todo_services.recommendation_cache_key(self.todo_list)
+        for _ in range(100):
+            if self.cache.peek(key) is not None:
+                break
+            await asyncio.sleep(0.05)
+        self.assertIsNotNone(self.cache.peek(key))
+        await aget_todo_recommendations(self.todo_list)
+        self.assertEqual(self.provider.calls, 1)
+
+
+@override_settings(TODO_LLM_MAX_RETRIES=0)
+class RefreshRecommendationPoolTests(TestCase):
+    def setUp(self):
+        self.old = RecommendationPoolEntry.objects.create(
+            recommendations=["old"], prompt_version=todo_services.RECOMMENDATION_PROMPT_VERSION,
+        )
+        patcher = mock.patch.object(todo_services, "_recommendation_chain", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def use_provider(self, **options):
+        provider = CountingLLMProvider(retry_backoff=0, failure_threshold=1000, **options)
+        patcher = mock.patch.object(llm_provider, "_provider", provider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return provider
+
+    def test_failing_provider_keeps_the_pool(self):
+        provider = self.use_provider(error_rate=1.0)
+        self.assertEqual(refresh_recommendation_pool(size=5, max_concurrency=2), 0)
+        self.assertEqual(provider.calls, 5)
+        self.assertQuerySetEqual(RecommendationPoolEntry.objects.all(), [self.old])
+
+    def test_command_fails_when_nothing_was_generated(self):
+        self.use_provider(error_rate=1.0)
+        with self.assertRaisesMessage(CommandError, "kept the existing pool"):
+            call_command("refresh_recommendation_pool", size=3, stdout=io.StringIO())
+        self.assertTrue(RecommendationPoolEntry.objects.filter(id=self.old.id).exists())
+
+    def test_replaces_the_pool_with_unique_answers(self):
+        self.use_provider()
+        # The fake model gives the same answer every time
+        self.assertEqual(refresh_recommendation_pool(size=4, max_concurrency=2), 1)
+        entries = list(RecommendationPoolEntry.objects.values_list("recommendations", flat=True))
+        self.assertEqual(len(entries), 1)
+        self.assertNotEqual(entries[0], ["old"])
+
+    def test_if_empty_skips_a_filled_pool(self):
+        provider = self.use_provider()
+        out = io.StringIO()
+        call_command("refresh_recommendation_pool", if_empty=True, stdout=out)
+        self.assertIn("skipping", out.getvalue())
+        self.assertEqual(provider.calls, 0)
+
+
+class TodoSuggestionsViewTests(TestCase):
+    url = "/todos/todos/suggestions"
+
+    def setUp(self):
+        User.objects.create_user("suggest", password="pw-suggest")
+        RecommendationPoolEntry.objects.create(
+            recommendations=["a", "b", "c"], prompt_version=todo_services.RECOMMENDATION_PROMPT_VERSION,
+        )
+        # A fresh snapshot that loads the entry above on first use
+        patcher = mock.patch.object(recommendation_pool, "_pool", RecommendationPool())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def basic_auth(self, password="pw-suggest"):
+        token = base64.b64encode(f"suggest:{password}".encode()).decode()
+        return {"HTTP_AUTHORIZATION": f"Basic {token}"}
+
+    def test_basic_authentication(self):
+        response = self.client.get(self.url, **self.basic_auth())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), ["a", "b", "c"])
+
+    def test_session_authentication(self):
+        self.client.login(username="suggest", password="pw-suggest")
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_rejects_anonymous_and_bad_credentials(self):
+        # Same answers as the sync APIViews (SessionAuthentication comes first, so no 401 challenge)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        self.assertEqual(self.client.get(self.url, **self.basic_auth("wrong")).status_code, 403)
+
+    def test_listed_in_api_schema(self):
+        schema = OpenAPISchemaGenerator(openapi.Info(title="Todos API", default_version="v1")).get_schema(public=True)
+        operation = schema["paths"][self.url]["get"]
+        self.assertIn("200", operation["responses"])
+
+
+@SYNC_EVENTS
+@override_settings(TODO_CLASSIFICATION_QUEUE_ENABLED=False)
+class TodoCreateValidationTests(TestCase):
+    url = "/todos/todos"
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("creator"))
+
+    def create(self, **fields):
+        return self.client.post(self.url, {"title": "t", "type": Todo.CHECK, **fields},
+                                content_type="application/json")
+
+    def test_categories_are_stored_as_names(self):
+        response = self.create(categories=["운동", 1, "운동"])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["categories"], ["운동", "1"])
+
+    def test_rejects_non_list_categories(self):
+        response = self.create(categories="abc")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("categories", response.json())
+        self.assertFalse(Category.objects.exists())
+
+    def test_rejects_overlong_category_name(self):
+        response = self.create(categories=["x" * 101])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Todo.objects.exists())
+
+    def test_timer_requires_duration(self):
+        response = self.create(type=Todo.TIMER)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("duration_seconds", response.json())
+
+
+class KeysetPaginationTests(TestCase):
+    def test_walk_returns_every_row_once_in_order(self):
+        user = User.objects.create_user("pager")
+        Todo.objects.bulk_create([Todo(user=user, title=f"t{i}", type=Todo.CHECK) for i in range(7)])
+        # Ties on created_at are broken by id
+        Todo.objects.filter(title__in=["t2", "t3", "t4"]).update(created_at=timezone.now())
+        expected = list(
+            Todo.objects.filter(user=user).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        seen, cursor = [], None
+        while True:
+            rows, cursor = paginate_keyset(Todo.objects.filter(user=user), cursor, 3)
+            seen.extend(todo.id for todo in rows)
+            if cursor is None:
+                break
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            paginate_keyset(Todo.objects.all(), "not-a-cursor", 3)
+
+
+class ClassificationSourceTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user("classified")
+        self.local, self.llm, self.failed = Todo.objects.bulk_create([
+            Todo(user=user, title=title, type=Todo.CHECK) for title in ("local", "llm", "failed")
+        ])
+        local_weights = dict.fromkeys(CATEGORIES, 0.0) | {CATEGORIES[0]: 1.0}
+        llm_weights = dict.fromkeys(CATEGORIES, 0.0) | {CATEGORIES[1]: 1.0}
+
+        async def classify_with_llm(titles):
+            return [llm_weights if title == "llm" else None for title in titles]
+
+        for attribute, value in [
+            ("classify_locally", lambda titles: [local_weights if t == "local" else None for t in titles]),
+            ("aclassify_todos_with_llm", classify_with_llm),
+        ]:
+            patcher = mock.patch.object(classification_services, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_stores_which_tier_labelled_each_todo(self):
+        self.assertEqual(classify_and_store([self.local.id, self.llm.id, self.failed.id]), 2)
+        sources = dict(Todo.objects.values_list("title", "category_source"))
+        self.assertEqual(sources, {"local": Todo.SOURCE_LOCAL, "llm": Todo.SOURCE_LLM, "failed": None})
+
+    def test_training_data_excludes_local_predictions(self):
+        classify_and_store([self.local.id, self.llm.id])
+        titles, weights = load_persisted_todos(limit=10)
+        self.assertEqual(titles, ["llm"])
+        self.assertEqual(weights.argmax(axis=1).tolist(), [1])
@@ -1,13 +1,15 @@
 from django.urls import path
 from .views import (
-    TodoCreateView, TodoListView,
+    TodoCollectionView,
+    TodoBulkCreateView, TodoBulkCompleteView,
     TodoStartTimerView, TodoCompleteView,
     TodoSuggestionsView,
 )
 
 urlpatterns = [
-    path('todos', TodoCreateView.as_view(), name='todo-create'),
-    path('todos', TodoListView.as_view(), name='todo-list'),
+    path('todos', TodoCollectionView.as_view(), name='todo-list'),
+    path('todos/bulk', TodoBulkCreateView.as_view(), name='todo-bulk-create'),
+    path('todos/bulk/complete', TodoBulkCompleteView.as_view(), name='todo-bulk-complete'),
     path('todos/<int:id>/start', TodoStartTimerView.as_view(), name='todo-start'),
     path('todos/<int:id>/complete', TodoCompleteView.as_view(), name='todo-complete'),
     path('todos/suggestions', TodoSuggestionsView.as_view(), name='todo-suggestions'),
@@ -1,19 +1,37 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
-from django.utils import timezone
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Prefetch
+from django.http import Http404
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from .models import Todo
+from core.views import AsyncAPIView
+from .models import Category, Todo, TodoCategory
+from .pagination import InvalidCursor, get_page_size, paginate_keyset
 from .serializers import (
     TodoCreateSerializer,
     TodoSerializer,
     StartTimerResponseSerializer,
     TodoCompleteResponseSerializer,
+    TodoBulkCompleteSerializer,
+    TodoBulkResultSerializer,
+    TodoBulkCompleteResultSerializer,
     TodoSuggestionSerializer,
 )
-from .services.todo_services import get_todo_recommendations
+from .services.bulk_services import bulk_create_todos
+from .services.cache_services import get_recommendation_cache
+from .services.classification_queue import enqueue_classification
+from .services.llm_provider import LLMUnavailable
+from .services.recommendation_pool import FALLBACK_TODO_LIST, asample_fallback_recommendations
+from .services.todo_services import aget_todo_recommendations
+from .services.transition_services import (
+    TodoNotFound, TransitionError, complete_todo, complete_todos, start_timer,
+)
 
 class TodoCreateView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -23,30 +41,29 @@ class TodoCreateView(APIView):
         responses={201: TodoSerializer, 400: "Bad Request"}
     )
     def post(self, request):
-        data = request.data
-        title = data.get("title")
-        categories = data.get("categories", [])
-        todo_type = data.get("type")
-        duration_seconds = data.get("duration_seconds")
-        
-        if not title or not todo_type:
-            return Response({"detail": "Title and type are required."},
-                            status=status.HTTP_400_BAD_REQUEST)
+        # Category names go straight into Category rows, so they must be validated strings
+        serializer = TodoCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
         
-        if todo_type == Todo.TIMER and duration_seconds is None:
-            return Response({"detail": "duration_seconds is required for timer type."},
-                            status=status.HTTP_400_BAD_REQUEST)
-        
-        todo = Todo.objects.create(
-            title=title,
-            categories=categories,
-            type=todo_type,
-            duration_seconds=duration_seconds
-        )
+        with transaction.atomic():
+            todo = Todo.objects.create(
+                user=request.user,
+                title=data["title"],
+                type=data["type"],
+                duration_seconds=data.get("duration_seconds")
+            )
+            category_objs = Category.objects.get_or_create_many(data["categories"])
+            TodoCategory.objects.bulk_create(
+                [TodoCategory(todo=todo, category=category) for category in category_objs]
+            )
+            enqueue_classification([todo.id])
+        get_recommendation_cache().invalidate_user(request.user.id)
         result = {
             "id": todo.id,
             "title": todo.title,
-            "categories": todo.categories,
+            "categories": [category.name for category in category_objs],
             "type": todo.type,
             "completed": todo.completed,
             "created_at": todo.created_at,
@@ -70,14 +87,26 @@ class TodoListView(APIView):
                 description="Filter by categories (can be provided multiple times)",
                 type=openapi.TYPE_ARRAY,
                 items=openapi.Items(type=openapi.TYPE_STRING)
-            )
+            ),
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="Opaque cursor from the previous page's Link header",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'page_size',
+                openapi.IN_QUERY,
+                description="Number of todos per page",
+                type=openapi.TYPE_INTEGER
+            ),
         ],
-        responses={200: TodoSerializer(many=True)}
+        responses={200: TodoSerializer(many=True), 400: "Bad Request"}
     )
     def get(self, request):
         completed_param = request.query_params.get("completed")
         categories = request.query_params.getlist("categories")
-        todos = Todo.objects.all()
+        todos = Todo.objects.filter(user=request.user)
         
         if completed_param is not None:
             if completed_param.lower() == "true":
@@ -86,19 +115,43 @@ class TodoListView(APIView):
                 todos = todos.filter(completed=False)
         
         if categories:
-            todos = todos.filter(categories__overlap=categories)
+            # Semi-join through the (category, todo) index; avoids DISTINCT over the join
+            todos = todos.filter(
+                id__in=TodoCategory.objects.filter(category__name__in=categories).values("todo_id")
+            )
+        
+        todos = todos.only("id", "title", "type", "completed", "created_at").prefetch_related(
+            Prefetch("categories", queryset=Category.objects.only("name"))
+        )
+        page_size = get_page_size(request.query_params.get("page_size"))
+        try:
+            page, next_cursor = paginate_keyset(
+                todos,
+                request.query_params.get("cursor"),
+                page_size,
+            )
+        except InvalidCursor as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         result = []
-        for todo in todos:
+        for todo in page:
             result.append({
                 "id": todo.id,
                 "title": todo.title,
-                "categories": todo.categories,
+                "categories": [category.name for category in todo.categories.all()],
                 "type": todo.type,
                 "completed": todo.completed,
                 "created_at": todo.created_at,
             })
-        return Response(result, status=status.HTTP_200_OK)
+        response = Response(result, status=status.HTTP_200_OK)
+        # The body stays a plain list; the next page is advertised in the Link header.
+        if next_cursor is not None:
+            query = request.query_params.copy()
+            query["cursor"] = next_cursor
+            query["page_size"] = page_size
+            next_url = request.build_absolute_uri(f"{request.path}?{query.urlencode()}")
+            response["Link"] = f'<{next_url}>; rel="next"'
+        return response
 
 class TodoStartTimerView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -107,19 +160,16 @@ class TodoStartTimerView(APIView):
         responses={200: StartTimerResponseSerializer, 400: "Bad Request"}
     )
     def post(self, request, id):
-        todo = get_object_or_404(Todo, id=id)
-        if todo.type != Todo.TIMER:
-            return Response({"detail": "Only timer type todos can be started."},
-                            status=status.HTTP_400_BAD_REQUEST)
-        if todo.start_time is not None:
-            return Response({"detail": "Timer already started."},
-                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            start_time = start_timer(request.user, id)
+        except TodoNotFound:
+            raise Http404
+        except TransitionError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         
-        todo.start_time = timezone.now()
-        todo.save()
         result = {
             "message": "Timer started",
-            "start_time": todo.start_time,
+            "start_time": start_time,
         }
         return Response(result, status=status.HTTP_200_OK)
 
@@ -130,46 +180,150 @@ class TodoCompleteView(APIView):
         responses={200: TodoCompleteResponseSerializer, 400: "Bad Request"}
     )
     def post(self, request, id):
-        todo = get_object_or_404(Todo, id=id)
-        if todo.completed:
-            return Response({"detail": "Todo already completed."},
-                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            completed = complete_todo(request.user, id)
+        except TodoNotFound:
+            raise Http404
+        except TransitionError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
         
-        todo.completed = True
-        todo.completed_at = timezone.now()
-        todo.gained_exp = 10  # Adjust your experience calculation logic as needed.
-        todo.save()
+        get_recommendation_cache().invalidate_user(request.user.id)
         result = {
             "message": "Todo completed",
-            "gained_exp": todo.gained_exp,
-            "completed_at": todo.completed_at,
+            "gained_exp": completed.gained_exp,
+            "completed_at": completed.completed_at,
         }
         return Response(result, status=status.HTTP_200_OK)
 
-class TodoSuggestionsView(APIView):
+class TodoCollectionView(TodoCreateView, TodoListView):
+    """GET and POST /todos share one route, so dispatch to the list/create views by method."""
+
+class TodoBulkCreateView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     @swagger_auto_schema(
-        responses={200: TodoSuggestionSerializer(many=True)}
+        request_body=TodoCreateSerializer(many=True),
+        responses={200: TodoBulkResultSerializer(many=True), 400: "Bad Request"}
     )
-    def get(self, request):
-        user_todos = Todo.objects.filter(user=request.user).order_by('-created_at')[:10]
-        if user_todos.exists():
-            todo_list_str = "\n".join([f"- {todo.title}" for todo in user_todos])
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"detail": "Expected a non-empty list of todos."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.TODO_BULK_MAX_ITEMS:
+            return Response({"detail": f"At most {settings.TODO_BULK_MAX_ITEMS} todos per request."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        serializer = TodoCreateSerializer(data=items, many=True)
+        if serializer.is_valid():
+            item_errors = [{}] * len(items)
+            valid = list(serializer.validated_data)
         else:
-            # Fallback default TODO list
-            todo_list_str = (
-                "- 아침 루틴 정립하기 (기상 시간, 스트레칭, 물 마시기 등)\n"
-                "- 주간 회의 안건 정리 및 공유\n"
-                "- 'Effective Python' 1~3장 읽고 요약 정리하기\n"
-                "- 냉장고 정리 및 유통기한 지난 식재료 폐기\n"
-                "- 30분간 걷기 운동 후 심박수 기록하기\n"
-                "- 후쿠오카 여행 일정 Google Calendar에 정리하기\n"
-                "- 3월 생활비 지출 내역 가계부에 입력하기\n"
-                "- Django 서버에 OAuth 로그인 기능 통합 테스트\n"
-                "- ChatGPT를 활용한 단편 시나리오 1편 초안 작성\n"
-                "- 책상 위 케이블 정리하고 선정리함 설치"
-            )
+            # ListSerializer drops all validated data when any item fails; re-run the
+            # (query-free) child validation for the items that passed.
+            item_errors = serializer.errors
+            valid = [
+                serializer.child.run_validation(item)
+                for item, errors in zip(items, item_errors) if not errors
+            ]
+        created = iter(bulk_create_todos(request.user, valid))
+        if valid:
+            get_recommendation_cache().invalidate_user(request.user.id)
+        
+        result = []
+        for index, errors in enumerate(item_errors):
+            if errors:
+                result.append({"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": errors})
+                continue
+            todo, category_names = next(created)
+            result.append({
+                "index": index,
+                "status": status.HTTP_201_CREATED,
+                "todo": {
+                    "id": todo.id,
+                    "title": todo.title,
+                    "categories": category_names,
+                    "type": todo.type,
+                    "completed": todo.completed,
+                    "created_at": todo.created_at,
+                },
+            })
+        return Response(result, status=status.HTTP_200_OK)
+
+class TodoBulkCompleteView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=TodoBulkCompleteSerializer,
+        responses={200: TodoBulkCompleteResultSerializer(many=True), 400: "Bad Request"}
+    )
+    def post(self, request):
+        serializer = TodoBulkCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        if len(ids) > settings.TODO_BULK_MAX_ITEMS:
+            return Response({"detail": f"At most {settings.TODO_BULK_MAX_ITEMS} todos per request."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        
+        outcomes = complete_todos(request.user, ids)
+        if any("error" not in outcome for outcome in outcomes.values()):
+            get_recommendation_cache().invalidate_user(request.user.id)
+        
+        result = []
+        for todo_id, outcome in outcomes.items():
+            if outcome.get("error") == "not_found":
+                result.append({"id": todo_id, "status": status.HTTP_404_NOT_FOUND,
+                               "detail": "Todo not found."})
+            elif outcome.get("error") == "already_completed":
+                result.append({"id": todo_id, "status": status.HTTP_400_BAD_REQUEST,
+                               "detail": "Todo already completed."})
+            else:
+                result.append({
+                    "id": todo_id,
+                    "status": status.HTTP_200_OK,
+                    "gained_exp": outcome["gained_exp"],
+                    "completed_at": outcome["completed_at"],
+                })
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class TodoSuggestionsView(AsyncAPIView):
+    """
+    Async view: served through todosaga/asgi.py, the worker's event loop keeps
+    handling other requests while the LLM call is in flight.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        responses={200: TodoSuggestionSerializer(many=True), 503: "LLM unavailable", 504: "LLM timed out"}
+    )
+    async def get(self, request):
+        user = request.user
+        titles = [
+            title async for title in Todo.objects.filter(user=user)
+            .order_by('-created_at', '-id')
+            .values_list('title', flat=True)[:10]
+        ]
+        if titles:
+            todo_list_str = "\n".join([f"- {title}" for title in titles])
+            cache_owner = user.id
+        else:
+            # Users without todos all get the same prompt: serve a pre-generated answer when the pool has one
+            recommendations = await asample_fallback_recommendations()
+            if recommendations is not None:
+                return Response(recommendations, status=status.HTTP_200_OK)
+            # The fallback result is shared by every new user; never tie it to one user
+            todo_list_str = FALLBACK_TODO_LIST
+            cache_owner = None
+        # Give the pooled DB connection back before waiting on the LLM (CONN_MAX_AGE = 0 when pooling)
+        await sync_to_async(close_old_connections)()
         # Call the recommendation service to generate suggestions based on the TODO list.
-        recommendations = get_todo_recommendations(todo_list_str)
+        try:
+            recommendations = await aget_todo_recommendations(todo_list_str, user_id=cache_owner)
+        except asyncio.TimeoutError:
+            return Response({"detail": "Suggestion service timed out."},
+                            status=status.HTTP_504_GATEWAY_TIMEOUT)
+        except LLMUnavailable:
+            return Response({"detail": "Suggestion service is temporarily unavailable."},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
         return Response(recommendations, status=status.HTTP_200_OK)
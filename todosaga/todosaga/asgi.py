@@ -11,6 +11,13 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todosaga.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todosaga.settings.production')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.TODO_TIMER_SCHEDULER_IN_PROCESS:
+    from todos.services.timer_scheduler import start_scheduler  # noqa: E402
+
+    start_scheduler()
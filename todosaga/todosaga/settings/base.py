@@ -18,16 +18,27 @@ INSTALLED_APPS = [
     'rest_framework',
     'drf_yasg',
     'corsheaders',
+    'core',
     'todos',
+    'stats',
+    'archievements',
+    'quests',
+    'titles',
+    'monsters',
+    'items',
+    'notifications',
+    'focus',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'notifications.middleware.NotificationBufferMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -81,6 +92,17 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache. The default is per process; for DjangoRecommendationCache and
+# CacheLockSingleFlight to work across workers use a shared backend, e.g.
+# django.core.cache.backends.redis.RedisCache or
+# django.core.cache.backends.db.DatabaseCache (LOCATION = table, after createcachetable).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
@@ -90,4 +112,142 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
-} 
\ No newline at end of file
+} 
+# Todo list pagination (keyset over created_at, id)
+TODO_LIST_PAGE_SIZE = int(os.getenv('TODO_LIST_PAGE_SIZE', 50))
+TODO_LIST_MAX_PAGE_SIZE = int(os.getenv('TODO_LIST_MAX_PAGE_SIZE', 200))
+
+# LLM (OpenAI-compatible) settings; point OPENAI_BASE_URL at a local fake server in tests
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
+TODO_LLM_TIMEOUT = float(os.getenv('TODO_LLM_TIMEOUT', 20))
+TODO_LLM_MAX_RETRIES = int(os.getenv('TODO_LLM_MAX_RETRIES', 1))
+TODO_LLM_MAX_CONCURRENCY = int(os.getenv('TODO_LLM_MAX_CONCURRENCY', 8))
+
+# Chat model provider, built on first use. todos.services.llm_provider.FakeLLMProvider
+# answers in process with canned responses (no API key or network), for development.
+TODO_LLM_PROVIDER = {
+    'BACKEND': os.getenv('TODO_LLM_PROVIDER', 'todos.services.llm_provider.OpenAIProvider'),
+    'MODEL': os.getenv('TODO_LLM_MODEL', 'gpt-3.5-turbo'),
+    'TEMPERATURE': float(os.getenv('TODO_LLM_TEMPERATURE', 0.7)),
+    # Pooled HTTP connections per process (OpenAIProvider)
+    'MAX_CONNECTIONS': int(os.getenv('TODO_LLM_MAX_CONNECTIONS', 20)),
+    # Retries (TODO_LLM_MAX_RETRIES) wait a random 0..min(8, RETRY_BACKOFF * 2**attempt) seconds
+    'RETRY_BACKOFF': float(os.getenv('TODO_LLM_RETRY_BACKOFF', 0.5)),
+    # After FAILURE_THRESHOLD failures in a row, calls fail fast for RESET_TIMEOUT seconds
+    'FAILURE_THRESHOLD': int(os.getenv('TODO_LLM_FAILURE_THRESHOLD', 10)),
+    'RESET_TIMEOUT': float(os.getenv('TODO_LLM_RESET_TIMEOUT', 30)),
+}
+
+# Recommendation result cache. Use todos.services.cache_services.DjangoRecommendationCache
+# to share entries across workers through a Django cache alias (e.g. Redis).
+TODO_RECOMMENDATION_CACHE = {
+    'BACKEND': os.getenv(
+        'TODO_RECOMMENDATION_CACHE_BACKEND',
+        'todos.services.cache_services.LocMemRecommendationCache',
+    ),
+    'TIMEOUT': int(os.getenv('TODO_RECOMMENDATION_CACHE_TIMEOUT', 3600)),
+    'MAX_ENTRIES': int(os.getenv('TODO_RECOMMENDATION_CACHE_MAX_ENTRIES', 10000)),
+}
+
+# Pre-generated recommendations for users without todos (refresh_recommendation_pool);
+# each worker re-reads the pool from the database every RELOAD seconds
+TODO_RECOMMENDATION_POOL_SIZE = int(os.getenv('TODO_RECOMMENDATION_POOL_SIZE', 50))
+TODO_RECOMMENDATION_POOL_RELOAD = int(os.getenv('TODO_RECOMMENDATION_POOL_RELOAD', 300))
+
+# Coalesce concurrent identical recommendation prompts into one LLM call
+# (todos.services.single_flight). CacheLockSingleFlight also coalesces across
+# processes through a lock in the Django cache CACHE_ALIAS; pair it with
+# DjangoRecommendationCache on the same shared cache. SingleFlight turns it off.
+TODO_SINGLE_FLIGHT = {
+    'BACKEND': os.getenv('TODO_SINGLE_FLIGHT_BACKEND', 'todos.services.single_flight.LocalSingleFlight'),
+    'CACHE_ALIAS': 'default',
+    'LOCK_TIMEOUT': int(os.getenv('TODO_SINGLE_FLIGHT_LOCK_TIMEOUT', 30)),
+}
+
+# Batched category classification
+TODO_CLASSIFICATION_TOKEN_BUDGET = int(os.getenv('TODO_CLASSIFICATION_TOKEN_BUDGET', 3000))
+TODO_CLASSIFICATION_MAX_ITEMS = int(os.getenv('TODO_CLASSIFICATION_MAX_ITEMS', 20))
+TODO_CLASSIFICATION_MAX_CONCURRENCY = int(os.getenv('TODO_CLASSIFICATION_MAX_CONCURRENCY', 4))
+
+# Local first-tier category classifier (train with `manage.py train_category_classifier`)
+TODO_LOCAL_CLASSIFIER_PATH = os.getenv(
+    'TODO_LOCAL_CLASSIFIER_PATH', os.path.join(BASE_DIR, 'var', 'category_classifier.npz')
+)
+TODO_LOCAL_CLASSIFIER_THRESHOLD = float(os.getenv('TODO_LOCAL_CLASSIFIER_THRESHOLD', 0.6))
+
+# Background classification of new todos (runs after the create transaction commits)
+TODO_CLASSIFICATION_QUEUE_ENABLED = os.getenv('TODO_CLASSIFICATION_QUEUE_ENABLED', 'true').lower() == 'true'
+TODO_CLASSIFICATION_QUEUE_BATCH_SIZE = int(os.getenv('TODO_CLASSIFICATION_QUEUE_BATCH_SIZE', 50))
+TODO_CLASSIFICATION_QUEUE_LINGER = float(os.getenv('TODO_CLASSIFICATION_QUEUE_LINGER', 0.5))
+
+# Maximum number of items accepted by the bulk create / complete endpoints
+TODO_BULK_MAX_ITEMS = int(os.getenv('TODO_BULK_MAX_ITEMS', 500))
+
+# Timer expiry scheduler (todos/services/timer_scheduler.py). With IN_PROCESS the
+# ASGI/WSGI entry points start it in every server process; otherwise run
+# `manage.py run_timer_scheduler` as its own process.
+TODO_TIMER_SCHEDULER_IN_PROCESS = os.getenv('TODO_TIMER_SCHEDULER_IN_PROCESS', 'true').lower() == 'true'
+TODO_TIMER_POLL_INTERVAL = float(os.getenv('TODO_TIMER_POLL_INTERVAL', 1))  # upper bound on firing lag
+TODO_TIMER_POLL_OVERLAP = 10  # seconds re-read behind the newest start_time seen
+TODO_TIMER_BATCH_SIZE = 500
+TODO_TIMER_RETRY_DELAY = 5
+
+# Total EXP at which each category tier starts (tier1 starts at 0)
+STATS_TIER_THRESHOLDS = [0, 100, 300, 700, 1500, 3000]
+
+# EXP awarded per completed todo, split across its categories by weight
+STATS_COMPLETION_EXP = int(os.getenv('STATS_COMPLETION_EXP', 10))
+
+# How category EXP feeds abilities; each row is normalized to sum to 1
+STATS_ABILITY_MATRIX = {
+    '개인 생산성': {'WIS': 0.5, 'CON': 0.5},
+    '업무 및 프로젝트': {'INT': 0.4, 'CON': 0.3, 'CHA': 0.3},
+    '학습 및 자기개발': {'INT': 0.7, 'WIS': 0.3},
+    '가사 및 생활관리': {'CON': 0.5, 'DEX': 0.5},
+    '건강 및 웰빙': {'STR': 0.6, 'CON': 0.4},
+    '여행 준비': {'DEX': 0.5, 'CHA': 0.5},
+    '재무 및 소비관리': {'WIS': 0.7, 'INT': 0.3},
+    '개발 작업': {'INT': 0.6, 'DEX': 0.4},
+    '창작활동': {'CHA': 0.6, 'WIS': 0.4},
+    '기타': {'STR': 1, 'DEX': 1, 'CON': 1, 'INT': 1, 'WIS': 1, 'CHA': 1},
+}
+STATS_EXP_PER_ABILITY_POINT = 10
+
+# Default and maximum date range (days) for the activity heatmap endpoint
+STATS_ACTIVITY_DEFAULT_DAYS = 365
+STATS_ACTIVITY_MAX_DAYS = 731
+
+# Domain event bus: batches are handed to subscribers on a background worker
+CORE_EVENT_BUS_ASYNC = os.getenv('CORE_EVENT_BUS_ASYNC', 'true').lower() == 'true'
+CORE_EVENT_BATCH_SIZE = int(os.getenv('CORE_EVENT_BATCH_SIZE', 1000))
+CORE_EVENT_BATCH_LINGER = float(os.getenv('CORE_EVENT_BATCH_LINGER', 0.05))
+
+# Number of monsters offered per day, and the largest damage a single attack may deal
+MONSTERS_DAILY_CHOICES = 3
+MONSTERS_MAX_ATTACK_DAMAGE = int(os.getenv('MONSTERS_MAX_ATTACK_DAMAGE', 1000))
+
+# Seconds between checks of the stored catalog version by each process
+ITEMS_CATALOG_VERSION_CHECK_INTERVAL = float(os.getenv('ITEMS_CATALOG_VERSION_CHECK_INTERVAL', 5))
+ITEMS_MAX_UPGRADE_LEVEL = 10
+
+NOTIFICATIONS_PAGE_SIZE = 50
+NOTIFICATIONS_MARK_READ_MAX_IDS = 500
+
+# Focus sessions. Sessions are capped at FOCUS_MAX_SESSION_SECONDS, which also
+# bounds how far back the interval range query has to look.
+FOCUS_MAX_SESSION_SECONDS = int(os.getenv('FOCUS_MAX_SESSION_SECONDS', 12 * 3600))
+FOCUS_DEFAULT_DAYS = 31
+FOCUS_MAX_DAYS = 366
+
+# Push channel (GET /push/stream, server-sent events). LocalPubSub only reaches
+# clients connected to the same process; use core.pubsub.PostgresPubSub when
+# running several workers or the timer scheduler as its own process.
+CORE_PUBSUB = {
+    'BACKEND': os.getenv('CORE_PUBSUB_BACKEND', 'core.pubsub.LocalPubSub'),
+    'MAX_QUEUE': 100,  # per connection; the oldest messages are dropped beyond this
+}
+CORE_PUSH_HEARTBEAT = float(os.getenv('CORE_PUSH_HEARTBEAT', 20))
+CORE_PUSH_RETRY_MS = 5000
+
+# Request instrumentation (core.middleware.InstrumentationMiddleware, GET /metrics)
+CORE_SLOW_REQUEST_MS = float(os.getenv('CORE_SLOW_REQUEST_MS', 500))
@@ -10,6 +10,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Writers take the lock at BEGIN and wait for each other (busy timeout) instead of
+        # failing, which the concurrency tests rely on; the shared-cache in-memory test
+        # database raises "table is locked" instead, so tests use a file too.
+        'OPTIONS': {'transaction_mode': 'IMMEDIATE', 'timeout': 20},
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
@@ -7,6 +7,13 @@ DEBUG = False
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(',')
 
 # Database
+# Under ASGI every request runs its sync code in a thread of its own, so a
+# persistent (CONN_MAX_AGE) connection would be tied to a thread that exits with
+# the request. Connections come from a per-process psycopg pool instead;
+# gunicorn.conf.py sizes it from the worker count. Set DB_POOL=false for
+# persistent connections under WSGI (which does not serve /push/stream).
+DB_POOL = os.getenv('DB_POOL', 'true').lower() == 'true'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -15,11 +22,24 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST', 'db'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Pooling requires CONN_MAX_AGE = 0 (connections go back to the pool at request end)
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.getenv('DB_CONN_MAX_AGE', 60)),
+        # Checks a reused connection before handing it out (the pool's check callback when pooling)
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+                'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+                # Seconds a request waits for a free connection before failing
+                'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+            },
+        } if DB_POOL else {},
     }
 }
 
 # Security settings
-SECURE_SSL_REDIRECT = True
+# Disable only where TLS is terminated elsewhere and plain HTTP is expected (e.g. the load-test stack)
+SECURE_SSL_REDIRECT = os.getenv('SECURE_SSL_REDIRECT', 'true').lower() == 'true'
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 SECURE_BROWSER_XSS_FILTER = True
@@ -21,6 +21,7 @@ from rest_framework import permissions
 from django.conf import settings
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from core.views import MetricsView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -39,6 +40,16 @@ urlpatterns = [
     path('accounts/login/', LoginView.as_view(template_name='admin/login.html'), name='login'),
     path('accounts/', include('django.contrib.auth.urls')),
     path('todos/', include('todos.urls')),
+    path('stats/', include('stats.urls')),
+    path('achievements/', include('archievements.urls')),
+    path('quests/', include('quests.urls')),
+    path('titles/', include('titles.urls')),
+    path('monsters/', include('monsters.urls')),
+    path('items/', include('items.urls')),
+    path('notifications/', include('notifications.urls')),
+    path('focus/', include('focus.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
+    path('push/', include('core.urls')),
 ]
 
 if settings.DEBUG: